@@ -0,0 +1,45 @@
+"""
+Authentication backend that serves the logged-in user from the cache.
+
+``AuthenticationMiddleware`` loads ``request.user`` on nearly every request,
+which with ``ModelBackend`` is a query per page. ``CachedModelBackend`` keeps
+each user in the cache instead. ``accounts.signals`` drops the entry whenever
+the user is saved or deleted (a profile edit, a password change, a role
+change in the admin, the ``last_login`` update on login), so the cached copy
+is never older than the last committed change. The session's auth hash is
+still checked against it, so changing the password still logs out the
+user's other sessions.
+"""
+from django.contrib.auth.backends import ModelBackend
+from django.core.cache import cache
+from django.db import transaction
+
+from hr_hiring.routers import use_primary
+
+USER_CACHE_TIMEOUT = 15 * 60
+
+
+def user_cache_key(user_id):
+    return f'accounts:user:{user_id}'
+
+
+def forget_user(user_id):
+    """Drop the cached user now and, in case a request re-cached the old row meanwhile, again on commit."""
+    key = user_cache_key(user_id)
+    cache.delete(key)
+    transaction.on_commit(lambda: cache.delete(key))
+
+
+class CachedModelBackend(ModelBackend):
+    """``ModelBackend`` whose ``get_user`` reads through the cache."""
+
+    def get_user(self, user_id):
+        key = user_cache_key(user_id)
+        user = cache.get(key)
+        if user is None:
+            # A replica could still hold the row from before the change that emptied the entry.
+            with use_primary():
+                user = super().get_user(user_id)
+            if user is not None:
+                cache.set(key, user, USER_CACHE_TIMEOUT)
+        return user if user is not None and self.user_can_authenticate(user) else None
@@ -0,0 +1,19 @@
+# Generated by Django 4.2.9 on 2026-10-17 23:33
+
+import blobs.storage
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0002_candidateprofile_canonical_skills'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='candidateprofile',
+            name='resume',
+            field=models.FileField(blank=True, null=True, storage=blobs.storage.blob_storage, upload_to='resumes/'),
+        ),
+    ]
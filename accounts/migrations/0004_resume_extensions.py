@@ -0,0 +1,20 @@
+# Generated by Django 4.2.9 on 2026-10-18 00:45
+
+import blobs.storage
+import django.core.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0003_alter_candidateprofile_resume'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='candidateprofile',
+            name='resume',
+            field=models.FileField(blank=True, null=True, storage=blobs.storage.blob_storage, upload_to='resumes/', validators=[django.core.validators.FileExtensionValidator(['pdf', 'doc', 'docx'])]),
+        ),
+    ]
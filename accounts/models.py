@@ -1,5 +1,12 @@
 from django.contrib.auth.models import AbstractUser
+from django.core.validators import FileExtensionValidator
 from django.db import models
+from django.utils.functional import cached_property
+from blobs.storage import blob_storage
+
+# Resumes are downloaded by HR, so only document formats are accepted, and
+# only those search.resumes can extract text from for the resume search.
+RESUME_EXTENSIONS = ['pdf', 'docx', 'txt']
 
 
 class User(AbstractUser):
@@ -42,20 +49,26 @@ class CandidateProfile(models.Model):
     headline = models.CharField(max_length=200, blank=True)
     bio = models.TextField(blank=True)
     skills = models.TextField(blank=True, help_text='Comma-separated skills')
+    canonical_skills = models.ManyToManyField('skills.Skill', blank=True, related_name='profiles')
     experience_years = models.PositiveIntegerField(default=0)
     education = models.TextField(blank=True)
     location = models.CharField(max_length=100, blank=True)
     linkedin_url = models.URLField(blank=True)
     github_url = models.URLField(blank=True)
     portfolio_url = models.URLField(blank=True)
-    resume = models.FileField(upload_to='resumes/', blank=True, null=True)
+    resume = models.FileField(upload_to='resumes/', storage=blob_storage, blank=True, null=True,
+                              validators=[FileExtensionValidator(RESUME_EXTENSIONS)])
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
     def __str__(self):
         return f"Profile: {self.user.get_full_name() or self.user.username}"
 
-    @property
+    def save(self, *args, **kwargs):
+        self.__dict__.pop('skills_list', None)
+        super().save(*args, **kwargs)
+
+    @cached_property
     def skills_list(self):
         if self.skills:
             return [s.strip() for s in self.skills.split(',') if s.strip()]
@@ -0,0 +1,22 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from blobs.thumbnails import THUMBNAIL_SIZES, thumbnail_url
+from .backends import forget_user
+from .models import User
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_cached_user(sender, instance, **kwargs):
+    forget_user(instance.pk)
+
+
+@receiver(post_save, sender=User)
+def generate_avatar_thumbnails(sender, instance, update_fields=None, **kwargs):
+    """Create thumbnails at upload time; already generated ones are a cache hit."""
+    if update_fields is not None and 'avatar' not in update_fields:
+        return
+    if instance.avatar:
+        for size in THUMBNAIL_SIZES:
+            thumbnail_url(instance.avatar, size)
@@ -0,0 +1,22 @@
+from django import template
+from django.utils.html import format_html
+
+from blobs.thumbnails import THUMBNAIL_SIZES, thumbnail_url
+
+register = template.Library()
+
+
+@register.simple_tag
+def avatar(user, size='small', fallback=''):
+    """
+    ``<img>`` of the user's avatar thumbnail at ``size`` ('small' or 'medium'),
+    or ``fallback`` (e.g. initials) when there is no usable avatar.
+    """
+    url = thumbnail_url(getattr(user, 'avatar', None), size)
+    if not url:
+        return fallback
+    edge = THUMBNAIL_SIZES[size] // 2
+    return format_html(
+        '<img src="{}" width="{}" height="{}" alt="{}" class="avatar-img" loading="lazy">',
+        url, edge, edge, user.display_name,
+    )
@@ -11,4 +11,5 @@ urlpatterns = [
     path('profile/', views.profile_view, name='profile'),
     path('profile/edit/', views.profile_edit_view, name='profile_edit'),
     path('profile/change-password/', views.change_password_view, name='change_password'),
+    path('resume/<int:pk>/', views.resume_download_view, name='resume'),
 ]
@@ -1,13 +1,17 @@
-from django.shortcuts import render, redirect
+from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth import login, logout, authenticate
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
+from django.db import transaction
 from django.contrib.auth.forms import PasswordChangeForm
 from django.contrib.auth import update_session_auth_hash
 from .forms import UserRegistrationForm, UserLoginForm, UserUpdateForm, CandidateProfileForm
+from blobs.downloads import protected_file_response, resume_download_name
+from hr_hiring.querybudget import query_budget
 from .models import CandidateProfile
 
 
+@query_budget(15)
 def register_view(request):
     if request.user.is_authenticated:
         return redirect('dashboard:index')
@@ -15,9 +19,10 @@ def register_view(request):
     if request.method == 'POST':
         form = UserRegistrationForm(request.POST)
         if form.is_valid():
-            user = form.save()
-            if user.role == 'candidate':
-                CandidateProfile.objects.create(user=user)
+            with transaction.atomic():
+                user = form.save()
+                if user.role == 'candidate':
+                    CandidateProfile.objects.create(user=user)
             login(request, user)
             messages.success(request, f'Welcome, {user.first_name}! Your account has been created.')
             return redirect('dashboard:index')
@@ -27,6 +32,7 @@ def register_view(request):
     return render(request, 'accounts/register.html', {'form': form})
 
 
+@query_budget(8)
 def login_view(request):
     if request.user.is_authenticated:
         return redirect('dashboard:index')
@@ -45,12 +51,14 @@ def login_view(request):
     return render(request, 'accounts/login.html', {'form': form})
 
 
+@query_budget(5)
 def logout_view(request):
     logout(request)
     messages.info(request, 'You have been logged out.')
     return redirect('accounts:login')
 
 
+@query_budget(4)
 @login_required
 def profile_view(request):
     context = {'user': request.user}
@@ -60,6 +68,7 @@ def profile_view(request):
     return render(request, 'accounts/profile.html', context)
 
 
+@query_budget(18)
 @login_required
 def profile_edit_view(request):
     user_form = UserUpdateForm(instance=request.user)
@@ -90,6 +99,7 @@ def profile_edit_view(request):
     })
 
 
+@query_budget(12)
 @login_required
 def change_password_view(request):
     if request.method == 'POST':
@@ -103,3 +113,16 @@ def change_password_view(request):
         form = PasswordChangeForm(request.user)
 
     return render(request, 'accounts/change_password.html', {'form': form})
+
+
+@query_budget(4)
+@login_required
+def resume_download_view(request, pk):
+    """Download a candidate's profile resume (HR, or the candidate themselves)."""
+    if not request.user.is_hr and request.user.pk != pk:
+        messages.error(request, 'You do not have access to this resume.')
+        return redirect('dashboard:index')
+    profile = get_object_or_404(CandidateProfile.objects.select_related('user'), user_id=pk)
+    return protected_file_response(
+        request, profile.resume, resume_download_name(profile.user, profile.resume)
+    )
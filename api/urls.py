@@ -0,0 +1,9 @@
+from django.urls import path
+from . import views
+
+app_name = 'api'
+
+urlpatterns = [
+    path('jobs/', views.job_list, name='jobs'),
+    path('jobs/<int:pk>/', views.job_detail, name='job'),
+]
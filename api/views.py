@@ -0,0 +1,193 @@
+"""
+Read-only JSON API for active jobs (``/api/v1/``).
+
+Every response carries a strong ``ETag`` and a ``Last-Modified``. The list's
+validators come from the active-set watermark: the latest ``Job.updated_at``
+plus the number of active jobs, so a job closing or being deleted changes
+them too. A job's validators come from its own ``updated_at``. Both are
+cached under the jobs generation that every job save or delete bumps, so a
+client revalidating with ``If-None-Match`` / ``If-Modified-Since`` gets its
+304 without a single query, before anything is loaded or serialized.
+
+``fields=id,title,...`` limits the payload (and the columns loaded) to the
+named fields; ``page_size`` is capped at ``MAX_PAGE_SIZE``.
+"""
+import hashlib
+import json
+from datetime import datetime, timezone
+
+from django.core.cache import cache
+from django.db.models import Count, Max, Q
+from django.http import JsonResponse
+from django.urls import reverse
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date
+from django.views.decorators.http import require_safe
+
+from dashboard.cache import DASHBOARD_CACHE_TIMEOUT, JOBS_GENERATION_KEY, get_generations
+from hr_hiring.pagination import PAGE_SIZE, KeysetPaginator
+from hr_hiring.querybudget import query_budget
+from hr_hiring.routers import use_primary
+from jobs.facets import active_cards, filter_q, job_filters
+from jobs.models import Job
+
+API_VERSION = 'v1'
+
+MAX_PAGE_SIZE = 100
+
+# Last-Modified while there are no jobs at all.
+EPOCH = datetime.fromtimestamp(0, tz=timezone.utc)
+
+# Fields each endpoint can return, in output order. Columns they are read
+# from default to the field's own name.
+LIST_FIELDS = [
+    'id', 'url', 'title', 'department', 'location', 'job_type', 'experience_level', 'deadline',
+    'excerpt', 'skills', 'salary_min', 'salary_max', 'salary_display', 'created_at',
+]
+DETAIL_FIELDS = [
+    'id', 'url', 'title', 'department', 'location', 'job_type', 'experience_level', 'deadline',
+    'description', 'requirements', 'responsibilities', 'skills', 'salary_min', 'salary_max',
+    'salary_display', 'created_at', 'updated_at',
+]
+CARD_COLUMNS = {'id': ['job_id'], 'url': ['job_id']}
+JOB_COLUMNS = {'url': ['id'], 'skills': ['skills_required'], 'salary_display': ['salary_min', 'salary_max']}
+
+
+def job_url(job_id):
+    return reverse('api:job', args=[job_id])
+
+
+def card_value(card, field):
+    if field in ('id', 'url'):
+        return card.job_id if field == 'id' else job_url(card.job_id)
+    return getattr(card, field)
+
+
+def job_value(job, field):
+    if field == 'url':
+        return job_url(job.pk)
+    if field == 'skills':
+        return job.skills_list
+    return getattr(job, field)
+
+
+def error(message, status=400):
+    return JsonResponse({'error': message}, status=status)
+
+
+def selected_fields(request, available):
+    """The fields named by the ``fields`` parameter (all by default), or the unknown names as an error."""
+    names = [name.strip() for name in request.GET.get('fields', '').split(',') if name.strip()]
+    unknown = [name for name in names if name not in available]
+    if unknown:
+        return None, error(f"Unknown fields: {', '.join(unknown)}. Available: {', '.join(available)}.")
+    return [field for field in available if field in names] or list(available), None
+
+
+def columns_for(fields, columns, always=()):
+    return sorted({*always, *(column for field in fields for column in columns.get(field, [field]))})
+
+
+def make_etag(*parts):
+    raw = json.dumps([API_VERSION, *parts], sort_keys=True, default=str)
+    return f'"{hashlib.sha1(raw.encode()).hexdigest()}"'
+
+
+def cached_validator(name, compute):
+    """``compute()``, cached until the next job change. Read from the primary, like the bodies below."""
+    generation, = get_generations(JOBS_GENERATION_KEY)
+    key = f'api:{API_VERSION}:{name}:{generation}'
+    value = cache.get(key)
+    if value is None:
+        with use_primary():
+            value = compute()
+        cache.set(key, value, DASHBOARD_CACHE_TIMEOUT)
+    return value
+
+
+def active_watermark():
+    """``(latest updated_at of any job, number of active jobs)``."""
+    def compute():
+        watermark = Job.objects.aggregate(modified=Max('updated_at'), active=Count('pk', filter=Q(status='active')))
+        return watermark['modified'] or EPOCH, watermark['active']
+    return cached_validator('watermark', compute)
+
+
+def job_modified(pk):
+    """The active job's ``updated_at``, or ``''`` if there is no such active job."""
+    return cached_validator(f'job:{pk}', lambda: next(iter(
+        Job.objects.filter(pk=pk, status='active').values_list('updated_at', flat=True)
+    ), ''))
+
+
+def conditional(request, etag, last_modified, build):
+    """A 304 if the client's copy is current; otherwise ``build()``. Both carry the validators."""
+    # HTTP dates have whole seconds.
+    last_modified = int(last_modified.timestamp())
+    response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if response is None:
+        # Clients keep the body under these validators, so it must be at least
+        # as new as they are: read it from the primary too.
+        with use_primary():
+            response = build()
+    if response.status_code in (200, 304):
+        response.headers['ETag'] = etag
+        response.headers['Last-Modified'] = http_date(last_modified)
+        patch_cache_control(response, public=True, no_cache=True)
+    return response
+
+
+@query_budget(4)
+@require_safe
+def job_list(request):
+    """Active jobs, newest first. Takes the job board's filters (q, type, experience, location, salary)."""
+    fields, invalid = selected_fields(request, LIST_FIELDS)
+    if invalid:
+        return invalid
+    try:
+        page_size = min(max(int(request.GET.get('page_size', PAGE_SIZE)), 1), MAX_PAGE_SIZE)
+    except ValueError:
+        return error('page_size must be a whole number.')
+
+    modified, active = active_watermark()
+    etag = make_etag('jobs', modified, active, sorted(request.GET.lists()))
+
+    def build():
+        filters = job_filters(request.GET)
+        cards = active_cards(filters['q']).filter(filter_q(filters))
+        cards = cards.only(*columns_for(fields, CARD_COLUMNS, always=('job_id', 'created_at')))
+        page = KeysetPaginator(cards, 'created_at', page_size, pk_field='pk').get_page(request.GET.get('cursor', ''))
+
+        params = request.GET.copy()
+        links = {}
+        for link, cursor in (('next', page.next_cursor), ('previous', page.prev_cursor)):
+            params['cursor'] = cursor
+            links[link] = f'{request.path}?{params.urlencode()}' if cursor else None
+        return JsonResponse({
+            'results': [{field: card_value(card, field) for field in fields} for card in page],
+            **links,
+        })
+
+    return conditional(request, etag, modified, build)
+
+
+@query_budget(3)
+@require_safe
+def job_detail(request, pk):
+    """One active job, with its full description."""
+    fields, invalid = selected_fields(request, DETAIL_FIELDS)
+    if invalid:
+        return invalid
+    modified = job_modified(pk)
+    if not modified:
+        return error('No active job with this id.', status=404)
+    etag = make_etag('job', pk, modified, fields)
+
+    def build():
+        columns = columns_for(fields, JOB_COLUMNS, always=('id',))
+        job = Job.objects.only(*columns).filter(pk=pk, status='active').first()
+        if job is None:
+            return error('No active job with this id.', status=404)
+        return JsonResponse({field: job_value(job, field) for field in fields})
+
+    return conditional(request, etag, modified, build)
@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import Application
+from .models import Application, ApplicationEvent
 
 
 @admin.register(Application)
@@ -8,3 +8,13 @@ class ApplicationAdmin(admin.ModelAdmin):
     list_filter = ['status', 'applied_at']
     search_fields = ['candidate__username', 'candidate__email', 'job__title']
     date_hierarchy = 'applied_at'
+
+
+@admin.register(ApplicationEvent)
+class ApplicationEventAdmin(admin.ModelAdmin):
+    list_display = ['application', 'job', 'from_status', 'to_status', 'created_at']
+    list_filter = ['to_status', 'created_at']
+    raw_id_fields = ['application', 'job']
+
+    def has_change_permission(self, request, obj=None):
+        return False
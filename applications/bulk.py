@@ -0,0 +1,69 @@
+"""
+Set-based status transitions for many applications at once.
+
+``QuerySet.update()`` bypasses model signals, so the status event log, the
+dashboard counters, the candidate dashboard caches and the candidate
+notification emails that signal handlers would normally take care of are
+handled here, inside the same transaction as the update.
+"""
+from collections import Counter
+
+from django.db import transaction
+from django.db.models import Case, TextField, Value, When
+from django.db.models.functions import Concat
+from django.utils import timezone
+
+from dashboard.cache import bump_users
+from dashboard.counters import bump, status_counter
+from .models import Application, ApplicationEvent
+from .tasks import notify_status_changes
+
+# Primary keys per UPDATE statement, well under every backend's parameter limit.
+BULK_UPDATE_BATCH_SIZE = 900
+
+
+def bulk_update_status(queryset, status, hr_notes=''):
+    """
+    Move every application in ``queryset`` to ``status``.
+
+    A non-empty ``hr_notes`` is appended to each application's existing notes.
+    Returns ``(matched, changed)``: how many applications were selected and how
+    many of them actually changed status.
+    """
+    ids = list(queryset.order_by().values_list('pk', flat=True))
+    now = timezone.now()
+    fields = {'status': status, 'updated_at': now}
+    if hr_notes:
+        fields['hr_notes'] = Case(
+            When(hr_notes='', then=Value(hr_notes)),
+            default=Concat('hr_notes', Value('\n\n' + hr_notes)),
+            output_field=TextField(),
+        )
+
+    with transaction.atomic():
+        previous = Counter()
+        affected_candidates = set()
+        matched = 0
+        for start in range(0, len(ids), BULK_UPDATE_BATCH_SIZE):
+            batch = Application.objects.filter(pk__in=ids[start:start + BULK_UPDATE_BATCH_SIZE])
+            # Lock and re-read the rows, so counters follow the status they had at update time.
+            rows = list(batch.select_for_update().order_by().values_list('pk', 'job_id', 'status', 'candidate_id'))
+            events, changes = [], []
+            for application_id, job_id, old_status, candidate_id in rows:
+                if old_status != status:
+                    previous[old_status] += 1
+                    affected_candidates.add(candidate_id)
+                    events.append(ApplicationEvent(
+                        application_id=application_id, job_id=job_id,
+                        from_status=old_status, to_status=status, created_at=now,
+                    ))
+                    changes.append((application_id, old_status, status))
+            matched += batch.update(**fields)
+            ApplicationEvent.objects.bulk_create(events)
+            notify_status_changes(changes, now)
+
+        for old_status, count in previous.items():
+            bump(status_counter(old_status), -count)
+        bump(status_counter(status), sum(previous.values()))
+        bump_users(affected_candidates)
+    return matched, sum(previous.values())
@@ -0,0 +1,181 @@
+import csv
+import re
+import zipfile
+from xml.sax.saxutils import escape
+
+from django.utils import timezone
+
+from .models import Application
+
+EXPORT_BATCH_SIZE = 2000
+
+# (header, values_list path) for every exported column.
+EXPORT_COLUMNS = [
+    ('Application ID', 'id'),
+    ('First Name', 'candidate__first_name'),
+    ('Last Name', 'candidate__last_name'),
+    ('Email', 'candidate__email'),
+    ('Job', 'job__title'),
+    ('Department', 'job__department'),
+    ('Status', 'status'),
+    ('Applied', 'applied_at'),
+    ('Experience (yrs)', 'candidate__candidate_profile__experience_years'),
+    ('Location', 'candidate__candidate_profile__location'),
+    ('Skills', 'candidate__candidate_profile__skills'),
+]
+
+STATUS_LABELS = dict(Application.STATUS_CHOICES)
+
+# Spreadsheet apps read a cell starting with one of these as a formula.
+FORMULA_PREFIXES = ('=', '+', '-', '@', '\t', '\r')
+
+
+def neutralize_formula(value):
+    """Make a text cell that would start a formula read as plain text, by prefixing a quote."""
+    if isinstance(value, str) and value.startswith(FORMULA_PREFIXES):
+        return f"'{value}"
+    return value
+
+
+def iter_rows(queryset, fields, batch_size=EXPORT_BATCH_SIZE):
+    """
+    Yield ``values_list`` rows of ``fields`` in primary key order.
+
+    Rows are fetched in keyset batches (``pk > last``) rather than through one
+    big cursor: MySQLdb buffers a whole result set client-side, so this is what
+    keeps memory flat there for any number of rows.
+    """
+    queryset = queryset.order_by('pk').values_list('pk', *fields)
+    last_pk = 0
+    while True:
+        batch = list(queryset.filter(pk__gt=last_pk)[:batch_size])
+        if not batch:
+            return
+        for row in batch:
+            yield row[1:]
+        last_pk = batch[-1][0]
+
+
+def export_rows(queryset):
+    """Display-ready export rows (header first) for an applications queryset."""
+    yield [header for header, _ in EXPORT_COLUMNS]
+    status_index = [field for _, field in EXPORT_COLUMNS].index('status')
+    applied_index = [field for _, field in EXPORT_COLUMNS].index('applied_at')
+    for row in iter_rows(queryset, [field for _, field in EXPORT_COLUMNS]):
+        row = list(row)
+        row[status_index] = STATUS_LABELS.get(row[status_index], row[status_index])
+        row[applied_index] = timezone.localtime(row[applied_index]).strftime('%Y-%m-%d %H:%M')
+        # Names, skills and locations are typed by candidates.
+        yield ['' if value is None else neutralize_formula(value) for value in row]
+
+
+class _Echo:
+    """File-like object that hands back what is written instead of storing it."""
+
+    def write(self, value):
+        return value
+
+
+def stream_csv(rows):
+    writer = csv.writer(_Echo())
+    for row in rows:
+        yield writer.writerow(row)
+
+
+# ---------------------------------------------------------------------------
+# Minimal streaming XLSX writer: one sheet of inline strings and numbers,
+# written into a zip that is emitted chunk by chunk as it is produced.
+# ---------------------------------------------------------------------------
+
+XLSX_CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/xl/workbook.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    '<Override PartName="/xl/worksheets/sheet1.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+    '</Types>'
+)
+XLSX_ROOT_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+    'Target="xl/workbook.xml"/>'
+    '</Relationships>'
+)
+XLSX_WORKBOOK = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+    '<sheets><sheet name="{name}" sheetId="1" r:id="rId1"/></sheets>'
+    '</workbook>'
+)
+XLSX_WORKBOOK_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+    'Target="worksheets/sheet1.xml"/>'
+    '</Relationships>'
+)
+XLSX_SHEET_START = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"><sheetData>'
+)
+XLSX_SHEET_END = '</sheetData></worksheet>'
+
+# Characters XML 1.0 does not allow, even escaped.
+XML_ILLEGAL_RE = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f]')
+
+# Rows buffered before compressed output is flushed to the client.
+XLSX_FLUSH_ROWS = 500
+
+
+class _ChunkSink:
+    """Unseekable write target for ``zipfile``; collects output until drained."""
+
+    def __init__(self):
+        self.chunks = []
+
+    def write(self, data):
+        self.chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def drain(self):
+        data = b''.join(self.chunks)
+        self.chunks = []
+        return data
+
+
+def _xlsx_cell(value):
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return f'<c><v>{value}</v></c>'
+    text = escape(XML_ILLEGAL_RE.sub('', str(value)))
+    return f'<c t="inlineStr"><is><t xml:space="preserve">{text}</t></is></c>'
+
+
+def stream_xlsx(rows, sheet_name='Sheet1'):
+    sink = _ChunkSink()
+    with zipfile.ZipFile(sink, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr('[Content_Types].xml', XLSX_CONTENT_TYPES)
+        archive.writestr('_rels/.rels', XLSX_ROOT_RELS)
+        archive.writestr('xl/workbook.xml', XLSX_WORKBOOK.format(name=escape(sheet_name)))
+        archive.writestr('xl/_rels/workbook.xml.rels', XLSX_WORKBOOK_RELS)
+        yield sink.drain()
+
+        with archive.open('xl/worksheets/sheet1.xml', 'w', force_zip64=True) as sheet:
+            sheet.write(XLSX_SHEET_START.encode())
+            for count, row in enumerate(rows, start=1):
+                sheet.write(('<row>' + ''.join(_xlsx_cell(value) for value in row) + '</row>').encode())
+                if count % XLSX_FLUSH_ROWS == 0:
+                    chunk = sink.drain()
+                    if chunk:
+                        yield chunk
+            sheet.write(XLSX_SHEET_END.encode())
+    yield sink.drain()
@@ -3,6 +3,8 @@ from .models import Application
 
 
 class ApplicationForm(forms.ModelForm):
+    use_profile_resume = forms.BooleanField(required=False, label='Use the resume from my profile')
+
     class Meta:
         model = Application
         fields = ['cover_letter', 'resume']
@@ -13,6 +15,21 @@ class ApplicationForm(forms.ModelForm):
             }),
         }
 
+    def __init__(self, *args, profile_resume=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.profile_resume = profile_resume
+        if not profile_resume:
+            del self.fields['use_profile_resume']
+
+    def save(self, commit=True):
+        application = super().save(commit=False)
+        if self.cleaned_data.get('use_profile_resume') and not self.cleaned_data.get('resume'):
+            # Point at the profile's stored file; nothing is uploaded or copied.
+            application.resume = self.profile_resume
+        if commit:
+            application.save()
+        return application
+
 
 class ApplicationStatusForm(forms.ModelForm):
     class Meta:
@@ -24,3 +41,17 @@ class ApplicationStatusForm(forms.ModelForm):
                 'placeholder': 'Add internal notes...'
             }),
         }
+
+
+class BulkStatusForm(forms.Form):
+    SCOPE_CHOICES = (
+        ('selected', 'Selected applications'),
+        ('matching', 'All matching the filter'),
+    )
+
+    new_status = forms.ChoiceField(choices=Application.STATUS_CHOICES)
+    hr_notes = forms.CharField(required=False, widget=forms.TextInput(attrs={
+        'placeholder': 'Shared note (optional)'
+    }))
+    scope = forms.ChoiceField(choices=SCOPE_CHOICES, initial='selected')
+    filter_query = forms.CharField(required=False, widget=forms.HiddenInput)
@@ -0,0 +1,31 @@
+# Generated by Django 4.2.9 on 2026-10-17 23:30
+
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0004_backfill_jobcards'),
+        ('applications', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ApplicationEvent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('from_status', models.CharField(blank=True, choices=[('applied', 'Applied'), ('reviewing', 'Under Review'), ('shortlisted', 'Shortlisted'), ('interview', 'Interview Scheduled'), ('hired', 'Hired'), ('rejected', 'Rejected')], max_length=20)),
+                ('to_status', models.CharField(choices=[('applied', 'Applied'), ('reviewing', 'Under Review'), ('shortlisted', 'Shortlisted'), ('interview', 'Interview Scheduled'), ('hired', 'Hired'), ('rejected', 'Rejected')], max_length=20)),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('application', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='events', to='applications.application')),
+                ('job', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='application_events', to='jobs.job')),
+            ],
+            options={
+                'ordering': ['created_at', 'id'],
+                'indexes': [models.Index(fields=['application', 'created_at'], name='application_applica_340381_idx'), models.Index(fields=['job', 'to_status'], name='application_job_id_d6cf43_idx'), models.Index(fields=['to_status', 'created_at'], name='application_to_stat_438459_idx')],
+            },
+        ),
+    ]
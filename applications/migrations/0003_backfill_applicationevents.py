@@ -0,0 +1,39 @@
+from django.db import migrations
+
+BATCH_SIZE = 500
+
+
+def backfill_events(apps, schema_editor):
+    # Only the current status of existing applications is known, so each one
+    # gets its "applied" event plus a single jump to where it is now.
+    Application = apps.get_model('applications', 'Application')
+    ApplicationEvent = apps.get_model('applications', 'ApplicationEvent')
+
+    events = []
+    rows = Application.objects.order_by('pk').values_list(
+        'pk', 'job_id', 'status', 'applied_at', 'updated_at'
+    ).iterator()
+    for application_id, job_id, status, applied_at, updated_at in rows:
+        events.append(ApplicationEvent(
+            application_id=application_id, job_id=job_id, to_status='applied', created_at=applied_at,
+        ))
+        if status != 'applied':
+            events.append(ApplicationEvent(
+                application_id=application_id, job_id=job_id,
+                from_status='applied', to_status=status, created_at=max(updated_at, applied_at),
+            ))
+        if len(events) >= BATCH_SIZE:
+            ApplicationEvent.objects.bulk_create(events)
+            events = []
+    ApplicationEvent.objects.bulk_create(events)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0002_applicationevent'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_events, migrations.RunPython.noop),
+    ]
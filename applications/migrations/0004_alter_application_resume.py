@@ -0,0 +1,19 @@
+# Generated by Django 4.2.9 on 2026-10-17 23:33
+
+import blobs.storage
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0003_backfill_applicationevents'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='application',
+            name='resume',
+            field=models.FileField(blank=True, null=True, storage=blobs.storage.blob_storage, upload_to='application_resumes/'),
+        ),
+    ]
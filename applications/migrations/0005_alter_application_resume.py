@@ -0,0 +1,19 @@
+# Generated by Django 4.2.9 on 2026-10-17 23:36
+
+import blobs.storage
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0004_alter_application_resume'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='application',
+            name='resume',
+            field=models.FileField(blank=True, db_index=True, null=True, storage=blobs.storage.blob_storage, upload_to='application_resumes/'),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 4.2.9 on 2026-10-18 00:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0005_alter_application_resume'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='application',
+            index=models.Index(fields=['candidate', 'applied_at'], name='application_candida_6e820e_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='application',
+            index=models.Index(fields=['status', 'applied_at'], name='application_status_89c2ad_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='application',
+            index=models.Index(fields=['applied_at'], name='application_applied_06e426_idx'),
+        ),
+    ]
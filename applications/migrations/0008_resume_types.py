@@ -0,0 +1,20 @@
+# Generated by Django 4.2.9 on 2026-10-18 00:57
+
+import blobs.storage
+import django.core.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0007_resume_extensions'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='application',
+            name='resume',
+            field=models.FileField(blank=True, db_index=True, null=True, storage=blobs.storage.blob_storage, upload_to='application_resumes/', validators=[django.core.validators.FileExtensionValidator(['pdf', 'docx', 'txt'])]),
+        ),
+    ]
@@ -1,5 +1,9 @@
+from django.core.validators import FileExtensionValidator
 from django.db import models
 from django.conf import settings
+from django.utils import timezone
+from accounts.models import RESUME_EXTENSIONS
+from blobs.storage import blob_storage
 from jobs.models import Job
 
 
@@ -16,7 +20,8 @@ class Application(models.Model):
     job = models.ForeignKey(Job, on_delete=models.CASCADE, related_name='applications')
     candidate = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='applications')
     cover_letter = models.TextField(blank=True)
-    resume = models.FileField(upload_to='application_resumes/', blank=True, null=True)
+    resume = models.FileField(upload_to='application_resumes/', storage=blob_storage, blank=True, null=True,
+                              db_index=True, validators=[FileExtensionValidator(RESUME_EXTENSIONS)])
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='applied')
     hr_notes = models.TextField(blank=True, help_text='Internal notes visible only to HR')
     applied_at = models.DateTimeField(auto_now_add=True)
@@ -25,6 +30,13 @@ class Application(models.Model):
     class Meta:
         ordering = ['-applied_at']
         unique_together = ['job', 'candidate']
+        # Ascending on purpose: read backwards they give the "-applied_at, -id"
+        # order of every list, with no sort step. See ``manage.py audit_queries``.
+        indexes = [
+            models.Index(fields=['candidate', 'applied_at']),
+            models.Index(fields=['status', 'applied_at']),
+            models.Index(fields=['applied_at']),
+        ]
 
     def __str__(self):
         return f"{self.candidate.get_full_name() or self.candidate.username} → {self.job.title}"
@@ -40,3 +52,34 @@ class Application(models.Model):
             'rejected': '#ef4444',
         }
         return colors.get(self.status, '#6b7280')
+
+
+class ApplicationEvent(models.Model):
+    """
+    Append-only log of application status changes.
+
+    One row is written when an application is created and one per status change
+    after that; rows are never updated. ``job`` is copied from the application
+    so per-job and per-department analytics need no join through applications.
+    """
+    application = models.ForeignKey(Application, on_delete=models.CASCADE, related_name='events')
+    job = models.ForeignKey(Job, on_delete=models.CASCADE, related_name='application_events')
+    from_status = models.CharField(max_length=20, choices=Application.STATUS_CHOICES, blank=True)
+    to_status = models.CharField(max_length=20, choices=Application.STATUS_CHOICES)
+    created_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        ordering = ['created_at', 'id']
+        indexes = [
+            models.Index(fields=['application', 'created_at']),
+            models.Index(fields=['job', 'to_status']),
+            models.Index(fields=['to_status', 'created_at']),
+        ]
+
+    def __str__(self):
+        return f"{self.application_id}: {self.from_status or '—'} → {self.to_status}"
+
+    def save(self, *args, **kwargs):
+        if not self._state.adding:
+            raise ValueError('Application events are append-only and cannot be modified.')
+        super().save(*args, **kwargs)
@@ -0,0 +1,28 @@
+from django.db.models.signals import post_init, post_save
+from django.dispatch import receiver
+
+from .models import Application, ApplicationEvent
+from .tasks import notify_status_changes
+
+
+@receiver(post_init, sender=Application)
+def remember_status(sender, instance, **kwargs):
+    # Read from ``__dict__`` so a deferred status never costs a query; unknown is None.
+    instance._logged_status = instance.__dict__.get('status') if instance.pk else None
+
+
+@receiver(post_save, sender=Application)
+def log_status_change(sender, instance, created, **kwargs):
+    previous = instance._logged_status
+    if created:
+        ApplicationEvent.objects.create(
+            application=instance, job_id=instance.job_id,
+            to_status=instance.status, created_at=instance.applied_at,
+        )
+    elif previous is not None and previous != instance.status:
+        ApplicationEvent.objects.create(
+            application=instance, job_id=instance.job_id,
+            from_status=previous, to_status=instance.status, created_at=instance.updated_at,
+        )
+        notify_status_changes([(instance.pk, previous, instance.status)], instance.updated_at)
+    instance._logged_status = instance.status
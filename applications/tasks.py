@@ -0,0 +1,64 @@
+"""
+Candidate notifications, sent by the background workers.
+
+Status changes are not mailed one by one: each is queued with a short delay,
+and a worker claiming several at once folds them into one digest per
+candidate (only the latest status of each application is reported), then
+sends every digest over a single SMTP connection.
+"""
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.template.loader import render_to_string
+
+from taskqueue.registry import task
+from .models import Application
+
+# Changes made within this window are likely to reach a worker together and share a digest.
+STATUS_EMAIL_DELAY = 5 * 60
+
+
+@task(name='applications.status_digest', batch=True)
+def send_status_digests(payloads):
+    latest = {}
+    for payload in payloads:
+        latest[payload['application_id']] = payload
+    applications = (
+        Application.objects.filter(pk__in=latest)
+        .select_related('candidate', 'job')
+        .only('status', 'candidate__email', 'candidate__first_name', 'candidate__username',
+              'job__title', 'job__department')
+        .order_by('candidate_id', 'job__title')
+    )
+
+    digests = {}
+    for application in applications:
+        # Report where the application is now, which may already have moved past the queued change.
+        if application.candidate.email:
+            digests.setdefault(application.candidate, []).append(application)
+
+    messages = []
+    for candidate, changed in digests.items():
+        context = {'candidate': candidate, 'applications': changed}
+        subject = (
+            f'Update on your application for {changed[0].job.title}' if len(changed) == 1
+            else f'Updates on {len(changed)} of your applications'
+        )
+        body = render_to_string('applications/emails/status_digest.txt', context)
+        messages.append(EmailMessage(subject, body, settings.DEFAULT_FROM_EMAIL, [candidate.email]))
+
+    if messages:
+        with get_connection() as connection:
+            connection.send_messages(messages)
+
+
+def notify_status_changes(changes, changed_at):
+    """
+    Queue digest emails for ``(application_id, from_status, to_status)`` changes.
+
+    Each change has an idempotency key, so queueing the same change twice sends one email.
+    """
+    send_status_digests.enqueue_many(
+        [{'application_id': pk, 'from_status': old, 'to_status': new} for pk, old, new in changes],
+        keys=[f'status-email:{pk}:{new}:{changed_at.timestamp():.6f}' for pk, _, new in changes],
+        delay=STATUS_EMAIL_DELAY,
+    )
@@ -7,6 +7,9 @@ urlpatterns = [
     path('apply/<int:job_pk>/', views.apply_to_job, name='apply'),
     path('my/', views.my_applications_view, name='my_applications'),
     path('all/', views.all_applications_view, name='all_applications'),
+    path('export/', views.export_applications_view, name='export'),
+    path('bulk-status/', views.bulk_update_status_view, name='bulk_update_status'),
     path('<int:pk>/update-status/', views.update_application_status, name='update_status'),
+    path('<int:pk>/resume/', views.application_resume_view, name='resume'),
     path('candidate/<int:pk>/', views.candidate_detail_view, name='candidate_detail'),
 ]
@@ -1,11 +1,26 @@
+import asyncio
+
+from asgiref.sync import sync_to_async
 from django.shortcuts import render, redirect, get_object_or_404
+from django.urls import reverse
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
+from django.db import transaction
 from django.db.models import Q
+from django.http import QueryDict, StreamingHttpResponse
+from django.utils import timezone
+from hr_hiring.aio import aget_user, arender
+from hr_hiring.pagination import keyset_paginate
+from hr_hiring.querybudget import query_budget
 from .models import Application
-from .forms import ApplicationForm, ApplicationStatusForm
+from .exports import export_rows, stream_csv, stream_xlsx
+from .forms import ApplicationForm, ApplicationStatusForm, BulkStatusForm
+from .bulk import bulk_update_status
 from jobs.models import Job
 from accounts.models import CandidateProfile
+from search.resumes import search_resumes
+from skills.normalize import resolve_skill_filter
+from blobs.downloads import protected_file_response, resume_download_name
 
 
 def candidate_required(view_func):
@@ -18,14 +33,26 @@ def candidate_required(view_func):
 
 
 def hr_required(view_func):
+    def deny(request):
+        messages.error(request, 'Only HR can access this page.')
+        return redirect('dashboard:index')
+
+    if asyncio.iscoroutinefunction(view_func):
+        async def async_wrapper(request, *args, **kwargs):
+            user = await aget_user(request)
+            if not user.is_authenticated or not user.is_hr:
+                return deny(request)
+            return await view_func(request, *args, **kwargs)
+        return async_wrapper
+
     def wrapper(request, *args, **kwargs):
         if not request.user.is_authenticated or not request.user.is_hr:
-            messages.error(request, 'Only HR can access this page.')
-            return redirect('dashboard:index')
+            return deny(request)
         return view_func(request, *args, **kwargs)
     return wrapper
 
 
+@query_budget(16)
 @candidate_required
 def apply_to_job(request, job_pk):
     """Candidate applies to a job."""
@@ -36,21 +63,26 @@ def apply_to_job(request, job_pk):
         messages.warning(request, 'You have already applied to this position.')
         return redirect('jobs:detail', pk=job.pk)
 
+    profile = getattr(request.user, 'candidate_profile', None)
+    profile_resume = profile.resume.name if profile is not None and profile.resume else None
+
     if request.method == 'POST':
-        form = ApplicationForm(request.POST, request.FILES)
+        form = ApplicationForm(request.POST, request.FILES, profile_resume=profile_resume)
         if form.is_valid():
             application = form.save(commit=False)
             application.job = job
             application.candidate = request.user
-            application.save()
+            with transaction.atomic():
+                application.save()
             messages.success(request, f'Your application for "{job.title}" has been submitted!')
             return redirect('applications:my_applications')
     else:
-        form = ApplicationForm()
+        form = ApplicationForm(profile_resume=profile_resume, initial={'use_profile_resume': bool(profile_resume)})
 
     return render(request, 'applications/apply.html', {'form': form, 'job': job})
 
 
+@query_budget(4)
 @candidate_required
 def my_applications_view(request):
     """View candidate's own applications."""
@@ -68,18 +100,19 @@ def my_applications_view(request):
     return render(request, 'applications/my_applications.html', context)
 
 
-@hr_required
-def all_applications_view(request):
-    """View all applications (HR only)."""
-    query = request.GET.get('q', '')
-    status_filter = request.GET.get('status', '')
-    skills_filter = request.GET.get('skills', '')
-    experience_filter = request.GET.get('experience', '')
-
-    applications = Application.objects.all().select_related(
-        'job', 'candidate', 'candidate__candidate_profile'
-    )
+def filter_applications(params):
+    """Apply the HR applications list filters (q, status, skills, experience, resume, job) from ``params``."""
+    filters = {
+        'query': params.get('q', ''),
+        'status_filter': params.get('status', ''),
+        'skills_filter': params.get('skills', ''),
+        'experience_filter': params.get('experience', ''),
+        'resume_filter': params.get('resume', ''),
+        'job_filter': params.get('job', ''),
+    }
+    applications = Application.objects.all()
 
+    query = filters['query']
     if query:
         applications = applications.filter(
             Q(candidate__first_name__icontains=query) |
@@ -87,32 +120,116 @@ def all_applications_view(request):
             Q(candidate__email__icontains=query) |
             Q(job__title__icontains=query)
         )
-    if status_filter:
-        applications = applications.filter(status=status_filter)
-    if skills_filter:
-        applications = applications.filter(
-            candidate__candidate_profile__skills__icontains=skills_filter
-        )
-    if experience_filter:
+    if filters['status_filter']:
+        applications = applications.filter(status=filters['status_filter'])
+    if filters['skills_filter']:
+        skill_ids = resolve_skill_filter(filters['skills_filter'])
+        if skill_ids is None:
+            applications = applications.none()
+        for skill_id in skill_ids or []:
+            applications = applications.filter(
+                candidate__candidate_profile__canonical_skills=skill_id
+            )
+    if filters['experience_filter']:
         try:
-            exp = int(experience_filter)
+            exp = int(filters['experience_filter'])
             applications = applications.filter(
                 candidate__candidate_profile__experience_years__gte=exp
             )
         except ValueError:
             pass
+    if filters['resume_filter']:
+        resume_names = search_resumes(filters['resume_filter'])
+        if resume_names is None:
+            applications = applications.none()
+        else:
+            applications = applications.filter(resume__in=resume_names)
+    if filters['job_filter']:
+        if filters['job_filter'].isdigit():
+            applications = applications.filter(job_id=filters['job_filter'])
+        else:
+            applications = applications.none()
+    return applications, filters
+
+
+@query_budget(6)
+@hr_required
+async def all_applications_view(request):
+    """View all applications (HR only)."""
+    applications, filters = await sync_to_async(filter_applications)(request.GET)
+    applications = applications.select_related(
+        'job', 'candidate', 'candidate__candidate_profile'
+    )
+
+    page = await sync_to_async(keyset_paginate)(request, applications, 'applied_at')
+
+    filter_params = request.GET.copy()
+    filter_params.pop('cursor', None)
+    filter_query = filter_params.urlencode()
 
     context = {
-        'applications': applications,
-        'query': query,
-        'status_filter': status_filter,
-        'skills_filter': skills_filter,
-        'experience_filter': experience_filter,
+        'applications': page.object_list,
+        'page_obj': page,
         'status_choices': Application.STATUS_CHOICES,
+        'filter_query': filter_query,
+        'bulk_form': BulkStatusForm(initial={'filter_query': filter_query}),
+        **filters,
     }
-    return render(request, 'applications/hr_all_applications.html', context)
+    return await arender(request, 'applications/hr_all_applications.html', context)
+
+
+@query_budget(4)
+@hr_required
+def export_applications_view(request):
+    """Stream the filtered applications as CSV or XLSX (HR only)."""
+    applications, _ = filter_applications(request.GET)
+    rows = export_rows(applications)
+    stamp = timezone.localtime().strftime('%Y%m%d-%H%M')
+
+    if request.GET.get('format') == 'xlsx':
+        response = StreamingHttpResponse(
+            stream_xlsx(rows, sheet_name='Applications'),
+            content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+        )
+        extension = 'xlsx'
+    else:
+        response = StreamingHttpResponse(stream_csv(rows), content_type='text/csv; charset=utf-8')
+        extension = 'csv'
+    response['Content-Disposition'] = f'attachment; filename="applications-{stamp}.{extension}"'
+    return response
 
 
+@query_budget(20)
+@hr_required
+def bulk_update_status_view(request):
+    """Move selected or all filtered applications to a new status (HR only)."""
+    if request.method != 'POST':
+        return redirect('applications:all_applications')
+
+    form = BulkStatusForm(request.POST)
+    filter_query = request.POST.get('filter_query', '')
+    list_url = reverse('applications:all_applications') + (f'?{filter_query}' if filter_query else '')
+    if not form.is_valid():
+        messages.error(request, 'Choose a valid status for the bulk update.')
+        return redirect(list_url)
+
+    data = form.cleaned_data
+    if data['scope'] == 'matching':
+        applications, _ = filter_applications(QueryDict(data['filter_query']))
+    else:
+        ids = [value for value in request.POST.getlist('ids') if value.isdigit()]
+        if not ids:
+            messages.warning(request, 'Select at least one application.')
+            return redirect(list_url)
+        applications = Application.objects.filter(pk__in=ids)
+
+    matched, changed = bulk_update_status(applications, data['new_status'], data['hr_notes'].strip())
+    label = dict(Application.STATUS_CHOICES)[data['new_status']]
+    messages.success(request, f'{changed} of {matched} applications moved to "{label}".')
+    return redirect(list_url)
+
+
+@query_budget(16)
 @hr_required
 def update_application_status(request, pk):
     """Update application status (HR only)."""
@@ -121,7 +238,8 @@ def update_application_status(request, pk):
     if request.method == 'POST':
         form = ApplicationStatusForm(request.POST, instance=application)
         if form.is_valid():
-            form.save()
+            with transaction.atomic():
+                form.save()
             messages.success(request, f'Application status updated to "{application.get_status_display()}".')
             return redirect('jobs:detail', pk=application.job.pk)
     else:
@@ -133,6 +251,20 @@ def update_application_status(request, pk):
     })
 
 
+@query_budget(4)
+@login_required
+def application_resume_view(request, pk):
+    """Download the resume attached to an application (HR, or the applicant)."""
+    application = get_object_or_404(Application.objects.select_related('candidate'), pk=pk)
+    if not request.user.is_hr and application.candidate_id != request.user.pk:
+        messages.error(request, 'You do not have access to this resume.')
+        return redirect('dashboard:index')
+    return protected_file_response(
+        request, application.resume, resume_download_name(application.candidate, application.resume)
+    )
+
+
+@query_budget(6)
 @hr_required
 def candidate_detail_view(request, pk):
     """View a candidate's full profile (HR only)."""
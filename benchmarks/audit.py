@@ -0,0 +1,119 @@
+"""
+EXPLAIN audit of the queries the views actually run.
+
+Every URL the benchmarks cover is requested once while each SELECT is
+captured with its parameters; every distinct query is then run through the
+database's planner. Plans that read a whole table of at least ``min_rows``
+rows, or sort without an index (a filesort / temporary B-tree), are
+reported with the views that issued them.
+"""
+import re
+
+from django.db import connection
+
+from hr_hiring.querybudget import fingerprint
+from .runner import iter_targets, _request
+
+SQLITE_SCAN_RE = re.compile(r'^SCAN (?:TABLE )?(\w+)(?: AS \w+)?$')
+SQLITE_TABLE_RE = re.compile(r'^(?:SCAN|SEARCH) (?:TABLE )?(\w+)')
+SQLITE_TEMP_SORT = re.compile(r'^USE TEMP B-TREE FOR (?:RIGHT PART OF |LAST TERM OF )?(?:ORDER|GROUP) BY')
+
+
+class QueryCollector:
+    """Execute wrapper keeping one ``(sql, params)`` sample of each distinct SELECT, with its views."""
+
+    def __init__(self):
+        self.queries = {}
+        self.view = None
+
+    def __call__(self, execute, sql, params, many, context):
+        if self.view and not many and sql.lstrip().upper().startswith(('SELECT', 'WITH')):
+            entry = self.queries.setdefault(fingerprint(sql), {'sql': sql, 'params': params, 'views': set()})
+            entry['views'].add(self.view)
+        return execute(sql, params, many, context)
+
+
+def collect_queries(only=None, skipped=None):
+    """``{fingerprint: {'sql', 'params', 'views'}}`` for the SELECTs every benchmarked URL runs."""
+    collector = QueryCollector()
+    with connection.execute_wrapper(collector):
+        for name, role, url, client in iter_targets(only, skipped):
+            collector.view = f'{name} ({role})'
+            _request(client, url)
+            collector.view = None
+    return collector.queries
+
+
+def explain(sql, params):
+    """The query plan as a list of ``(table, issue, detail)`` problems and the raw plan lines."""
+    problems, lines = [], []
+    with connection.cursor() as cursor:
+        if connection.vendor == 'sqlite':
+            cursor.execute(f'EXPLAIN QUERY PLAN {sql}', params)
+            table = None
+            for row in cursor.fetchall():
+                detail = row[-1]
+                lines.append(detail)
+                scan = SQLITE_SCAN_RE.match(detail)
+                if scan:
+                    problems.append((scan.group(1), 'full scan', detail))
+                elif SQLITE_TEMP_SORT.match(detail):
+                    problems.append((table, 'filesort', detail))
+                searched = SQLITE_TABLE_RE.match(detail)
+                if searched and table is None:
+                    table = searched.group(1)  # The sort applies to the outermost (driving) table.
+        elif connection.vendor == 'mysql':
+            cursor.execute(f'EXPLAIN {sql}', params)
+            columns = [column[0] for column in cursor.description]
+            for values in cursor.fetchall():
+                row = dict(zip(columns, values))
+                extra = row.get('Extra') or ''
+                lines.append(f"{row['table']}: type={row['type']} key={row['key']} rows={row['rows']} {extra}")
+                if row['type'] == 'ALL':
+                    problems.append((row['table'], 'full scan', f"~{row['rows']} rows examined"))
+                if 'Using filesort' in extra or 'Using temporary' in extra:
+                    problems.append((row['table'], 'filesort', extra))
+        else:
+            raise NotImplementedError(f'The query plan audit supports MySQL and SQLite, not {connection.vendor}.')
+    return problems, lines
+
+
+def audit(only=None, min_rows=1000, skipped=None):
+    """
+    Explain every query the views run and return the flagged ones, worst first.
+
+    Full scans of tables smaller than ``min_rows`` are not flagged: reading
+    those whole is as cheap as any index lookup.
+    """
+    tables = set(connection.introspection.table_names())
+    row_counts = {}
+
+    def rows_in(table):
+        if table not in row_counts:
+            with connection.cursor() as cursor:
+                cursor.execute(f'SELECT COUNT(*) FROM {connection.ops.quote_name(table)}')
+                row_counts[table] = cursor.fetchone()[0]
+        return row_counts[table]
+
+    queries = collect_queries(only, skipped)
+    findings = []
+    for entry in queries.values():
+        problems, plan = explain(entry['sql'], entry['params'])
+        issues = []
+        for table, issue, detail in problems:
+            if issue == 'full scan':
+                # Scans of CTEs and subqueries are over already-filtered rows.
+                if table not in tables or rows_in(table) < min_rows:
+                    continue
+                issues.append({'issue': issue, 'table': table, 'rows': rows_in(table), 'detail': detail})
+            else:
+                issues.append({'issue': issue, 'table': table, 'rows': None, 'detail': detail})
+        if issues:
+            findings.append({
+                'views': sorted(entry['views']),
+                'sql': entry['sql'],
+                'issues': issues,
+                'plan': plan,
+            })
+    findings.sort(key=lambda finding: -max(issue['rows'] or 0 for issue in finding['issues']))
+    return {'queries': len(queries), 'findings': findings}
@@ -0,0 +1,49 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from benchmarks.audit import audit
+
+
+class Command(BaseCommand):
+    help = 'EXPLAIN every query the views run and report full table scans and filesorts'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--only', nargs='+', metavar='NAME',
+                            help='Only URL names containing one of these, e.g. jobs: applications:all')
+        parser.add_argument('--min-rows', type=int, default=1000,
+                            help='Ignore full scans of tables with fewer rows than this (default: 1000)')
+        parser.add_argument('--json', action='store_true',
+                            help='Print the findings as JSON instead of a report')
+        parser.add_argument('--fail', action='store_true',
+                            help='Exit with an error if anything was flagged')
+
+    def handle(self, *args, **options):
+        skipped = {}
+        try:
+            report = audit(only=options['only'], min_rows=options['min_rows'], skipped=skipped)
+        except NotImplementedError as exc:
+            raise CommandError(str(exc))
+        for name, reason in skipped.items():
+            self.stderr.write(f'Skipped {name}: {reason}')
+
+        findings = report['findings']
+        if options['json']:
+            self.stdout.write(json.dumps(report, indent=2, default=str))
+        else:
+            for finding in findings:
+                for issue in finding['issues']:
+                    rows = f" ({issue['rows']} rows)" if issue['rows'] is not None else ''
+                    self.stdout.write(self.style.WARNING(
+                        f"{issue['issue'].upper()} {issue['table'] or ''}{rows}: {issue['detail']}"
+                    ))
+                self.stdout.write(f"  views: {', '.join(finding['views'])}")
+                self.stdout.write(f"  sql:   {finding['sql']}")
+                for line in finding['plan']:
+                    self.stdout.write(f'  plan:  {line}')
+                self.stdout.write('')
+
+        summary = f"Explained {report['queries']} distinct queries, {len(findings)} flagged."
+        if findings and options['fail']:
+            raise CommandError(summary)
+        self.stderr.write(self.style.SUCCESS(summary) if not findings else summary)
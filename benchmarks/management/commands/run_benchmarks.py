@@ -0,0 +1,54 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from benchmarks.runner import compare, run_benchmarks
+
+
+class Command(BaseCommand):
+    help = 'Benchmark every URL as the right role and report latency percentiles, queries and memory as JSON'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--iterations', type=int, default=20,
+                            help='Timed requests per URL (default: 20)')
+        parser.add_argument('--warmup', type=int, default=2,
+                            help='Untimed requests per URL first (default: 2)')
+        parser.add_argument('--only', nargs='+', metavar='NAME',
+                            help='Only URL names containing one of these, e.g. jobs: applications:all')
+        parser.add_argument('--output', help='Write the JSON report to this file instead of stdout')
+        parser.add_argument('--compare', metavar='BASELINE',
+                            help='Print p95 latency and query changes against an earlier JSON report')
+
+    def handle(self, *args, **options):
+        if options['iterations'] < 1:
+            raise CommandError('--iterations must be at least 1.')
+        baseline = None
+        if options['compare']:
+            with open(options['compare']) as handle:
+                baseline = json.load(handle)
+
+        # Progress goes to stderr so stdout stays valid JSON.
+        self.stderr.write(f"{'p50':>9} {'p95':>9} {'p99':>9}")
+        report = run_benchmarks(
+            iterations=options['iterations'], warmup=options['warmup'],
+            only=options['only'], log=self.stderr.write,
+        )
+        for name, reason in report['skipped'].items():
+            self.stderr.write(f'Skipped {name}: {reason}')
+
+        if baseline is not None:
+            self.stderr.write(f"\n{'p95 before':>10} {'p95 now':>9} {'change':>8} {'queries':>8}")
+            for result, old in compare(baseline, report):
+                change = (result['p95_ms'] - old['p95_ms']) / old['p95_ms'] * 100 if old['p95_ms'] else 0
+                self.stderr.write(
+                    f"{old['p95_ms']:10.2f} {result['p95_ms']:9.2f} {change:+7.1f}% "
+                    f"{result['queries'] - old['queries']:+8d}  {result['role']:<9} {result['url']}"
+                )
+
+        output = json.dumps(report, indent=2)
+        if options['output']:
+            with open(options['output'], 'w') as handle:
+                handle.write(output + '\n')
+            self.stderr.write(self.style.SUCCESS(f"Wrote {len(report['results'])} results to {options['output']}."))
+        else:
+            self.stdout.write(output)
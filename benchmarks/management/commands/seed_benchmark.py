@@ -0,0 +1,44 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from accounts.models import User
+from benchmarks.seed import DEFAULT_BATCH_SIZE, PASSWORD, USERNAME_PREFIX, clear_benchmark_data, seed
+
+
+class Command(BaseCommand):
+    help = 'Generate a reproducible synthetic data set for benchmarking'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--hr', type=int, default=5, help='HR users (default: 5)')
+        parser.add_argument('--candidates', type=int, default=1000,
+                            help='Candidates, each with a profile and skills (default: 1000)')
+        parser.add_argument('--jobs', type=int, default=200, help='Jobs (default: 200)')
+        parser.add_argument('--applications-per-candidate', type=float, default=4,
+                            help='Average applications per candidate (default: 4)')
+        parser.add_argument('--seed', type=int, default=42, help='Random seed (default: 42)')
+        parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE,
+                            help=f'Rows per INSERT (default: {DEFAULT_BATCH_SIZE})')
+        parser.add_argument('--clear', action='store_true',
+                            help='Delete a previously generated data set first')
+
+    def handle(self, *args, **options):
+        if options['hr'] < 1:
+            raise CommandError('At least one HR user is needed to post jobs.')
+        if options['clear']:
+            self.stdout.write(f'Deleted {clear_benchmark_data()} rows of earlier benchmark data.')
+        elif User.objects.filter(username__startswith=USERNAME_PREFIX).exists():
+            raise CommandError('Benchmark data already exists; pass --clear to replace it.')
+
+        created = seed(
+            hr_users=options['hr'],
+            candidates=options['candidates'],
+            jobs=options['jobs'],
+            applications_per_candidate=options['applications_per_candidate'],
+            random_seed=options['seed'],
+            batch_size=options['batch_size'],
+            log=self.stdout.write,
+        )
+        summary = ', '.join(f'{count} {label}' for label, count in created.items())
+        self.stdout.write(self.style.SUCCESS(
+            f'Seeded {summary}. Log in as {USERNAME_PREFIX}hr_0 or {USERNAME_PREFIX}candidate_0 '
+            f'with password "{PASSWORD}".'
+        ))
@@ -0,0 +1,267 @@
+"""
+Latency, query and memory benchmarks for every URL of the site.
+
+Each URL pattern in ``hr_hiring.urls`` (except the admin) is requested through
+the Django test client as the role that uses it, against whatever data is in
+the configured database (see ``seed_benchmark``). Results are plain JSON so
+runs from different commits can be stored and compared.
+"""
+import math
+import platform
+import subprocess
+import time
+import tracemalloc
+
+import django
+from django.db import connection
+from django.db.models import Count
+from django.test import Client
+from django.test.utils import override_settings
+from django.urls import URLPattern, URLResolver, get_resolver
+from django.utils import timezone
+
+from accounts.models import CandidateProfile, User
+from applications.models import Application
+from hr_hiring.querybudget import record_queries
+from jobs.models import Job
+
+ANONYMOUS, HR, CANDIDATE = 'anonymous', 'hr', 'candidate'
+
+# Roles each view is benchmarked as; anything not listed is an HR page.
+ROLES = {
+    'landing': [ANONYMOUS],
+    'accounts:home': [ANONYMOUS],
+    'accounts:register': [ANONYMOUS],
+    'accounts:login': [ANONYMOUS],
+    'accounts:profile': [HR, CANDIDATE],
+    'accounts:profile_edit': [HR, CANDIDATE],
+    'accounts:change_password': [CANDIDATE],
+    'dashboard:index': [HR, CANDIDATE],
+    'jobs:list': [CANDIDATE],
+    'jobs:detail': [HR, CANDIDATE],
+    'applications:apply': [CANDIDATE],
+    'applications:my_applications': [CANDIDATE],
+    'api:jobs': [ANONYMOUS],
+    'api:job': [ANONYMOUS],
+}
+
+# Extra query strings benchmarked besides the bare URL.
+QUERY_VARIANTS = {
+    'jobs:list': ['q=python', 'type=full_time&experience=mid'],
+    'jobs:hr_list': ['q=engineer'],
+    'applications:all_applications': ['status=interview', 'skills=Python', 'q=sharma'],
+    'applications:export': ['format=xlsx'],
+    'api:jobs': ['fields=id,title', 'page_size=100', 'q=python&type=full_time'],
+    'api:job': ['fields=id,title'],
+}
+
+# Views that cannot be benchmarked with a GET, with the reason.
+SKIPPED = {
+    'accounts:logout': 'ends the session',
+    'applications:bulk_update_status': 'POST only',
+}
+
+
+class Samples:
+    """Real rows to log in as and to fill URL parameters with."""
+
+    def __init__(self):
+        self.hr = User.objects.filter(role='hr').order_by('pk').first()
+        busiest = (
+            Application.objects.order_by().values('candidate_id')
+            .annotate(n=Count('id')).order_by('-n').first()
+        )
+        self.candidate = User.objects.get(pk=busiest['candidate_id']) if busiest else (
+            User.objects.filter(role='candidate', candidate_profile__isnull=False).order_by('pk').first()
+        )
+        self.job = Job.objects.filter(status='active').annotate(n=Count('applications')).order_by('-n').first()
+        self.application = self.job and self.job.applications.order_by('pk').first()
+        self.open_job = self.candidate and (
+            Job.objects.filter(status='active').exclude(applications__candidate=self.candidate).order_by('pk').first()
+        )
+        with_resume = CandidateProfile.objects.exclude(resume='').exclude(resume=None).order_by('pk').first()
+        self.resume_candidate_id = with_resume and with_resume.user_id
+        self.resume_application = Application.objects.exclude(resume='').exclude(resume=None).order_by('pk').first()
+
+    def kwargs(self, name):
+        """URL kwargs for ``name``, or None if the data set has nothing to use."""
+        builders = {
+            'jobs:detail': lambda: self.job and {'pk': self.job.pk},
+            'jobs:edit': lambda: self.job and {'pk': self.job.pk},
+            'jobs:delete': lambda: self.job and {'pk': self.job.pk},
+            'applications:apply': lambda: self.open_job and {'job_pk': self.open_job.pk},
+            'applications:update_status': lambda: self.application and {'pk': self.application.pk},
+            'applications:candidate_detail': lambda: self.candidate and {'pk': self.candidate.pk},
+            'applications:resume': lambda: self.resume_application and {'pk': self.resume_application.pk},
+            'accounts:resume': lambda: self.resume_candidate_id and {'pk': self.resume_candidate_id},
+            'api:job': lambda: self.job and {'pk': self.job.pk},
+        }
+        return builders[name]() if name in builders else {}
+
+
+def iter_url_patterns(resolver=None, prefix='', namespace=''):
+    """Yield ``(view name, route, pattern)`` for every named, non-admin URL pattern."""
+    resolver = resolver or get_resolver()
+    for pattern in resolver.url_patterns:
+        if isinstance(pattern, URLResolver):
+            if pattern.namespace == 'admin':
+                continue
+            child_namespace = ':'.join(filter(None, [namespace, pattern.namespace]))
+            yield from iter_url_patterns(pattern, prefix + str(pattern.pattern), child_namespace)
+        elif isinstance(pattern, URLPattern) and pattern.name:
+            name = f'{namespace}:{pattern.name}' if namespace else pattern.name
+            yield name, prefix + str(pattern.pattern), pattern
+
+
+def build_url(route, kwargs):
+    """Fill a ``path()`` route such as ``jobs/<int:pk>/`` with ``kwargs``."""
+    url = route
+    for key, value in kwargs.items():
+        start = url.index('<')
+        end = url.index('>', start)
+        if not url[start + 1:end].endswith(key):
+            raise ValueError(f'Unexpected parameter order in {route!r}.')
+        url = url[:start] + str(value) + url[end + 1:]
+    if '<' in url:
+        raise ValueError(f'No URL parameters for {route!r}; add a builder to Samples.kwargs.')
+    return '/' + url
+
+
+def percentile(sorted_values, p):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return None
+    return sorted_values[max(math.ceil(p / 100 * len(sorted_values)) - 1, 0)]
+
+
+def _request(client, url):
+    response = client.get(url)
+    if response.streaming:
+        # A streamed body is produced while it is read; include that in the timing.
+        for _ in response.streaming_content:
+            pass
+    return response
+
+
+def benchmark_url(client, url, iterations, warmup):
+    for _ in range(warmup):
+        _request(client, url)
+
+    latencies, queries, statuses = [], [], set()
+    for _ in range(iterations):
+        with record_queries() as recorder:
+            start = time.perf_counter()
+            response = _request(client, url)
+            latencies.append((time.perf_counter() - start) * 1000)
+        queries.append(recorder.count)
+        statuses.add(response.status_code)
+
+    tracemalloc.start()
+    try:
+        _request(client, url)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    latencies.sort()
+    return {
+        'status': sorted(statuses),
+        'iterations': iterations,
+        'p50_ms': round(percentile(latencies, 50), 2),
+        'p95_ms': round(percentile(latencies, 95), 2),
+        'p99_ms': round(percentile(latencies, 99), 2),
+        'mean_ms': round(sum(latencies) / len(latencies), 2),
+        'queries': max(queries),
+        'peak_memory_kb': round(peak / 1024, 1),
+    }
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def iter_targets(only=None, skipped=None):
+    """
+    Yield ``(view name, role, url, logged-in client)`` for every URL to benchmark.
+
+    ``only`` limits it to view names containing one of its strings; anything
+    that cannot be requested is recorded in the ``skipped`` dict with a reason.
+    """
+    skipped = {} if skipped is None else skipped
+    samples = Samples()
+    clients = {ANONYMOUS: Client()}
+    for role, user in ((HR, samples.hr), (CANDIDATE, samples.candidate)):
+        if user is not None:
+            clients[role] = Client()
+            clients[role].force_login(user)
+
+    with override_settings(ALLOWED_HOSTS=['testserver']):
+        for name, route, _ in iter_url_patterns():
+            if only and not any(part in name for part in only):
+                continue
+            if name in SKIPPED:
+                skipped[name] = SKIPPED[name]
+                continue
+            kwargs = samples.kwargs(name)
+            if kwargs is None:
+                skipped[name] = 'no suitable data'
+                continue
+            try:
+                base_url = build_url(route, kwargs)
+            except ValueError as exc:
+                skipped[name] = str(exc)
+                continue
+            for role in ROLES.get(name, [HR]):
+                if role not in clients:
+                    skipped[f'{name} ({role})'] = f'no {role} user'
+                    continue
+                for query in ['', *QUERY_VARIANTS.get(name, [])]:
+                    yield name, role, f'{base_url}?{query}' if query else base_url, clients[role]
+
+
+def run_benchmarks(iterations=20, warmup=2, only=None, log=print):
+    """Benchmark every URL and return the report as a JSON-serializable dict."""
+    results, skipped = [], {}
+    for name, role, url, client in iter_targets(only, skipped):
+        result = benchmark_url(client, url, iterations, warmup)
+        results.append({'name': name, 'role': role, 'url': url, **result})
+        log(f"{result['p50_ms']:9.2f} {result['p95_ms']:9.2f} {result['p99_ms']:9.2f} ms "
+            f"{result['queries']:4d}q  {role:<9} {url}")
+
+    return {
+        'meta': {
+            'commit': git_commit(),
+            'created_at': timezone.now().isoformat(),
+            'python': platform.python_version(),
+            'django': django.get_version(),
+            'database': connection.vendor,
+            'rows': {
+                'users': User.objects.count(),
+                'jobs': Job.objects.count(),
+                'applications': Application.objects.count(),
+            },
+            'iterations': iterations,
+            'warmup': warmup,
+        },
+        'results': results,
+        'skipped': skipped,
+    }
+
+
+def _result_key(result):
+    # Keyed by view rather than URL, so runs over different data sets still line up.
+    return result['name'], result['role'], result['url'].partition('?')[2]
+
+
+def compare(baseline, current):
+    """``(result, baseline result)`` pairs for every benchmark present in both reports."""
+    previous = {_result_key(result): result for result in baseline['results']}
+    return [
+        (result, previous[_result_key(result)])
+        for result in current['results'] if _result_key(result) in previous
+    ]
@@ -0,0 +1,229 @@
+"""
+Synthetic data for benchmarks.
+
+Generates HR users, candidates with profiles and skills, jobs across every
+job type and experience level, and applications in every status with their
+status events, all with ``bulk_create`` in batches and a seeded random
+generator, so the same options always produce the same data. Bulk inserts
+skip model signals, so the read models they would maintain (job cards,
+search index, dashboard counters) are rebuilt at the end.
+"""
+import random
+from datetime import timedelta
+from decimal import Decimal
+
+from django.contrib.auth.hashers import make_password
+from django.core.cache import cache
+from django.db import transaction
+from django.utils import timezone
+
+from accounts.models import CandidateProfile, User
+from applications.models import Application, ApplicationEvent
+from dashboard.counters import rebuild_counters
+from jobs.cards import rebuild_cards
+from jobs.models import Job
+from matching.engine import invalidate_job_matrix
+from search.index import rebuild_index
+from skills.normalize import resolve_skills
+
+USERNAME_PREFIX = 'bench_'
+PASSWORD = 'benchmark'
+DEFAULT_BATCH_SIZE = 1000
+
+SKILLS = [
+    'Python', 'Django', 'Flask', 'FastAPI', 'JavaScript', 'TypeScript', 'React', 'Vue', 'Angular',
+    'Node.js', 'Java', 'Spring', 'Kotlin', 'Go', 'Rust', 'C++', 'C#', '.NET', 'Ruby', 'Rails',
+    'PHP', 'SQL', 'PostgreSQL', 'MySQL', 'MongoDB', 'Redis', 'Kafka', 'Docker', 'Kubernetes',
+    'AWS', 'Google Cloud', 'Azure', 'Terraform', 'Linux', 'Git', 'REST', 'GraphQL',
+    'Machine Learning', 'Pandas', 'Spark', 'Figma', 'Selenium',
+]
+TITLES = [
+    'Backend Engineer', 'Frontend Developer', 'Full Stack Developer', 'Data Engineer', 'Data Scientist',
+    'DevOps Engineer', 'Site Reliability Engineer', 'QA Engineer', 'Mobile Developer', 'Product Designer',
+    'Engineering Manager', 'Solutions Architect', 'Security Engineer', 'ML Engineer', 'Technical Writer',
+]
+DEPARTMENTS = ['Engineering', 'Data', 'Infrastructure', 'Product', 'Design', 'Security', 'Quality']
+LOCATIONS = [
+    'Bengaluru', 'Pune', 'Hyderabad', 'Mumbai', 'Chennai', 'Delhi', 'Noida', 'Gurugram', 'Kolkata', 'Remote',
+]
+FIRST_NAMES = [
+    'Aarav', 'Vivaan', 'Aditya', 'Diya', 'Ananya', 'Ishaan', 'Kavya', 'Rohan', 'Meera', 'Arjun',
+    'Sara', 'Kabir', 'Nisha', 'Dev', 'Priya', 'Rahul', 'Zoya', 'Vikram', 'Tara', 'Neel',
+]
+LAST_NAMES = [
+    'Sharma', 'Patel', 'Iyer', 'Reddy', 'Khan', 'Gupta', 'Nair', 'Das', 'Mehta', 'Singh',
+    'Joshi', 'Rao', 'Kulkarni', 'Bose', 'Menon', 'Chopra', 'Pillai', 'Verma', 'Ghosh', 'Shah',
+]
+
+# Rough shape of a hiring pipeline: most applications never get past review.
+STATUS_WEIGHTS = {
+    'applied': 35,
+    'reviewing': 20,
+    'shortlisted': 12,
+    'interview': 10,
+    'hired': 5,
+    'rejected': 18,
+}
+JOB_STATUS_WEIGHTS = {'active': 70, 'paused': 10, 'closed': 15, 'draft': 5}
+PIPELINE = ['applied', 'reviewing', 'shortlisted', 'interview', 'hired']
+
+
+def clear_benchmark_data():
+    """Delete every benchmark user along with their jobs, applications and profiles."""
+    deleted, _ = User.objects.filter(username__startswith=USERNAME_PREFIX).delete()
+    return deleted
+
+
+def _batches(items, size):
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def _create_users(prefix, count, role, rng, password, batch_size):
+    """Bulk-create users and return their primary keys in creation order."""
+    pks = []
+    for batch in _batches(range(count), batch_size):
+        users = []
+        for number in batch:
+            first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+            username = f'{prefix}{number}'
+            users.append(User(
+                username=username, first_name=first, last_name=last, role=role,
+                email=f'{username}@example.com', password=password,
+            ))
+        User.objects.bulk_create(users)
+        # Re-read the keys: MySQL does not return them from bulk inserts.
+        by_name = dict(User.objects.filter(username__in=[u.username for u in users]).values_list('username', 'pk'))
+        pks.extend(by_name[u.username] for u in users)
+    return pks
+
+
+def _skill_text(rng, low, high):
+    return ', '.join(rng.sample(SKILLS, rng.randint(low, high)))
+
+
+def seed(hr_users=5, candidates=1000, jobs=200, applications_per_candidate=4, random_seed=42,
+         batch_size=DEFAULT_BATCH_SIZE, log=print):
+    """Generate a benchmark data set. Returns ``{model label: rows created}``."""
+    rng = random.Random(random_seed)
+    password = make_password(PASSWORD)
+    now = timezone.now()
+    skills = {skill.name: skill.pk for skill in resolve_skills(SKILLS)}
+    created = {}
+
+    with transaction.atomic():
+        hr_pks = _create_users(f'{USERNAME_PREFIX}hr_', hr_users, 'hr', rng, password, batch_size)
+        candidate_pks = _create_users(f'{USERNAME_PREFIX}candidate_', candidates, 'candidate', rng, password, batch_size)
+        created['users'] = len(hr_pks) + len(candidate_pks)
+        log(f'Created {created["users"]} users.')
+
+        profile_skills = {}
+        for batch in _batches(candidate_pks, batch_size):
+            profiles = []
+            for user_id in batch:
+                text = _skill_text(rng, 2, 8)
+                profile_skills[user_id] = text
+                profiles.append(CandidateProfile(
+                    user_id=user_id, skills=text, experience_years=min(int(rng.expovariate(1 / 4)), 25),
+                    location=rng.choice(LOCATIONS), headline=rng.choice(TITLES),
+                    bio='Benchmark candidate profile.', education='B.Tech',
+                ))
+            CandidateProfile.objects.bulk_create(profiles)
+        profile_pks = dict(CandidateProfile.objects.filter(user_id__in=candidate_pks).values_list('user_id', 'pk'))
+        ProfileSkill = CandidateProfile.canonical_skills.through
+        ProfileSkill.objects.bulk_create([
+            ProfileSkill(candidateprofile_id=profile_pks[user_id], skill_id=skills[name])
+            for user_id, text in profile_skills.items() for name in text.split(', ')
+        ], batch_size=batch_size)
+        created['profiles'] = len(profile_pks)
+        log(f'Created {created["profiles"]} candidate profiles.')
+
+        job_types = [value for value, _ in Job.JOB_TYPE_CHOICES]
+        levels = [value for value, _ in Job.EXPERIENCE_CHOICES]
+        job_rows = []
+        for number in range(jobs):
+            salary_min = rng.choice([None, *range(300_000, 3_000_001, 100_000)])
+            salary_max = salary_min and salary_min + rng.choice([200_000, 500_000, 1_000_000])
+            job_rows.append(Job(
+                title=f'{rng.choice(TITLES)} {number}',
+                description=f'Benchmark job {number}. Build and run services used across the company.',
+                requirements='Solid fundamentals and clear communication.',
+                responsibilities='Design, build and operate production systems.',
+                skills_required=_skill_text(rng, 2, 6),
+                # Cycle through the combinations so every type and level is present.
+                job_type=job_types[number % len(job_types)],
+                experience_level=levels[(number // len(job_types)) % len(levels)],
+                location=rng.choice(LOCATIONS), department=rng.choice(DEPARTMENTS),
+                salary_min=salary_min and Decimal(salary_min), salary_max=salary_max and Decimal(salary_max),
+                status=rng.choices(list(JOB_STATUS_WEIGHTS), weights=JOB_STATUS_WEIGHTS.values())[0],
+                posted_by_id=rng.choice(hr_pks),
+                deadline=(now + timedelta(days=rng.randint(7, 90))).date(),
+            ))
+        job_pks = []
+        for batch in _batches(job_rows, batch_size):
+            Job.objects.bulk_create(batch)
+            # Titles are numbered, so they identify this run's jobs.
+            by_title = dict(Job.objects.filter(
+                posted_by_id__in=hr_pks, title__in=[job.title for job in batch],
+            ).values_list('title', 'pk'))
+            job_pks.extend(by_title[job.title] for job in batch)
+        JobSkill = Job.canonical_skills.through
+        JobSkill.objects.bulk_create([
+            JobSkill(job_id=pk, skill_id=skills[name])
+            for pk, job in zip(job_pks, job_rows) for name in job.skills_required.split(', ')
+        ], batch_size=batch_size)
+        created['jobs'] = len(job_pks)
+        log(f'Created {created["jobs"]} jobs.')
+
+        statuses = list(STATUS_WEIGHTS)
+        weights = list(STATUS_WEIGHTS.values())
+        pairs = []
+        for candidate_id in candidate_pks:
+            count = min(len(job_pks), max(0, round(rng.gauss(applications_per_candidate, 2))))
+            for job_id in rng.sample(job_pks, count):
+                pairs.append((job_id, candidate_id, rng.choices(statuses, weights=weights)[0]))
+        created['applications'] = created['events'] = 0
+        for batch in _batches(pairs, batch_size):
+            Application.objects.bulk_create([
+                Application(job_id=job_id, candidate_id=candidate_id, status=status,
+                            cover_letter='I would like to apply for this role.')
+                for job_id, candidate_id, status in batch
+            ])
+            application_pks = dict(
+                ((job_id, candidate_id), pk) for job_id, candidate_id, pk in Application.objects.filter(
+                    candidate_id__in={candidate_id for _, candidate_id, _ in batch},
+                    job_id__in={job_id for job_id, _, _ in batch},
+                ).values_list('job_id', 'candidate_id', 'pk')
+            )
+            events = []
+            for job_id, candidate_id, status in batch:
+                events.extend(_status_events(application_pks[job_id, candidate_id], job_id, status, now, rng))
+            ApplicationEvent.objects.bulk_create(events)
+            created['applications'] += len(batch)
+            created['events'] += len(events)
+        log(f'Created {created["applications"]} applications and {created["events"]} status events.')
+
+        rebuild_cards()
+        rebuild_index()
+        rebuild_counters()
+    invalidate_job_matrix()
+    cache.clear()
+    log('Rebuilt job cards, search index and dashboard counters.')
+    return created
+
+
+def _status_events(application_id, job_id, status, now, rng):
+    """Plausible status history ending in ``status``, spread over the last few months."""
+    path = PIPELINE[:PIPELINE.index(status) + 1] if status in PIPELINE else (
+        PIPELINE[:rng.randint(1, 4)] + ['rejected']
+    )
+    at = now - timedelta(days=rng.uniform(len(path) * 6, 180))
+    events, previous = [], ''
+    for stage in path:
+        events.append(ApplicationEvent(
+            application_id=application_id, job_id=job_id,
+            from_status=previous, to_status=stage, created_at=at,
+        ))
+        previous = stage
+        at += timedelta(hours=rng.uniform(4, 24 * 6))
+    return events
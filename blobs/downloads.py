@@ -0,0 +1,56 @@
+"""
+Permission-checked downloads of private media.
+
+Views decide who may see a file; the bytes are then sent by nginx, which
+gets an ``X-Accel-Redirect`` to its ``internal`` protected-media location and
+serves the file with sendfile, including Range and conditional requests.
+Without nginx in front (``MEDIA_ACCEL_REDIRECT`` off, e.g. runserver), the
+file is served by Django's static file view, which handles conditional GETs
+but not Range.
+"""
+import mimetypes
+import os
+from urllib.parse import quote
+
+from django.conf import settings
+from django.http import Http404, HttpResponse
+from django.utils.cache import patch_cache_control
+from django.utils.text import slugify
+from django.views.static import serve
+
+# Browsers may keep a private copy briefly; shared caches must not keep one at all.
+PRIVATE_MAX_AGE = 5 * 60
+
+# Types safe to display in the browser. Anything else (HTML, SVG, ...) would
+# run as active content on the app's origin, so it is only ever downloaded.
+INLINE_CONTENT_TYPES = {'application/pdf'}
+
+
+def resume_download_name(user, field_file):
+    """``<candidate name>-resume<ext>``, rather than the blob's content hash."""
+    extension = os.path.splitext(field_file.name)[1]
+    return f"{slugify(user.display_name) or 'candidate'}-resume{extension}"
+
+
+def protected_file_response(request, field_file, download_name=None):
+    """Response that delivers ``field_file`` to an already authorized user."""
+    if not field_file:
+        raise Http404('No file.')
+    name = field_file.name
+    download_name = download_name or os.path.basename(name)
+    content_type, encoding = mimetypes.guess_type(name)
+
+    if settings.MEDIA_ACCEL_REDIRECT:
+        response = HttpResponse()
+        response['X-Accel-Redirect'] = settings.PROTECTED_MEDIA_URL + quote(name)
+        response['Content-Type'] = content_type or 'application/octet-stream'
+        if encoding:
+            response['Content-Encoding'] = encoding
+    else:
+        response = serve(request, name, document_root=settings.MEDIA_ROOT)
+
+    disposition = 'inline' if content_type in INLINE_CONTENT_TYPES and not encoding else 'attachment'
+    response['Content-Disposition'] = f"{disposition}; filename*=UTF-8''{quote(download_name)}"
+    response['X-Content-Type-Options'] = 'nosniff'
+    patch_cache_control(response, private=True, max_age=PRIVATE_MAX_AGE)
+    return response
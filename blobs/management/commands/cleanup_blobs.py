@@ -0,0 +1,26 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+
+from blobs.refs import import_legacy_files, reconcile
+
+
+class Command(BaseCommand):
+    help = 'Recount blob references and delete stored files that nothing points at.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--grace-minutes', type=int, default=60,
+            help='Keep unreferenced blobs younger than this (uploads still being saved).',
+        )
+        parser.add_argument(
+            '--import-legacy', action='store_true',
+            help='First move resumes uploaded before the blob store into it.',
+        )
+
+    def handle(self, *args, **options):
+        if options['import_legacy']:
+            imported = import_legacy_files()
+            self.stdout.write(f'Imported {imported} legacy files.')
+        recounted, deleted = reconcile(timedelta(minutes=options['grace_minutes']))
+        self.stdout.write(self.style.SUCCESS(f'Recounted {recounted} blobs, deleted {deleted} orphaned files.'))
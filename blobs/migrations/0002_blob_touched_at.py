@@ -0,0 +1,19 @@
+# Generated by Django 4.2.9 on 2026-10-18 00:47
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blobs', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='blob',
+            name='touched_at',
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+    ]
@@ -0,0 +1,23 @@
+from django.db import models
+from django.utils import timezone
+
+
+class Blob(models.Model):
+    """
+    One stored file in the content-addressed store.
+
+    ``refcount`` is the number of model file fields currently pointing at
+    ``name``; the blob is deleted from disk when it drops to zero.
+    ``touched_at`` is refreshed whenever the content is stored again, so a
+    blob that an upload has just reused is not deleted before the new
+    reference is counted.
+    """
+    name = models.CharField(max_length=100, unique=True)
+    digest = models.CharField(max_length=64, db_index=True)
+    size = models.PositiveBigIntegerField(default=0)
+    refcount = models.IntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+    touched_at = models.DateTimeField(default=timezone.now)
+
+    def __str__(self):
+        return self.name
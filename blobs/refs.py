@@ -0,0 +1,142 @@
+"""
+Reference counting for content-addressed blobs.
+
+File fields registered with ``track`` adjust ``Blob.refcount`` from model
+signals as rows start or stop pointing at a blob; a blob whose count reaches
+zero is removed once the transaction commits, unless an upload stored the
+same content within ``SAVE_GRACE`` and its reference may not be counted yet
+(``manage.py cleanup_blobs`` collects those later). Files outside the blob tree
+(uploads from before it existed) are left alone. Anything that bypasses
+model signals can be reconciled with ``manage.py cleanup_blobs``.
+"""
+import os
+from datetime import timedelta
+
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .models import Blob
+from .storage import BLOB_ROOT, blob_storage, is_blob
+
+# (model, field name) pairs whose files live in the blob store.
+TRACKED_FIELDS = []
+
+# How long after an upload stored a blob it is kept while unreferenced: the
+# time the form that stored it may take to save the row pointing at it.
+SAVE_GRACE = timedelta(minutes=5)
+
+
+def track(model, field_name):
+    TRACKED_FIELDS.append((model, field_name))
+
+
+def retain(name):
+    if not is_blob(name):
+        return
+    if not Blob.objects.filter(name=name).update(refcount=F('refcount') + 1):
+        Blob.objects.get_or_create(name=name, defaults={'digest': os.path.basename(name)[:64]})
+        Blob.objects.filter(name=name).update(refcount=F('refcount') + 1)
+
+
+def release(name):
+    if not is_blob(name):
+        return
+    Blob.objects.filter(name=name).update(refcount=F('refcount') - 1)
+    transaction.on_commit(lambda: delete_if_orphaned(name))
+
+
+def delete_if_orphaned(name):
+    # The row lock orders this against ContentAddressedStorage._save storing
+    # the same content again.
+    with transaction.atomic():
+        orphaned = Blob.objects.select_for_update().filter(
+            name=name, refcount__lte=0, touched_at__lt=timezone.now() - SAVE_GRACE,
+        )
+        if orphaned.delete()[0]:
+            blob_storage().delete(name)
+
+
+def referenced_names():
+    """``{name: references}`` for every blob currently used by a tracked field."""
+    counts = {}
+    for model, field_name in TRACKED_FIELDS:
+        names = model.objects.filter(**{f'{field_name}__startswith': f'{BLOB_ROOT}/'}).values_list(field_name, flat=True)
+        for name in names.iterator():
+            counts[name] = counts.get(name, 0) + 1
+    return counts
+
+
+def reconcile(grace=timedelta(hours=1)):
+    """
+    Recount references, then delete unreferenced blobs not stored again within ``grace``.
+
+    The grace period covers uploads stored by a form that is still being
+    saved. Returns ``(recounted, deleted)``.
+    """
+    counts = referenced_names()
+    cutoff = timezone.now() - grace
+    storage = blob_storage()
+    recounted = deleted = 0
+
+    for blob in Blob.objects.iterator():
+        refcount = counts.pop(blob.name, 0)
+        if refcount != blob.refcount:
+            Blob.objects.filter(pk=blob.pk).update(refcount=refcount)
+            recounted += 1
+        if not refcount and blob.touched_at < cutoff:
+            with transaction.atomic():
+                stale = Blob.objects.select_for_update().filter(pk=blob.pk, refcount__lte=0, touched_at__lt=cutoff)
+                if stale.delete()[0]:
+                    storage.delete(blob.name)
+                    deleted += 1
+
+    # Referenced files that somehow lost their row get one back.
+    for name, refcount in counts.items():
+        Blob.objects.get_or_create(name=name, defaults={'digest': os.path.basename(name)[:64], 'refcount': refcount})
+        recounted += 1
+
+    # Files on disk with no row at all, e.g. left by an interrupted upload.
+    known = set(Blob.objects.values_list('name', flat=True))
+    root = storage.path(BLOB_ROOT)
+    for directory, _, files in os.walk(root):
+        for filename in files:
+            path = os.path.join(directory, filename)
+            name = os.path.relpath(path, storage.location).replace(os.sep, '/')
+            if name not in known and os.path.getmtime(path) < cutoff.timestamp():
+                os.unlink(path)
+                deleted += 1
+    return recounted, deleted
+
+
+def import_legacy_files():
+    """
+    Move files uploaded before the blob store into it.
+
+    Each tracked row still pointing outside the blob tree is repointed at the
+    blob for its content, and the old file is deleted once no row uses it.
+    Returns the number of rows repointed.
+    """
+    storage = blob_storage()
+    imported, legacy_names = 0, set()
+    for model, field_name in TRACKED_FIELDS:
+        rows = list(
+            model.objects.exclude(**{f'{field_name}__startswith': f'{BLOB_ROOT}/'})
+            .exclude(**{f'{field_name}__isnull': True}).exclude(**{field_name: ''})
+            .values_list('pk', field_name)
+        )
+        for pk, name in rows:
+            if not storage.exists(name):
+                continue
+            with storage.open(name) as legacy:
+                blob = storage.save(name, legacy)
+            with transaction.atomic():
+                model.objects.filter(pk=pk).update(**{field_name: blob})
+                retain(blob)
+            legacy_names.add(name)
+            imported += 1
+
+    for name in legacy_names:
+        if not any(model.objects.filter(**{field_name: name}).exists() for model, field_name in TRACKED_FIELDS):
+            storage.delete(name)
+    return imported
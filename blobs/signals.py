@@ -0,0 +1,40 @@
+from django.db.models.signals import post_delete, post_init, post_save
+
+from accounts.models import CandidateProfile
+from applications.models import Application
+from .refs import release, retain, track
+
+
+def _stored_name(value):
+    return getattr(value, 'name', value) or ''
+
+
+def track_file_field(model, field_name):
+    """Keep blob reference counts in step with ``model.<field_name>``."""
+    attr = f'_blob_{field_name}'
+
+    def remember(sender, instance, **kwargs):
+        # Deferred fields are not loaded here; their previous value is unknown (None).
+        loaded = instance.__dict__
+        setattr(instance, attr, _stored_name(loaded[field_name]) if field_name in loaded else None)
+
+    def on_save(sender, instance, created, **kwargs):
+        previous = '' if created else getattr(instance, attr)
+        current = _stored_name(getattr(instance, field_name))
+        if previous is not None and previous != current:
+            retain(current)
+            release(previous)
+        setattr(instance, attr, current)
+
+    def on_delete(sender, instance, **kwargs):
+        release(_stored_name(getattr(instance, field_name)))
+
+    uid = f'blobs:{model._meta.label}.{field_name}'
+    post_init.connect(remember, sender=model, weak=False, dispatch_uid=uid)
+    post_save.connect(on_save, sender=model, weak=False, dispatch_uid=uid)
+    post_delete.connect(on_delete, sender=model, weak=False, dispatch_uid=uid)
+    track(model, field_name)
+
+
+track_file_field(CandidateProfile, 'resume')
+track_file_field(Application, 'resume')
@@ -0,0 +1,82 @@
+"""
+Content-addressed file storage.
+
+Uploads are hashed while they are streamed to a temporary file and then
+moved to ``blobs/<h0h1>/<h2h3>/<sha256><ext>``. Identical uploads therefore
+land on the same path and are stored once, whatever field or ``upload_to``
+they came through. Which rows use a blob is tracked in ``blobs.models.Blob``
+(see ``blobs.refs``).
+"""
+import hashlib
+import os
+import tempfile
+
+from django.core.files.storage import FileSystemStorage
+from django.db import transaction
+from django.utils import timezone
+from django.utils.functional import SimpleLazyObject
+
+BLOB_ROOT = 'blobs'
+MAX_EXTENSION_LENGTH = 10
+
+
+def blob_name(digest, extension=''):
+    return f'{BLOB_ROOT}/{digest[:2]}/{digest[2:4]}/{digest}{extension}'
+
+
+def is_blob(name):
+    return bool(name) and name.startswith(f'{BLOB_ROOT}/')
+
+
+class ContentAddressedStorage(FileSystemStorage):
+    """``FileSystemStorage`` that names every file after the SHA-256 of its content."""
+
+    def get_available_name(self, name, max_length=None):
+        # The final name is only known once the content is hashed in _save().
+        return name
+
+    def _save(self, name, content):
+        from .models import Blob
+
+        extension = os.path.splitext(name)[1].lower()[:MAX_EXTENSION_LENGTH]
+        tmp_dir = self.path(f'{BLOB_ROOT}/tmp')
+        os.makedirs(tmp_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=tmp_dir)
+        digest, size = hashlib.sha256(), 0
+        try:
+            with os.fdopen(fd, 'wb') as out:
+                for chunk in content.chunks():
+                    digest.update(chunk)
+                    out.write(chunk)
+                    size += len(chunk)
+            name = blob_name(digest.hexdigest(), extension)
+            full_path = self.path(name)
+            # Under the row lock delete_if_orphaned takes: either it already
+            # removed the row (and the file), and both are stored again here,
+            # or the refreshed touched_at keeps it from deleting them until
+            # this upload's reference is counted.
+            with transaction.atomic():
+                _, created = Blob.objects.get_or_create(
+                    name=name, defaults={'digest': digest.hexdigest(), 'size': size},
+                )
+                Blob.objects.select_for_update().filter(name=name).update(touched_at=timezone.now())
+                if created or not os.path.exists(full_path):
+                    os.makedirs(os.path.dirname(full_path), exist_ok=True)
+                    os.replace(tmp_path, full_path)
+                    if self.file_permissions_mode is not None:
+                        os.chmod(full_path, self.file_permissions_mode)
+                else:
+                    os.unlink(tmp_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+        return name
+
+
+_blob_storage = SimpleLazyObject(ContentAddressedStorage)
+
+
+def blob_storage():
+    """Storage callable for ``FileField(storage=...)``; keeps migrations free of settings."""
+    return _blob_storage
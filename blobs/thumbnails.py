@@ -0,0 +1,91 @@
+"""
+Fixed-size, re-encoded derivatives of uploaded images.
+
+A thumbnail is named after the SHA-256 of its source image plus the size,
+``thumbs/<aa>/<sha256>-<size>.<ext>``, so it is generated once per distinct
+image and never goes stale: a new upload has a new hash. The source name ->
+thumbnail name mapping is cached, so rendering a page of avatars costs cache
+lookups, not image reads. Thumbnails are generated when an avatar is saved
+and, for images uploaded before that, on first use.
+"""
+import hashlib
+import io
+import logging
+
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from PIL import Image, ImageOps, UnidentifiedImageError, features
+
+logger = logging.getLogger(__name__)
+
+THUMBNAIL_ROOT = 'thumbs'
+
+# Square edge in pixels; rendered at half this size for sharp 2x displays.
+THUMBNAIL_SIZES = {
+    'small': 72,
+    'medium': 160,
+}
+
+# Refuse to decode images larger than this many pixels (decompression bombs).
+MAX_SOURCE_PIXELS = 40_000_000
+
+THUMBNAIL_FORMAT, THUMBNAIL_EXTENSION = ('WEBP', 'webp') if features.check('webp') else ('JPEG', 'jpg')
+THUMBNAIL_QUALITY = 80
+
+# Remember sources that could not be thumbnailed for a while instead of retrying every render.
+FAILED_TIMEOUT = 60 * 60
+
+
+def _cache_key(source_name, size):
+    digest = hashlib.sha256(source_name.encode()).hexdigest()
+    return f'thumbs:{size}:{digest}'
+
+
+def _render(data, edge):
+    with Image.open(io.BytesIO(data)) as image:
+        if image.width * image.height > MAX_SOURCE_PIXELS:
+            raise ValueError(f'Image too large to thumbnail ({image.width}x{image.height}).')
+        image = ImageOps.exif_transpose(image)
+        has_alpha = 'A' in image.getbands() or 'transparency' in image.info
+        image = image.convert('RGBA' if has_alpha and THUMBNAIL_FORMAT == 'WEBP' else 'RGB')
+        thumbnail = ImageOps.fit(image, (edge, edge), Image.Resampling.LANCZOS)
+        output = io.BytesIO()
+        thumbnail.save(output, THUMBNAIL_FORMAT, quality=THUMBNAIL_QUALITY)
+        return output.getvalue()
+
+
+def generate_thumbnails(field_file):
+    """
+    Create every configured size for an image and cache their names.
+
+    Returns ``{size: thumbnail name}``; empty if the source cannot be read.
+    """
+    source_name = field_file.name
+    try:
+        with field_file.storage.open(source_name, 'rb') as source:
+            data = source.read()
+        digest = hashlib.sha256(data).hexdigest()
+        names = {}
+        for size, edge in THUMBNAIL_SIZES.items():
+            name = f'{THUMBNAIL_ROOT}/{digest[:2]}/{digest}-{size}.{THUMBNAIL_EXTENSION}'
+            if not default_storage.exists(name):
+                name = default_storage.save(name, ContentFile(_render(data, edge)))
+            names[size] = name
+    except (OSError, ValueError, UnidentifiedImageError, Image.DecompressionBombError) as exc:
+        logger.warning('Could not thumbnail %s: %s', source_name, exc)
+        cache.set_many({_cache_key(source_name, size): '' for size in THUMBNAIL_SIZES}, FAILED_TIMEOUT)
+        return {}
+
+    cache.set_many({_cache_key(source_name, size): name for size, name in names.items()}, None)
+    return names
+
+
+def thumbnail_url(field_file, size):
+    """URL of the ``size`` thumbnail of an image, generating it on first use; '' if unavailable."""
+    if not field_file or size not in THUMBNAIL_SIZES:
+        return ''
+    name = cache.get(_cache_key(field_file.name, size))
+    if name is None:
+        name = generate_thumbnails(field_file).get(size, '')
+    return default_storage.url(name) if name else ''
@@ -0,0 +1,187 @@
+"""
+Hiring funnel and time-in-stage analytics over ``applications.ApplicationEvent``.
+
+Everything is computed by the database: the funnel is a grouped ``COUNT
+(DISTINCT ...)``, and time in stage pairs each event with the next one for
+the same application (``LEAD``) before ranking the durations per stage with
+window functions to pick nearest-rank medians and 90th percentiles. Results
+are cached briefly, since they change slowly and scan the whole log; when an
+entry expires, one request per process rebuilds it while concurrent ones wait
+for that result instead of each scanning the log again.
+"""
+import threading
+
+from django.core.cache import cache
+from django.db import connection
+from django.db.models import Count
+
+from applications.models import Application, ApplicationEvent
+from jobs.models import Job
+
+ANALYTICS_CACHE_TIMEOUT = 5 * 60
+
+_build_locks = {}
+_build_locks_guard = threading.Lock()
+
+STAGES = [status for status, _ in Application.STATUS_CHOICES]
+STAGE_LABELS = dict(Application.STATUS_CHOICES)
+
+# Stages worth timing; hired and rejected are terminal.
+TIMED_STAGES = ['applied', 'reviewing', 'shortlisted', 'interview']
+
+GROUP_COLUMNS = {
+    None: "''",
+    'job': 'e.job_id',
+    'department': 'j.department',
+}
+
+TIME_IN_STAGE_SQL = """
+WITH stages AS (
+    SELECT {group} AS grp, e.to_status AS stage, e.created_at AS entered_at,
+           LEAD(e.created_at) OVER (PARTITION BY e.application_id ORDER BY e.created_at, e.id) AS left_at
+    FROM {events} e
+    INNER JOIN {jobs} j ON j.id = e.job_id
+    {where}
+), durations AS (
+    SELECT grp, stage, {seconds} AS seconds
+    FROM stages
+    WHERE left_at IS NOT NULL
+), ranked AS (
+    SELECT grp, stage, seconds,
+           ROW_NUMBER() OVER (PARTITION BY grp, stage ORDER BY seconds) AS rn,
+           COUNT(*) OVER (PARTITION BY grp, stage) AS n
+    FROM durations
+)
+SELECT grp, stage, MAX(n),
+       MIN(CASE WHEN 2 * rn >= n THEN seconds END),
+       MIN(CASE WHEN 10 * rn >= 9 * n THEN seconds END)
+FROM ranked
+GROUP BY grp, stage
+"""
+
+
+def _seconds_between(start, end):
+    if connection.vendor == 'mysql':
+        return f'TIMESTAMPDIFF(MICROSECOND, {start}, {end}) / 1000000.0'
+    if connection.vendor == 'postgresql':
+        return f'EXTRACT(EPOCH FROM ({end} - {start}))'
+    if connection.vendor == 'sqlite':
+        return f'(julianday({end}) - julianday({start})) * 86400.0'
+    raise NotImplementedError(f'Time-in-stage analytics do not support {connection.vendor}.')
+
+
+def format_duration(seconds):
+    if seconds is None:
+        return '—'
+    if seconds < 3600:
+        return f'{max(seconds / 60, 1):.0f}m'
+    if seconds < 86400:
+        return f'{seconds / 3600:.1f}h'
+    return f'{seconds / 86400:.1f}d'
+
+
+def time_in_stage(group=None, job_id=None):
+    """
+    ``{group_value: {stage: {'samples', 'median', 'p90'}}}`` of seconds spent per stage.
+
+    ``group`` is None (one overall group keyed ``''``), ``'job'`` or
+    ``'department'``. Only stages an application has already left are counted.
+    """
+    where, params = '', []
+    if job_id is not None:
+        where, params = 'WHERE e.job_id = %s', [job_id]
+    sql = TIME_IN_STAGE_SQL.format(
+        group=GROUP_COLUMNS[group],
+        events=ApplicationEvent._meta.db_table,
+        jobs=Job._meta.db_table,
+        where=where,
+        seconds=_seconds_between('entered_at', 'left_at'),
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        rows = cursor.fetchall()
+
+    result = {}
+    for grp, stage, samples, median, p90 in rows:
+        result.setdefault(grp, {})[stage] = {
+            'samples': samples,
+            'median': float(median),
+            'p90': float(p90),
+        }
+    return result
+
+
+def funnel_counts(group=None, job_id=None):
+    """``{group_value: {stage: applications that ever reached it}}``."""
+    events = ApplicationEvent.objects.order_by()
+    if job_id is not None:
+        events = events.filter(job_id=job_id)
+    group_field = {None: None, 'job': 'job_id', 'department': 'job__department'}[group]
+    fields = [group_field, 'to_status'] if group_field else ['to_status']
+    counts = events.values(*fields).annotate(reached=Count('application_id', distinct=True))
+
+    result = {}
+    for row in counts:
+        result.setdefault(row[group_field] if group_field else '', {})[row['to_status']] = row['reached']
+    return result
+
+
+def _stage_rows(reached, timings):
+    applied = reached.get('applied', 0)
+    rows = []
+    for stage in STAGES:
+        timing = timings.get(stage, {})
+        rows.append({
+            'stage': stage,
+            'label': STAGE_LABELS[stage],
+            'reached': reached.get(stage, 0),
+            'rate': round(100 * reached.get(stage, 0) / applied) if applied else 0,
+            'timed': stage in TIMED_STAGES,
+            'samples': timing.get('samples', 0),
+            'median': format_duration(timing.get('median')),
+            'p90': format_duration(timing.get('p90')),
+        })
+    return rows
+
+
+def _cached(key, build):
+    value = cache.get(key)
+    if value is not None:
+        return value
+    with _build_locks_guard:
+        lock = _build_locks.setdefault(key, threading.Lock())
+    with lock:
+        value = cache.get(key)
+        if value is None:
+            value = build()
+            cache.set(key, value, ANALYTICS_CACHE_TIMEOUT)
+    return value
+
+
+def pipeline_analytics(job_id=None):
+    """Funnel and time-in-stage rows for every stage, overall or for one job."""
+    def build():
+        reached = funnel_counts(job_id=job_id).get('', {})
+        timings = time_in_stage(job_id=job_id).get('', {})
+        return _stage_rows(reached, timings)
+    key = 'dashboard:analytics:pipeline' + (f':job:{job_id}' if job_id else '')
+    return _cached(key, build)
+
+
+def department_analytics():
+    """Per-department funnel and time-in-stage rows, largest department first."""
+    def build():
+        reached = funnel_counts('department')
+        timings = time_in_stage('department')
+        departments = sorted(reached, key=lambda name: -reached[name].get('applied', 0))
+        return [
+            {
+                'department': department or 'Unassigned',
+                'applied': reached[department].get('applied', 0),
+                'hired': reached[department].get('hired', 0),
+                'stages': [row for row in _stage_rows(reached[department], timings.get(department, {}))
+                           if row['timed']],
+            }
+            for department in departments
+        ]
+    return _cached('dashboard:analytics:departments', build)
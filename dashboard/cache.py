@@ -0,0 +1,98 @@
+"""
+Per-user dashboard caching with generation counters.
+
+Cached contexts are keyed on the current generation of everything they were
+built from: the candidate's own data (applications, profile) and the set of
+jobs. Writers never delete cached entries; they bump a generation, and the
+next read simply misses under the new key while old entries age out.
+"""
+import time
+
+from django.core.cache import cache
+from django.db import transaction
+
+from hr_hiring.routers import use_primary
+
+DASHBOARD_CACHE_TIMEOUT = 15 * 60
+
+JOBS_GENERATION_KEY = 'dashboard:gen:jobs'
+
+# Bumping more users than this is handed to the background workers.
+INLINE_BUMP_LIMIT = 20
+BUMP_TASK_CHUNK_SIZE = 500
+
+
+def user_generation_key(user_id):
+    return f'dashboard:gen:user:{user_id}'
+
+
+def _fresh_generation():
+    # Clock-based so a generation evicted from the cache can never come back
+    # with a value an older cached context was stored under.
+    return time.time_ns()
+
+
+def get_generations(*keys):
+    generations = cache.get_many(keys)
+    for key in keys:
+        if key not in generations:
+            cache.add(key, _fresh_generation(), None)
+            generations[key] = cache.get(key)
+    return [generations[key] for key in keys]
+
+
+def _incr_generation(key):
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, _fresh_generation(), None)
+
+
+def bump_generation(key):
+    """Invalidate every entry built from ``key`` once the current transaction commits."""
+    transaction.on_commit(lambda: _incr_generation(key))
+
+
+def bump_user(user_id):
+    bump_generation(user_generation_key(user_id))
+
+
+def bump_user_generations(user_ids):
+    for user_id in user_ids:
+        _incr_generation(user_generation_key(user_id))
+
+
+def bump_users(user_ids):
+    """
+    ``bump_user`` for many users.
+
+    A few are bumped by one commit hook; a large fan-out (a bulk status change)
+    is queued for the background workers in chunks, committed with the change.
+    """
+    user_ids = list(user_ids)
+    if len(user_ids) <= INLINE_BUMP_LIMIT:
+        if user_ids:
+            transaction.on_commit(lambda: bump_user_generations(user_ids))
+        return
+    from .tasks import bump_dashboards
+    bump_dashboards.enqueue_many([
+        {'user_ids': user_ids[start:start + BUMP_TASK_CHUNK_SIZE]}
+        for start in range(0, len(user_ids), BUMP_TASK_CHUNK_SIZE)
+    ])
+
+
+def bump_jobs():
+    bump_generation(JOBS_GENERATION_KEY)
+
+
+def cached_candidate_dashboard(user_id, build):
+    user_generation, jobs_generation = get_generations(user_generation_key(user_id), JOBS_GENERATION_KEY)
+    key = f'dashboard:candidate:{user_id}:{user_generation}:{jobs_generation}'
+    context = cache.get(key)
+    if context is None:
+        # Built from the primary: this entry lives until the next bump, so it
+        # must not capture a replica that has not caught up with that bump yet.
+        with use_primary():
+            context = build()
+        cache.set(key, context, DASHBOARD_CACHE_TIMEOUT)
+    return context
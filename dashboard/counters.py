@@ -0,0 +1,76 @@
+"""
+Incrementally maintained totals for the HR dashboard.
+
+Counters are adjusted by the signal handlers in ``dashboard.signals`` with
+single ``UPDATE ... SET value = value + n`` statements, so concurrent writers
+never lose increments. Per-job application counts are kept the same way on
+``jobs.JobCard``. Anything that bypasses model signals (``update()``,
+``bulk_create()``, raw SQL) must adjust the counters itself or be followed by
+``manage.py reconcile_counters``.
+"""
+from django.db import transaction
+from django.db.models import Count, F
+
+from accounts.models import User
+from applications.models import Application
+from jobs.cards import refresh_card, sync_application_counts
+from jobs.models import Job, JobCard
+from .models import PipelineCounter
+
+TOTAL_JOBS = 'jobs'
+ACTIVE_JOBS = 'jobs:active'
+TOTAL_APPLICATIONS = 'applications'
+TOTAL_CANDIDATES = 'candidates'
+
+
+def status_counter(status):
+    return f'applications:{status}'
+
+
+def read_counters():
+    """All pipeline counters as a ``{name: value}`` dict, in one query."""
+    return dict(PipelineCounter.objects.values_list('name', 'value'))
+
+
+def bump(name, delta=1):
+    if not delta:
+        return
+    if not PipelineCounter.objects.filter(name=name).update(value=F('value') + delta):
+        PipelineCounter.objects.get_or_create(name=name)
+        PipelineCounter.objects.filter(name=name).update(value=F('value') + delta)
+
+
+def bump_job(job_id, delta=1):
+    """Adjust a job's application count, rebuilding its card from a recount if missing."""
+    if not delta:
+        return
+    if not JobCard.objects.filter(job_id=job_id).update(application_count=F('application_count') + delta):
+        job = Job.objects.filter(pk=job_id).first() if delta > 0 else None
+        if job is not None:
+            refresh_card(job)
+            JobCard.objects.filter(job_id=job_id).update(
+                application_count=Application.objects.filter(job_id=job_id).count()
+            )
+
+
+def rebuild_counters():
+    """Recompute every counter from the source tables."""
+    totals = {
+        TOTAL_JOBS: Job.objects.count(),
+        ACTIVE_JOBS: Job.objects.filter(status='active').count(),
+        TOTAL_APPLICATIONS: Application.objects.count(),
+        TOTAL_CANDIDATES: User.objects.filter(role='candidate').count(),
+    }
+    by_status = dict(
+        Application.objects.order_by().values_list('status').annotate(count=Count('id'))
+    )
+    for status, _ in Application.STATUS_CHOICES:
+        totals[status_counter(status)] = by_status.get(status, 0)
+
+    with transaction.atomic():
+        PipelineCounter.objects.all().delete()
+        PipelineCounter.objects.bulk_create(
+            [PipelineCounter(name=name, value=value) for name, value in totals.items()]
+        )
+        sync_application_counts()
+    return totals
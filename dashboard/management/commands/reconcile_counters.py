@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+
+from dashboard.counters import rebuild_counters
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the HR dashboard counters from the jobs, applications and users tables.'
+
+    def handle(self, *args, **options):
+        totals = rebuild_counters()
+        for name, value in totals.items():
+            self.stdout.write(f'{name}: {value}')
+        self.stdout.write(self.style.SUCCESS('Counters reconciled.'))
@@ -0,0 +1,31 @@
+# Generated by Django 4.2.9 on 2026-10-17 23:22
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('jobs', '0002_job_canonical_skills'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='JobCounter',
+            fields=[
+                ('job', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='counter', serialize=False, to='jobs.job')),
+                ('applications', models.PositiveIntegerField(db_index=True, default=0)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='PipelineCounter',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=50, unique=True)),
+                ('value', models.BigIntegerField(default=0)),
+            ],
+        ),
+    ]
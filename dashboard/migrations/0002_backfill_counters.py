@@ -0,0 +1,43 @@
+from django.db import migrations
+from django.db.models import Count
+
+BATCH_SIZE = 1000
+
+
+def backfill_counters(apps, schema_editor):
+    User = apps.get_model('accounts', 'User')
+    Job = apps.get_model('jobs', 'Job')
+    Application = apps.get_model('applications', 'Application')
+    PipelineCounter = apps.get_model('dashboard', 'PipelineCounter')
+    JobCounter = apps.get_model('dashboard', 'JobCounter')
+
+    totals = {
+        'jobs': Job.objects.count(),
+        'jobs:active': Job.objects.filter(status='active').count(),
+        'applications': Application.objects.count(),
+        'candidates': User.objects.filter(role='candidate').count(),
+    }
+    for status, count in Application.objects.order_by().values_list('status').annotate(n=Count('id')):
+        totals[f'applications:{status}'] = count
+    PipelineCounter.objects.bulk_create(
+        [PipelineCounter(name=name, value=value) for name, value in totals.items()]
+    )
+
+    job_counts = Job.objects.order_by().annotate(n=Count('applications')).values_list('id', 'n')
+    JobCounter.objects.bulk_create(
+        (JobCounter(job_id=job_id, applications=count) for job_id, count in job_counts.iterator()),
+        batch_size=BATCH_SIZE,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dashboard', '0001_initial'),
+        ('accounts', '0001_initial'),
+        ('applications', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_counters, migrations.RunPython.noop),
+    ]
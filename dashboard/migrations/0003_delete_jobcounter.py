@@ -0,0 +1,16 @@
+# Generated by Django 4.2.9 on 2026-10-17 23:24
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dashboard', '0002_backfill_counters'),
+    ]
+
+    operations = [
+        migrations.DeleteModel(
+            name='JobCounter',
+        ),
+    ]
@@ -0,0 +1,10 @@
+from django.db import models
+
+
+class PipelineCounter(models.Model):
+    """A named running total shown on the HR dashboard (see ``dashboard.counters``)."""
+    name = models.CharField(max_length=50, unique=True)
+    value = models.BigIntegerField(default=0)
+
+    def __str__(self):
+        return f"{self.name} = {self.value}"
@@ -0,0 +1,149 @@
+import threading
+
+from django.db import transaction
+from django.db.models import Count
+from django.db.models.signals import m2m_changed, post_delete, post_init, post_save, pre_delete
+from django.dispatch import receiver
+
+from accounts.models import CandidateProfile, User
+from applications.models import Application
+from jobs.models import Job
+from .cache import bump_jobs, bump_user
+from .counters import (
+    ACTIVE_JOBS, TOTAL_APPLICATIONS, TOTAL_CANDIDATES, TOTAL_JOBS, bump, bump_job, status_counter,
+)
+
+
+# Jobs being deleted on this thread. Their applications are uncounted in one
+# go when the delete starts, rather than one by one as the cascade removes them.
+_deleting_jobs = threading.local()
+
+
+def _jobs_being_deleted():
+    if not hasattr(_deleting_jobs, 'ids'):
+        _deleting_jobs.ids = set()
+    return _deleting_jobs.ids
+
+
+# Remember the counted state of each instance as loaded, so saves can apply
+# the difference instead of recounting. Deferred fields are read from
+# ``__dict__`` to avoid a query per instance; their state is unknown (None).
+
+@receiver(post_init, sender=Application)
+def remember_application(sender, instance, **kwargs):
+    loaded = instance.__dict__
+    known = instance.pk and 'job_id' in loaded and 'status' in loaded
+    instance._counted = (loaded['job_id'], loaded['status']) if known else None
+
+
+@receiver(post_init, sender=Job)
+def remember_job(sender, instance, **kwargs):
+    status = instance.__dict__.get('status') if instance.pk else None
+    instance._counted_active = None if status is None else status == 'active'
+
+
+@receiver(post_init, sender=User)
+def remember_user(sender, instance, **kwargs):
+    role = instance.__dict__.get('role') if instance.pk else None
+    instance._counted_candidate = None if role is None else role == 'candidate'
+
+
+@receiver(post_save, sender=Application)
+def count_application_save(sender, instance, created, **kwargs):
+    current = (instance.job_id, instance.status)
+    previous = instance._counted
+    if created:
+        with transaction.atomic():
+            bump(TOTAL_APPLICATIONS)
+            bump(status_counter(instance.status))
+            bump_job(instance.job_id)
+    elif previous is not None and previous != current:
+        with transaction.atomic():
+            bump(status_counter(previous[1]), -1)
+            bump(status_counter(instance.status))
+            bump_job(previous[0], -1)
+            bump_job(instance.job_id)
+    instance._counted = current
+
+
+@receiver(post_delete, sender=Application)
+def count_application_delete(sender, instance, **kwargs):
+    if instance.job_id in _jobs_being_deleted():
+        return
+    with transaction.atomic():
+        bump(TOTAL_APPLICATIONS, -1)
+        bump(status_counter(instance.status), -1)
+        bump_job(instance.job_id, -1)
+
+
+@receiver(post_save, sender=Job)
+def count_job_save(sender, instance, created, **kwargs):
+    active = instance.status == 'active'
+    with transaction.atomic():
+        if created:
+            bump(TOTAL_JOBS)
+            bump(ACTIVE_JOBS, int(active))
+        elif instance._counted_active is not None:
+            bump(ACTIVE_JOBS, int(active) - int(instance._counted_active))
+    instance._counted_active = active
+
+
+@receiver(pre_delete, sender=Job)
+def count_job_applications_delete(sender, instance, **kwargs):
+    statuses = dict(
+        Application.objects.filter(job=instance).order_by().values_list('status').annotate(n=Count('id'))
+    )
+    with transaction.atomic():
+        bump(TOTAL_APPLICATIONS, -sum(statuses.values()))
+        for status, count in statuses.items():
+            bump(status_counter(status), -count)
+    _jobs_being_deleted().add(instance.pk)
+
+
+@receiver(post_delete, sender=Job)
+def count_job_delete(sender, instance, **kwargs):
+    _jobs_being_deleted().discard(instance.pk)
+    with transaction.atomic():
+        bump(TOTAL_JOBS, -1)
+        bump(ACTIVE_JOBS, -int(instance.status == 'active'))
+
+
+@receiver(post_save, sender=User)
+def count_user_save(sender, instance, created, **kwargs):
+    candidate = instance.role == 'candidate'
+    if created:
+        bump(TOTAL_CANDIDATES, int(candidate))
+    elif instance._counted_candidate is not None:
+        bump(TOTAL_CANDIDATES, int(candidate) - int(instance._counted_candidate))
+    instance._counted_candidate = candidate
+
+
+@receiver(post_delete, sender=User)
+def count_user_delete(sender, instance, **kwargs):
+    bump(TOTAL_CANDIDATES, -int(instance.role == 'candidate'))
+
+
+# Dashboard cache invalidation
+
+@receiver(post_save, sender=Application)
+@receiver(post_delete, sender=Application)
+def invalidate_candidate_applications(sender, instance, **kwargs):
+    bump_user(instance.candidate_id)
+
+
+@receiver(post_save, sender=CandidateProfile)
+@receiver(post_delete, sender=CandidateProfile)
+def invalidate_candidate_profile(sender, instance, **kwargs):
+    bump_user(instance.user_id)
+
+
+@receiver(m2m_changed, sender=CandidateProfile.canonical_skills.through)
+def invalidate_candidate_skills(sender, instance, **kwargs):
+    if isinstance(instance, CandidateProfile):
+        bump_user(instance.user_id)
+
+
+@receiver(post_save, sender=Job)
+@receiver(post_delete, sender=Job)
+def invalidate_job_set(sender, **kwargs):
+    bump_jobs()
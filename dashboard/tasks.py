@@ -0,0 +1,7 @@
+from taskqueue.registry import task
+from .cache import bump_user_generations
+
+
+@task(name='dashboard.bump_users')
+def bump_dashboards(payload):
+    bump_user_generations(payload['user_ids'])
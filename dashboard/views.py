@@ -1,46 +1,49 @@
-from django.shortcuts import render, redirect
-from django.contrib.auth.decorators import login_required
-from django.db.models import Count, Q
-from jobs.models import Job
+from asgiref.sync import sync_to_async
+from django.db.models import Count
 from applications.models import Application
-from accounts.models import User, CandidateProfile
+from accounts.models import CandidateProfile
+from hr_hiring.aio import arender, gather_queries, login_required
+from hr_hiring.querybudget import query_budget
+from matching.engine import recommend_jobs
+from .analytics import department_analytics, pipeline_analytics
+from .cache import cached_candidate_dashboard
+from .counters import (
+    ACTIVE_JOBS, TOTAL_APPLICATIONS, TOTAL_CANDIDATES, TOTAL_JOBS, read_counters, status_counter,
+)
 import json
 
 
+@query_budget(10)
 @login_required
-def dashboard_index(request):
+async def dashboard_index(request):
     """Main dashboard - routes to HR or Candidate dashboard."""
     if request.user.is_hr:
-        return hr_dashboard(request)
-    return candidate_dashboard(request)
+        return await hr_dashboard(request)
+    return await candidate_dashboard(request)
 
 
-def hr_dashboard(request):
-    """HR Dashboard with analytics."""
-    total_jobs = Job.objects.count()
-    active_jobs = Job.objects.filter(status='active').count()
-    total_applications = Application.objects.count()
-    total_candidates = User.objects.filter(role='candidate').count()
-
-    # Pipeline stats
-    pipeline_stats = Application.objects.values('status').annotate(
-        count=Count('id')
-    ).order_by('status')
-
-    pipeline_data = {item['status']: item['count'] for item in pipeline_stats}
-
-    # Recent applications
-    recent_applications = Application.objects.select_related(
+def recent_applications():
+    return list(Application.objects.select_related(
         'candidate', 'candidate__candidate_profile', 'job'
-    ).order_by('-applied_at')[:10]
+    ).order_by('-applied_at')[:10])
+
 
-    # Recent jobs
-    recent_jobs = Job.objects.order_by('-created_at')[:5]
+async def hr_dashboard(request):
+    """HR Dashboard with analytics; its independent queries run concurrently."""
+    counters, recent_application_list, stage_rows, department_rows = await gather_queries(
+        read_counters, recent_applications, pipeline_analytics, department_analytics,
+    )
+    total_jobs = counters.get(TOTAL_JOBS, 0)
+    active_jobs = counters.get(ACTIVE_JOBS, 0)
+    total_applications = counters.get(TOTAL_APPLICATIONS, 0)
+    total_candidates = counters.get(TOTAL_CANDIDATES, 0)
 
-    # Jobs with most applications
-    top_jobs = Job.objects.annotate(
-        app_count=Count('applications')
-    ).order_by('-app_count')[:5]
+    # Pipeline stats
+    pipeline_data = {
+        status: counters[status_counter(status)]
+        for status, _ in Application.STATUS_CHOICES
+        if counters.get(status_counter(status))
+    }
 
     # Status distribution for chart
     status_labels = ['Applied', 'Under Review', 'Shortlisted', 'Interview', 'Hired', 'Rejected']
@@ -53,46 +56,50 @@ def hr_dashboard(request):
         'total_applications': total_applications,
         'total_candidates': total_candidates,
         'pipeline_data': pipeline_data,
-        'recent_applications': recent_applications,
-        'recent_jobs': recent_jobs,
-        'top_jobs': top_jobs,
+        'recent_applications': recent_application_list,
+        'stage_rows': stage_rows,
+        'department_rows': department_rows,
         'status_labels': json.dumps(status_labels),
         'status_counts': json.dumps(status_counts),
         'hired_count': pipeline_data.get('hired', 0),
         'interview_count': pipeline_data.get('interview', 0),
         'shortlisted_count': pipeline_data.get('shortlisted', 0),
     }
-    return render(request, 'dashboard/hr_dashboard.html', context)
+    return await arender(request, 'dashboard/hr_dashboard.html', context)
 
 
-def candidate_dashboard(request):
-    """Candidate Dashboard."""
-    profile, created = CandidateProfile.objects.get_or_create(user=request.user)
+async def candidate_dashboard(request):
+    """Candidate Dashboard, served from cache until the candidate's data changes."""
+    user = request.user
+    context = await sync_to_async(cached_candidate_dashboard)(user.pk, lambda: candidate_dashboard_context(user))
+    return await arender(request, 'dashboard/candidate_dashboard.html', context)
+
+
+def candidate_dashboard_context(user):
+    """Build the (cacheable) candidate dashboard context."""
+    profile, created = CandidateProfile.objects.get_or_create(user=user)
 
     my_applications = Application.objects.filter(
-        candidate=request.user
+        candidate=user
     ).select_related('job').order_by('-applied_at')
 
     # Application stats
-    app_stats = my_applications.values('status').annotate(
+    app_stats = my_applications.order_by().values('status').annotate(
         count=Count('id')
     )
     app_data = {item['status']: item['count'] for item in app_stats}
 
-    # Available jobs
+    # Recommended jobs, best match first
     applied_job_ids = my_applications.values_list('job_id', flat=True)
-    available_jobs = Job.objects.filter(status='active').exclude(
-        id__in=applied_job_ids
-    ).order_by('-created_at')[:6]
+    available_jobs = recommend_jobs(profile, exclude=list(applied_job_ids), limit=6)
 
-    context = {
+    return {
         'profile': profile,
-        'my_applications': my_applications[:10],
-        'total_applied': my_applications.count(),
+        'my_applications': list(my_applications[:10]),
+        'total_applied': sum(app_data.values()),
         'app_data': app_data,
         'available_jobs': available_jobs,
         'shortlisted_count': app_data.get('shortlisted', 0),
         'interview_count': app_data.get('interview', 0),
         'hired_count': app_data.get('hired', 0),
     }
-    return render(request, 'dashboard/candidate_dashboard.html', context)
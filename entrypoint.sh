@@ -13,7 +13,7 @@ done
 echo "MySQL is up — starting migrations..."
 
 # Run migrations
-python manage.py makemigrations accounts jobs applications dashboard --noinput
+python manage.py makemigrations accounts jobs applications dashboard search skills blobs taskqueue --noinput
 python manage.py migrate --noinput
 
 # Collect static files
@@ -34,11 +34,19 @@ else:
 "
 
 echo "===========================================" 
-echo "  HireFlow — Starting Gunicorn server..."
+echo "  HireFlow — Starting Gunicorn server (${SERVER_MODE:-wsgi})..."
 echo "===========================================" 
 
+# SERVER_MODE=asgi runs Uvicorn workers, so the async views (dashboard, job and
+# application lists) share each worker's event loop between requests.
+if [ "${SERVER_MODE:-wsgi}" = "asgi" ]; then
+    set -- hr_hiring.asgi:application --worker-class uvicorn.workers.UvicornWorker
+else
+    set -- hr_hiring.wsgi:application
+fi
+
 # Start Gunicorn
-exec gunicorn hr_hiring.wsgi:application \
+exec gunicorn "$@" \
     --bind 0.0.0.0:8000 \
     --workers 3 \
     --timeout 120 \
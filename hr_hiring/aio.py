@@ -0,0 +1,76 @@
+"""
+Helpers for async views.
+
+Django 4.2's async ORM methods (``aget``, ``acount``...) all run on the
+request's single sync thread, so awaiting several at once still runs their
+queries one after another. ``gather_queries`` really overlaps independent
+work. Each blocking function runs on its own pool thread, with that thread's
+own database connection, and the page waits for the slowest query instead
+of the sum of all of them. The calling request's execute wrappers (the
+``QueryBudgetMiddleware`` recorder) are installed on those connections too,
+so query budgets keep counting every query.
+
+Async views also must not touch the lazy ``request.user`` or render
+templates (context processors read it) on the event loop; use
+``aget_user``, the async-aware ``login_required`` and ``arender``.
+"""
+import asyncio
+from contextlib import ExitStack
+from functools import wraps
+
+from asgiref.sync import sync_to_async
+from django.contrib.auth.decorators import login_required as sync_login_required
+from django.contrib.auth.views import redirect_to_login
+from django.db import close_old_connections, connections
+from django.shortcuts import render
+
+
+def _execute_wrappers():
+    return {alias: list(connections[alias].execute_wrappers) for alias in connections}
+
+
+def _run_with_wrappers(func, wrappers):
+    with ExitStack() as stack:
+        for alias, alias_wrappers in wrappers.items():
+            for wrapper in alias_wrappers:
+                stack.enter_context(connections[alias].execute_wrapper(wrapper))
+        try:
+            return func()
+        finally:
+            close_old_connections()
+
+
+async def gather_queries(*funcs):
+    """Run the blocking, independent ``funcs`` concurrently and return their results in order."""
+    wrappers = await sync_to_async(_execute_wrappers)()
+    return await asyncio.gather(*(
+        sync_to_async(_run_with_wrappers, thread_sensitive=False)(func, wrappers) for func in funcs
+    ))
+
+
+def _load_user(request):
+    request.user.is_authenticated  # Resolves the lazy user: session and user queries.
+    return request.user
+
+
+async def aget_user(request):
+    """``request.user``, loaded off the event loop."""
+    return await sync_to_async(_load_user)(request)
+
+
+def login_required(view_func):
+    """``django.contrib.auth``'s ``login_required``, for sync and async views."""
+    if not asyncio.iscoroutinefunction(view_func):
+        return sync_login_required(view_func)
+
+    @wraps(view_func)
+    async def wrapper(request, *args, **kwargs):
+        user = await aget_user(request)
+        if not user.is_authenticated:
+            return redirect_to_login(request.get_full_path())
+        return await view_func(request, *args, **kwargs)
+    return wrapper
+
+
+async def arender(request, template_name, context=None):
+    return await sync_to_async(render)(request, template_name, context)
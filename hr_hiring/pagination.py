@@ -0,0 +1,145 @@
+import base64
+import json
+from datetime import datetime
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db import models
+from django.db.models import Q
+
+PAGE_SIZE = 20
+
+
+class KeysetPage:
+    """One page of a keyset-paginated queryset."""
+
+    def __init__(self, object_list, next_cursor, prev_cursor):
+        self.object_list = object_list
+        self.next_cursor = next_cursor
+        self.prev_cursor = prev_cursor
+        self.next_query = ''
+        self.prev_query = ''
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    @property
+    def has_next(self):
+        return self.next_cursor is not None
+
+    @property
+    def has_previous(self):
+        return self.prev_cursor is not None
+
+    @property
+    def has_other_pages(self):
+        return self.has_next or self.has_previous
+
+
+class KeysetPaginator:
+    """
+    Cursor pagination over a descending (field, pk_field) ordering.
+
+    Every page is fetched with a range condition on the ordering key instead of
+    an OFFSET, so deep pages cost the same as the first one. ``field`` may also
+    be a numeric annotation, and rows may be model instances or ``values()`` dicts.
+    """
+
+    def __init__(self, queryset, field, per_page=PAGE_SIZE, pk_field='id'):
+        self.queryset = queryset
+        self.field = field
+        self.per_page = per_page
+        self.pk_field = pk_field
+
+    @staticmethod
+    def encode_cursor(direction, value, pk):
+        if isinstance(value, datetime):
+            value = {'dt': value.isoformat()}
+        raw = json.dumps([direction, value, pk]).encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+    @property
+    def orders_by_datetime(self):
+        """Whether ``field`` is a date/datetime column, rather than a numeric one or an annotation."""
+        try:
+            return isinstance(self.queryset.model._meta.get_field(self.field), models.DateField)
+        except FieldDoesNotExist:
+            return False
+
+    def decode_cursor(self, cursor):
+        """``(direction, value, pk)`` from a cursor, or ``None`` if it is malformed or of the wrong type."""
+        try:
+            raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+            direction, value, pk = json.loads(raw)
+            if direction not in ('next', 'prev'):
+                return None
+            if self.orders_by_datetime:
+                if not isinstance(value, dict) or not isinstance(value.get('dt'), str):
+                    return None
+                value = datetime.fromisoformat(value['dt'])
+            elif isinstance(value, bool) or not isinstance(value, (int, float)):
+                return None
+            return direction, value, int(pk)
+        except (ValueError, TypeError, KeyError, AttributeError):
+            return None
+
+    def _get(self, row, name):
+        return row[name] if isinstance(row, dict) else getattr(row, name)
+
+    def _cursor_for(self, direction, row):
+        return self.encode_cursor(direction, self._get(row, self.field), self._get(row, self.pk_field))
+
+    def get_page(self, cursor=''):
+        """The page after or before ``cursor``; the first page if there is none or it is unusable."""
+        decoded = self.decode_cursor(cursor) if cursor else None
+        if decoded is not None:
+            try:
+                return self._get_page(decoded)
+            except (TypeError, ValueError, OverflowError):
+                pass  # A hand-made cursor the database cannot compare against.
+        return self._get_page(None)
+
+    def _get_page(self, decoded):
+        field, pk_field = self.field, self.pk_field
+        descending = (f'-{field}', f'-{pk_field}')
+
+        if decoded is None:
+            rows = list(self.queryset.order_by(*descending)[:self.per_page + 1])
+            has_more_after, has_more_before = len(rows) > self.per_page, False
+            rows = rows[:self.per_page]
+        elif decoded[0] == 'next':
+            _, value, pk = decoded
+            rows = list(self.queryset.filter(
+                Q(**{f'{field}__lt': value}) | Q(**{field: value, f'{pk_field}__lt': pk})
+            ).order_by(*descending)[:self.per_page + 1])
+            has_more_after, has_more_before = len(rows) > self.per_page, True
+            rows = rows[:self.per_page]
+        else:
+            _, value, pk = decoded
+            rows = list(self.queryset.filter(
+                Q(**{f'{field}__gt': value}) | Q(**{field: value, f'{pk_field}__gt': pk})
+            ).order_by(field, pk_field)[:self.per_page + 1])
+            has_more_after, has_more_before = True, len(rows) > self.per_page
+            rows = rows[:self.per_page][::-1]
+
+        next_cursor = self._cursor_for('next', rows[-1]) if rows and has_more_after else None
+        prev_cursor = self._cursor_for('prev', rows[0]) if rows and has_more_before else None
+        return KeysetPage(rows, next_cursor, prev_cursor)
+
+
+def keyset_paginate(request, queryset, field, per_page=PAGE_SIZE, pk_field='id'):
+    """Paginate ``queryset`` from the request's ``cursor`` param, keeping other filters."""
+    paginator = KeysetPaginator(queryset, field, per_page, pk_field)
+    page = paginator.get_page(request.GET.get('cursor', ''))
+
+    params = request.GET.copy()
+    params.pop('cursor', None)
+    if page.next_cursor:
+        params['cursor'] = page.next_cursor
+        page.next_query = params.urlencode()
+    if page.prev_cursor:
+        params['cursor'] = page.prev_cursor
+        page.prev_query = params.urlencode()
+    return page
@@ -0,0 +1,177 @@
+"""
+Per-request SQL instrumentation and query budgets.
+
+``QueryBudgetMiddleware`` records every query a request runs (on every
+database alias): the count, total SQL time and fingerprints of queries that
+ran more than once, which is what an N+1 looks like. With ``DEBUG`` on, the
+numbers are sent back as ``X-Query-*`` response headers and logged to the
+``hr_hiring.queries`` logger.
+
+Views declare how many queries they may run with ``@query_budget(n)``,
+applied as the outermost decorator. Going over budget logs a warning; with
+``QUERY_BUDGET_STRICT`` (meant for test runs) it raises ``QueryBudgetExceeded``
+instead, as does a view in a budgeted app that declares no budget, so the
+request fails the test that made it.
+"""
+import logging
+import re
+import time
+from collections import Counter
+from contextlib import ExitStack, contextmanager
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.db import connections
+
+logger = logging.getLogger('hr_hiring.queries')
+
+# Every view in these apps (URL namespaces) must declare a budget.
+BUDGETED_APPS = {'accounts', 'jobs', 'applications', 'dashboard'}
+
+# How many duplicated fingerprints a log line or header lists.
+MAX_REPORTED_DUPLICATES = 5
+
+_IN_LIST_RE = re.compile(r'\bIN \((?:%s|\?)(?:, (?:%s|\?))*\)')
+_LITERAL_RE = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+_SPACE_RE = re.compile(r'\s+')
+
+
+class QueryBudgetExceeded(AssertionError):
+    pass
+
+
+def query_budget(max_queries):
+    """Declare the most queries a view may run per request."""
+    def decorate(view_func):
+        view_func.query_budget = max_queries
+        return view_func
+    return decorate
+
+
+def fingerprint(sql):
+    """Normalize SQL so the same query with different parameters or ``IN`` lists compares equal."""
+    sql = _LITERAL_RE.sub('?', _SPACE_RE.sub(' ', sql).strip())
+    return _IN_LIST_RE.sub('IN (...)', sql)
+
+
+class QueryRecorder:
+    """Database execute wrapper that records each query's fingerprint and duration."""
+
+    def __init__(self):
+        self.queries = []
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries.append((fingerprint(sql), time.perf_counter() - start))
+
+    @property
+    def count(self):
+        return len(self.queries)
+
+    @property
+    def total_time(self):
+        return sum(duration for _, duration in self.queries)
+
+    @property
+    def duplicates(self):
+        """``{fingerprint: times run}`` for queries run more than once, most repeated first."""
+        counts = Counter(sql for sql, _ in self.queries)
+        return {sql: count for sql, count in counts.most_common() if count > 1}
+
+
+@contextmanager
+def record_queries():
+    """
+    Record the queries run inside the block on every database.
+
+        with record_queries() as recorder:
+            client.get(url)
+        assert recorder.count <= 5, recorder.duplicates
+    """
+    recorder = QueryRecorder()
+    with ExitStack() as stack:
+        for connection in connections.all():
+            stack.enter_context(connection.execute_wrapper(recorder))
+        yield recorder
+
+
+class QueryBudgetMiddleware:
+    """Measure each request's queries and check them against the view's budget."""
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        strict = getattr(settings, 'QUERY_BUDGET_STRICT', False)
+        if not (settings.DEBUG or strict):
+            return self.get_response(request)
+
+        with record_queries() as recorder:
+            response = self.get_response(request)
+        return self.report(request, response, recorder, strict)
+
+    async def __acall__(self, request):
+        strict = getattr(settings, 'QUERY_BUDGET_STRICT', False)
+        if not (settings.DEBUG or strict):
+            return await self.get_response(request)
+
+        # Under ASGI the queries run on the request's sync thread, whose
+        # connections are not the event loop's: record there.
+        stack = ExitStack()
+        recorder = await sync_to_async(stack.enter_context)(record_queries())
+        try:
+            response = await self.get_response(request)
+        finally:
+            await sync_to_async(stack.close)()
+        return self.report(request, response, recorder, strict)
+
+    def report(self, request, response, recorder, strict):
+        duplicates = recorder.duplicates
+        response['X-Query-Count'] = str(recorder.count)
+        response['X-Query-Time-Ms'] = f'{recorder.total_time * 1000:.1f}'
+        if duplicates:
+            response['X-Query-Duplicates'] = str(sum(duplicates.values()) - len(duplicates))
+
+        match = request.resolver_match
+        view = match.view_name if match else request.path
+        logger.debug(
+            'Ran %d queries in %.1fms for %s', recorder.count, recorder.total_time * 1000, view,
+            extra={
+                'view': view,
+                'path': request.path,
+                'queries': recorder.count,
+                'sql_time_ms': round(recorder.total_time * 1000, 1),
+                'duplicates': dict(list(duplicates.items())[:MAX_REPORTED_DUPLICATES]),
+            },
+        )
+        self.check_budget(request, view, recorder, strict)
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        request.query_budget = getattr(view_func, 'query_budget', None)
+
+    def check_budget(self, request, view, recorder, strict):
+        budget = getattr(request, 'query_budget', None)
+        match = request.resolver_match
+        if budget is None:
+            if strict and match and BUDGETED_APPS.intersection(match.app_names):
+                raise QueryBudgetExceeded(f'{view} has no query budget; decorate it with @query_budget(n).')
+            return
+        if recorder.count <= budget:
+            return
+        repeated = ''.join(
+            f'\n  {count}x {sql}' for sql, count in list(recorder.duplicates.items())[:MAX_REPORTED_DUPLICATES]
+        )
+        message = f'{view} ran {recorder.count} queries, over its budget of {budget}.{repeated}'
+        if strict:
+            raise QueryBudgetExceeded(message)
+        logger.warning(message)
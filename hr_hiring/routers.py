@@ -0,0 +1,133 @@
+"""
+Read-replica routing with read-your-writes stickiness.
+
+Writes always go to the primary (``default``). Reads go to one of the
+``DATABASE_REPLICAS`` aliases, but only inside a request that
+``ReplicaRoutingMiddleware`` has cleared for it: a safe-method request from
+a client that has not written recently. Once a request writes, the rest of
+it reads from the primary, and the response sets a short-lived cookie that
+keeps the client's next requests on the primary for
+``DATABASE_REPLICA_PIN_SECONDS``, long enough for the replicas to catch up.
+So a candidate who has just applied, or an HR user who has just moved an
+application along, never sees a page built from before their change.
+
+The pin is a cookie rather than a session value because loading the session
+is itself a read that has to be routed first.
+
+Outside requests (management commands, background workers) everything reads
+from the primary, as does any code wrapped in ``use_primary()``: a task
+picked up right after it was queued must see the rows it was queued for.
+"""
+import random
+from contextlib import contextmanager
+
+from asgiref.local import Local
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+
+PIN_COOKIE = 'hireflow_primary'
+
+SAFE_METHODS = {'GET', 'HEAD', 'OPTIONS'}
+
+_state = Local()
+
+
+def replica_aliases():
+    return getattr(settings, 'DATABASE_REPLICAS', [])
+
+
+@contextmanager
+def _routing(replica_reads):
+    previous = getattr(_state, 'replica_reads', False), getattr(_state, 'wrote', False)
+    _state.replica_reads, _state.wrote = replica_reads, False
+    try:
+        yield _state
+    finally:
+        # A write inside a nested block still pins the enclosing request.
+        _state.replica_reads, _state.wrote = previous[0], previous[1] or _state.wrote
+
+
+@contextmanager
+def use_primary():
+    """Read from the primary inside this block, e.g. to fill a cache that outlives replica lag."""
+    with _routing(replica_reads=False):
+        yield
+
+
+def reading_from_replicas():
+    return (
+        getattr(_state, 'replica_reads', False)
+        and not getattr(_state, 'wrote', False)
+        and not connections[DEFAULT_DB_ALIAS].in_atomic_block
+    )
+
+
+class ReplicaRouter:
+    """Send writes to the primary and, where ``ReplicaRoutingMiddleware`` allows it, reads to a replica."""
+
+    def db_for_read(self, model, **hints):
+        replicas = replica_aliases()
+        if not (replicas and reading_from_replicas()):
+            return DEFAULT_DB_ALIAS
+        # One replica per request, so its queries all see the same point in time.
+        if getattr(_state, 'replica', None) not in replicas:
+            _state.replica = random.choice(replicas)
+        return _state.replica
+
+    def db_for_write(self, model, **hints):
+        _state.wrote = True
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        databases = {DEFAULT_DB_ALIAS, *replica_aliases()}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # Replicas get their schema, like their rows, from the primary.
+        return db not in replica_aliases()
+
+
+class ReplicaRoutingMiddleware:
+    """
+    Let safe requests read from the replicas, and pin clients that write to the primary.
+
+    Must come before any middleware that reads the database (sessions,
+    authentication).
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        pinned = request.method not in SAFE_METHODS or PIN_COOKIE in request.COOKIES
+        _state.replica = None
+        with _routing(replica_reads=not pinned) as state:
+            response = self.get_response(request)
+            wrote = state.wrote
+        return self.pin(request, response, wrote)
+
+    async def __acall__(self, request):
+        pinned = request.method not in SAFE_METHODS or PIN_COOKIE in request.COOKIES
+        _state.replica = None
+        with _routing(replica_reads=not pinned) as state:
+            response = await self.get_response(request)
+            wrote = state.wrote
+        return self.pin(request, response, wrote)
+
+    def pin(self, request, response, wrote):
+        if wrote and replica_aliases():
+            response.set_cookie(
+                PIN_COOKIE, '1', max_age=settings.DATABASE_REPLICA_PIN_SECONDS,
+                httponly=True, samesite='Lax', secure=request.is_secure(),
+            )
+        return response
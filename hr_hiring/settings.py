@@ -24,9 +24,21 @@ INSTALLED_APPS = [
     'jobs',
     'applications',
     'dashboard',
+    'search',
+    'skills',
+    'matching',
+    'blobs',
+    'taskqueue',
+    'benchmarks',
+    'transfer',
+    'api',
 ]
 
 MIDDLEWARE = [
+    # First, so it also counts the queries of the middleware below it.
+    'hr_hiring.querybudget.QueryBudgetMiddleware',
+    # Before anything that reads the database, so those reads are routed too.
+    'hr_hiring.routers.ReplicaRoutingMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -71,6 +83,20 @@ DATABASES = {
     }
 }
 
+# Read replicas (hr_hiring/routers.py): MYSQL_REPLICA_HOSTS is a comma-separated
+# list of MySQL replicas of the primary, reached with the same credentials.
+# Safe requests read from them; a client that writes is pinned to the primary
+# for DATABASE_REPLICA_PIN_SECONDS, which should exceed the replication lag.
+for _index, _host in enumerate(filter(None, os.environ.get('MYSQL_REPLICA_HOSTS', '').split(',')), start=1):
+    DATABASES[f'replica{_index}'] = {
+        **DATABASES['default'],
+        'HOST': _host.strip(),
+        'TEST': {'MIRROR': 'default'},
+    }
+DATABASE_REPLICAS = [alias for alias in DATABASES if alias != 'default']
+DATABASE_ROUTERS = ['hr_hiring.routers.ReplicaRouter']
+DATABASE_REPLICA_PIN_SECONDS = int(os.environ.get('DATABASE_REPLICA_PIN_SECONDS', default=10))
+
 AUTH_PASSWORD_VALIDATORS = [
     {'NAME': 'django.contrib.auth.password_validation.UserAttributeSimilarityValidator'},
     {'NAME': 'django.contrib.auth.password_validation.MinimumLengthValidator'},
@@ -80,6 +106,9 @@ AUTH_PASSWORD_VALIDATORS = [
 
 AUTH_USER_MODEL = 'accounts.User'
 
+# Serves request.user from the cache; see accounts/backends.py.
+AUTHENTICATION_BACKENDS = ['accounts.backends.CachedModelBackend']
+
 LANGUAGE_CODE = 'en-us'
 TIME_ZONE = 'Asia/Kolkata'
 USE_I18N = True
@@ -92,6 +121,12 @@ STATIC_ROOT = BASE_DIR / 'staticfiles'
 MEDIA_URL = '/media/'
 MEDIA_ROOT = BASE_DIR / 'media'
 
+# Private media (resumes) is only reachable through permission-checked views.
+# With nginx in front, those views hand the transfer to nginx via
+# X-Accel-Redirect to this internal location (see nginx/default.conf).
+MEDIA_ACCEL_REDIRECT = int(os.environ.get('MEDIA_ACCEL_REDIRECT', default=0))
+PROTECTED_MEDIA_URL = '/protected-media/'
+
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 LOGIN_URL = '/accounts/login/'
@@ -102,5 +137,50 @@ LOGOUT_REDIRECT_URL = '/accounts/login/'
 FILE_UPLOAD_MAX_MEMORY_SIZE = 10 * 1024 * 1024  # 10MB
 DATA_UPLOAD_MAX_MEMORY_SIZE = 10 * 1024 * 1024
 
-# Email backend (console for development)
-EMAIL_BACKEND = 'django.core.mail.backends.console.EmailBackend'
+# Cache: "file" is shared by all workers on a host; "locmem" is per process
+# and suits tests. Any other value is used as a backend import path.
+CACHE_BACKENDS = {
+    'file': 'django.core.cache.backends.filebased.FileBasedCache',
+    'locmem': 'django.core.cache.backends.locmem.LocMemCache',
+    'dummy': 'django.core.cache.backends.dummy.DummyCache',
+}
+CACHE_BACKEND = os.environ.get('CACHE_BACKEND', 'file')
+CACHES = {
+    'default': {
+        'BACKEND': CACHE_BACKENDS.get(CACHE_BACKEND, CACHE_BACKEND),
+        'LOCATION': os.environ.get('CACHE_LOCATION', '/tmp/hireflow_cache'),
+        'TIMEOUT': 300,
+    }
+}
+
+# Sessions are read from the cache and written through to the database, so
+# they survive a cache flush.
+SESSION_ENGINE = os.environ.get('SESSION_ENGINE', 'django.contrib.sessions.backends.cached_db')
+
+# Email backend (console for development; set EMAIL_BACKEND to the SMTP backend in production)
+EMAIL_BACKEND = os.environ.get('EMAIL_BACKEND', 'django.core.mail.backends.console.EmailBackend')
+EMAIL_HOST = os.environ.get('EMAIL_HOST', 'localhost')
+EMAIL_PORT = int(os.environ.get('EMAIL_PORT', default=25))
+EMAIL_HOST_USER = os.environ.get('EMAIL_HOST_USER', '')
+EMAIL_HOST_PASSWORD = os.environ.get('EMAIL_HOST_PASSWORD', '')
+EMAIL_USE_TLS = bool(int(os.environ.get('EMAIL_USE_TLS', default=0)))
+DEFAULT_FROM_EMAIL = os.environ.get('DEFAULT_FROM_EMAIL', 'HireFlow <no-reply@hireflow.local>')
+
+# Query budgets (hr_hiring/querybudget.py): with DEBUG, every response carries
+# X-Query-* headers. Strict mode, for test runs, turns a view going over its
+# budget (or lacking one) into an error instead of a logged warning.
+QUERY_BUDGET_STRICT = int(os.environ.get('QUERY_BUDGET_STRICT', default=0))
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'console': {'class': 'logging.StreamHandler'},
+    },
+    'loggers': {
+        'hr_hiring.queries': {
+            'handlers': ['console'],
+            'level': os.environ.get('QUERY_LOG_LEVEL', 'WARNING'),
+        },
+    },
+}
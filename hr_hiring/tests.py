@@ -0,0 +1,81 @@
+import shutil
+import tempfile
+from unittest import mock
+
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.test import TestCase, TransactionTestCase, override_settings
+
+from accounts.models import CandidateProfile
+from applications.models import Application
+from benchmarks.runner import SKIPPED, _request, iter_targets
+from benchmarks.seed import seed
+from hr_hiring.querybudget import QueryBudgetExceeded, fingerprint, record_queries
+from jobs.models import Job
+from jobs.views import job_detail_view
+
+
+class QueryBudgetTests(TransactionTestCase):
+    """
+    Every budgeted page stays within its ``@query_budget(n)``, measured with strict mode on.
+
+    Not a ``TestCase``: ``gather_queries`` runs queries on other connections,
+    which only see committed rows.
+    """
+
+    def setUp(self):
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root, ignore_errors=True)
+        media = override_settings(MEDIA_ROOT=media_root)
+        media.enable()
+        self.addCleanup(media.disable)
+
+        seed(hr_users=2, candidates=30, jobs=40, applications_per_candidate=3, log=lambda message: None)
+        # The resume views need a row with a file to serve.
+        for row in (CandidateProfile.objects.order_by('pk').first(), Application.objects.order_by('pk').first()):
+            row.resume.save('resume.pdf', ContentFile(b'%PDF-1.4\n'))
+        # Budgets have to hold on a cold cache too.
+        cache.clear()
+
+    @override_settings(QUERY_BUDGET_STRICT=True)
+    def test_views_stay_within_budget(self):
+        skipped, requested = {}, 0
+        for name, role, url, client in iter_targets(skipped=skipped):
+            with self.subTest(view=name, role=role, url=url):
+                try:
+                    response = _request(client, url)
+                except QueryBudgetExceeded as exc:
+                    self.fail(str(exc))
+                self.assertLess(response.status_code, 400)
+                requested += 1
+        self.assertGreater(requested, 0)
+        self.assertEqual(skipped, SKIPPED)
+
+    @override_settings(QUERY_BUDGET_STRICT=True)
+    def test_strict_mode_raises_over_budget(self):
+        name, role, url, client = next(iter_targets(only=['jobs:detail']))
+        with mock.patch.object(job_detail_view, 'query_budget', 0):
+            with self.assertRaisesMessage(QueryBudgetExceeded, 'over its budget of 0'):
+                client.get(url)
+
+
+class FingerprintTests(TestCase):
+
+    def test_literals_and_in_lists_are_normalized(self):
+        self.assertEqual(
+            fingerprint("SELECT *  FROM t\n WHERE id IN (%s, %s, %s) AND name = 'o''neil' AND n > 10"),
+            'SELECT * FROM t WHERE id IN (...) AND name = ? AND n > ?',
+        )
+        self.assertEqual(
+            fingerprint('SELECT * FROM t WHERE id IN (%s)'),
+            fingerprint('SELECT * FROM t WHERE id IN (%s, %s)'),
+        )
+
+    def test_duplicates_counts_repeated_queries(self):
+        with record_queries() as recorder:
+            for pk in (1, 2, 3):
+                list(Job.objects.filter(pk=pk))
+            list(Job.objects.filter(pk__in=[1, 2]))
+            list(Job.objects.filter(pk__in=[1, 2, 3]))
+        self.assertEqual(recorder.count, 5)
+        self.assertEqual(sorted(recorder.duplicates.values()), [2, 3])
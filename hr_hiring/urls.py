@@ -11,6 +11,7 @@ urlpatterns = [
     path('jobs/', include('jobs.urls')),
     path('applications/', include('applications.urls')),
     path('dashboard/', include('dashboard.urls')),
+    path('api/v1/', include('api.urls')),
 ]
 
 if settings.DEBUG:
@@ -6,5 +6,5 @@ from .models import Job
 class JobAdmin(admin.ModelAdmin):
     list_display = ['title', 'department', 'job_type', 'experience_level', 'status', 'posted_by', 'created_at']
     list_filter = ['status', 'job_type', 'experience_level', 'department']
-    search_fields = ['title', 'description', 'skills_required']
+    search_fields = ['title', 'description', 'skills_required', 'external_id']
     date_hierarchy = 'created_at'
@@ -0,0 +1,70 @@
+from django.db import transaction
+from django.db.models import Count, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+from django.utils.text import Truncator
+
+from .models import JobCard, format_salary
+
+EXCERPT_WORDS = 25
+REBUILD_BATCH_SIZE = 500
+
+# Job columns a card is built from; everything else stays off list pages.
+SOURCE_FIELDS = [
+    'id', 'title', 'department', 'location', 'job_type', 'experience_level', 'status',
+    'deadline', 'description', 'skills_required', 'salary_min', 'salary_max', 'created_at',
+]
+
+
+def card_values(job):
+    """Card columns for a job. Migrations that fill cards keep their own copy (see 0004)."""
+    excerpt = Truncator(job.description or '').words(EXCERPT_WORDS)
+    return {
+        'title': job.title,
+        'department': job.department,
+        'location': job.location,
+        'job_type': job.job_type,
+        'experience_level': job.experience_level,
+        'status': job.status,
+        'deadline': job.deadline,
+        'excerpt': excerpt[:JobCard._meta.get_field('excerpt').max_length],
+        'skills': [s.strip() for s in (job.skills_required or '').split(',') if s.strip()],
+        'salary_display': format_salary(job.salary_min, job.salary_max),
+        'salary_min': job.salary_min,
+        'salary_max': job.salary_max,
+        'created_at': job.created_at,
+    }
+
+
+def refresh_card(job):
+    JobCard.objects.update_or_create(job_id=job.pk, defaults=card_values(job))
+
+
+def application_count_subquery(application_model):
+    counts = application_model.objects.filter(job_id=OuterRef('pk')).order_by().values('job_id')
+    return Coalesce(Subquery(counts.annotate(n=Count('id')).values('n')[:1]), Value(0))
+
+
+def sync_application_counts():
+    """Recount every card's applications in a single UPDATE."""
+    from applications.models import Application
+    return JobCard.objects.update(application_count=application_count_subquery(Application))
+
+
+def rebuild_cards():
+    """Rebuild every card from the jobs table. Returns the number of cards written."""
+    from .models import Job
+
+    written = 0
+    with transaction.atomic():
+        JobCard.objects.all().delete()
+        batch = []
+        for job in Job.objects.only(*SOURCE_FIELDS).order_by().iterator(chunk_size=REBUILD_BATCH_SIZE):
+            batch.append(JobCard(job_id=job.pk, **card_values(job)))
+            if len(batch) >= REBUILD_BATCH_SIZE:
+                JobCard.objects.bulk_create(batch)
+                written += len(batch)
+                batch = []
+        JobCard.objects.bulk_create(batch)
+        written += len(batch)
+        sync_application_counts()
+    return written
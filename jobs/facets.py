@@ -0,0 +1,148 @@
+"""
+Result counts for the job board's filter options.
+
+``facet_counts`` tells a candidate how many jobs each option would give, for
+every job type, experience level, top location and salary bucket at once.
+All of them come from a single aggregate query over the active job cards,
+with one conditional ``COUNT`` per option. Each count applies every current
+filter except its own, so the other options of a filter already in use show
+what switching to them would give rather than zero.
+
+Counts are cached per normalized filter combination, keyed on the jobs
+generation that every job save or delete bumps.
+"""
+import hashlib
+import json
+
+from django.core.cache import cache
+from django.db.models import Count, Q
+
+from dashboard.cache import DASHBOARD_CACHE_TIMEOUT, JOBS_GENERATION_KEY, get_generations
+from search.index import query_terms, search_jobs
+from .models import Job, JobCard
+
+TOP_LOCATIONS = 8
+
+# (value, label, lower bound, upper bound) in rupees a year.
+SALARY_BUCKETS = (
+    ('0-5', 'Under ₹5L', None, 500_000),
+    ('5-10', '₹5L - ₹10L', 500_000, 1_000_000),
+    ('10-20', '₹10L - ₹20L', 1_000_000, 2_000_000),
+    ('20+', '₹20L+', 2_000_000, None),
+)
+
+FACETS = ('type', 'experience', 'location', 'salary')
+
+
+def job_filters(params):
+    """The job board filters in ``params`` (e.g. ``request.GET``), stripped."""
+    return {
+        'q': params.get('q', '').strip(),
+        'type': params.get('type', '').strip(),
+        'experience': params.get('experience', '').strip(),
+        'location': params.get('location', '').strip(),
+        'salary': params.get('salary', '').strip(),
+    }
+
+
+def salary_q(lower, upper):
+    """Cards whose salary range overlaps ``[lower, upper)``; undisclosed salaries match no bucket."""
+    condition = Q(salary_min__isnull=False) | Q(salary_max__isnull=False)
+    if lower is not None:
+        condition &= Q(salary_max__gte=lower) | Q(salary_max__isnull=True, salary_min__gte=lower)
+    if upper is not None:
+        condition &= Q(salary_min__lt=upper) | Q(salary_min__isnull=True, salary_max__lt=upper)
+    return condition
+
+
+def option_q(facet, value):
+    if facet == 'type':
+        return Q(job_type=value)
+    if facet == 'experience':
+        return Q(experience_level=value)
+    if facet == 'location':
+        return Q(location__icontains=value)
+    for bucket, label, lower, upper in SALARY_BUCKETS:
+        if bucket == value:
+            return salary_q(lower, upper)
+    return Q(pk__in=[])
+
+
+def filter_q(filters, exclude=None):
+    """The card conditions for every filter in use but ``exclude``; the text query is not one of them."""
+    condition = Q()
+    for facet in FACETS:
+        if facet != exclude and filters[facet]:
+            condition &= option_q(facet, filters[facet])
+    return condition
+
+
+def active_cards(query=''):
+    """Active job cards, narrowed to the jobs matching ``query`` if it has searchable terms."""
+    cards = JobCard.objects.filter(status='active')
+    results = search_jobs(query) if query else None
+    if results is not None:
+        cards = cards.filter(job_id__in=results.values('job_id'))
+    return cards
+
+
+def top_locations(generation):
+    key = f'jobs:facets:locations:{generation}'
+    locations = cache.get(key)
+    if locations is None:
+        locations = list(
+            JobCard.objects.filter(status='active').exclude(location='')
+            .values('location').annotate(jobs=Count('pk')).order_by('-jobs', 'location')
+            .values_list('location', flat=True)[:TOP_LOCATIONS]
+        )
+        cache.set(key, locations, DASHBOARD_CACHE_TIMEOUT)
+    return locations
+
+
+def _cache_key(filters, generation):
+    normalized = {
+        **filters,
+        # Repeats do not change the matches, nor case a substring match. Order
+        # does: the last term matches as a prefix.
+        'q': query_terms(filters['q']),
+        'location': filters['location'].casefold(),
+    }
+    digest = hashlib.md5(json.dumps(normalized, sort_keys=True).encode()).hexdigest()
+    return f'jobs:facets:{generation}:{digest}'
+
+
+def facet_counts(filters):
+    """
+    ``{facet: [{'value', 'label', 'count', 'selected'}]}`` for the filters in use.
+
+    Locations are the ``TOP_LOCATIONS`` most common among all active jobs,
+    counted within the current results.
+    """
+    generation, = get_generations(JOBS_GENERATION_KEY)
+    key = _cache_key(filters, generation)
+    facets = cache.get(key)
+    if facets is None:
+        options = {
+            'type': Job.JOB_TYPE_CHOICES,
+            'experience': Job.EXPERIENCE_CHOICES,
+            'location': [(location, location) for location in top_locations(generation)],
+            'salary': [(value, label) for value, label, lower, upper in SALARY_BUCKETS],
+        }
+        counts = {}
+        for facet, choices in options.items():
+            others = filter_q(filters, exclude=facet)
+            for index, (value, label) in enumerate(choices):
+                counts[f'{facet}_{index}'] = Count('pk', filter=option_q(facet, value) & others)
+        totals = active_cards(filters['q']).aggregate(**counts)
+        facets = {
+            facet: [
+                {'value': value, 'label': label, 'count': totals[f'{facet}_{index}']}
+                for index, (value, label) in enumerate(choices)
+            ]
+            for facet, choices in options.items()
+        }
+        cache.set(key, facets, DASHBOARD_CACHE_TIMEOUT)
+    for facet, rows in facets.items():
+        for row in rows:
+            row['selected'] = row['value'] == filters[facet]
+    return facets
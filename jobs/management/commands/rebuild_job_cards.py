@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from jobs.cards import rebuild_cards
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the JobCard read model used by job list pages.'
+
+    def handle(self, *args, **options):
+        count = rebuild_cards()
+        self.stdout.write(self.style.SUCCESS(f'Rebuilt {count} job cards.'))
@@ -0,0 +1,19 @@
+# Generated by Django 4.2.9 on 2026-10-17 23:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('skills', '0001_initial'),
+        ('jobs', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='job',
+            name='canonical_skills',
+            field=models.ManyToManyField(blank=True, related_name='jobs', to='skills.skill'),
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 4.2.9 on 2026-10-17 23:24
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0002_job_canonical_skills'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='JobCard',
+            fields=[
+                ('job', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='card', serialize=False, to='jobs.job')),
+                ('title', models.CharField(max_length=200)),
+                ('department', models.CharField(blank=True, max_length=100)),
+                ('location', models.CharField(blank=True, max_length=200)),
+                ('job_type', models.CharField(choices=[('full_time', 'Full Time'), ('part_time', 'Part Time'), ('contract', 'Contract'), ('internship', 'Internship'), ('remote', 'Remote')], max_length=20)),
+                ('experience_level', models.CharField(choices=[('entry', 'Entry Level (0-1 years)'), ('junior', 'Junior (1-3 years)'), ('mid', 'Mid Level (3-5 years)'), ('senior', 'Senior (5-8 years)'), ('lead', 'Lead (8+ years)'), ('executive', 'Executive (10+ years)')], max_length=20)),
+                ('status', models.CharField(choices=[('draft', 'Draft'), ('active', 'Active'), ('paused', 'Paused'), ('closed', 'Closed')], max_length=20)),
+                ('deadline', models.DateField(blank=True, null=True)),
+                ('excerpt', models.CharField(blank=True, max_length=400)),
+                ('skills', models.JSONField(blank=True, default=list)),
+                ('salary_display', models.CharField(max_length=80)),
+                ('application_count', models.PositiveIntegerField(db_index=True, default=0)),
+                ('created_at', models.DateTimeField()),
+            ],
+            options={
+                'ordering': ['-created_at'],
+            },
+        ),
+    ]
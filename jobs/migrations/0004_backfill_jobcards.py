@@ -0,0 +1,73 @@
+from django.db import migrations
+from django.db.models import Count, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+from django.utils.text import Truncator
+
+BATCH_SIZE = 500
+
+# A copy of jobs.cards as of this migration: the live module follows the
+# current JobCard, while this must only fill the columns 0003 created.
+EXCERPT_WORDS = 25
+EXCERPT_MAX_LENGTH = 400
+SOURCE_FIELDS = [
+    'id', 'title', 'department', 'location', 'job_type', 'experience_level', 'status',
+    'deadline', 'description', 'skills_required', 'salary_min', 'salary_max', 'created_at',
+]
+
+
+def format_salary(salary_min, salary_max):
+    if salary_min and salary_max:
+        return f"₹{salary_min:,.0f} - ₹{salary_max:,.0f}"
+    elif salary_min:
+        return f"From ₹{salary_min:,.0f}"
+    elif salary_max:
+        return f"Up to ₹{salary_max:,.0f}"
+    return "Not disclosed"
+
+
+def card_values(job):
+    excerpt = Truncator(job.description or '').words(EXCERPT_WORDS)
+    return {
+        'title': job.title,
+        'department': job.department,
+        'location': job.location,
+        'job_type': job.job_type,
+        'experience_level': job.experience_level,
+        'status': job.status,
+        'deadline': job.deadline,
+        'excerpt': excerpt[:EXCERPT_MAX_LENGTH],
+        'skills': [s.strip() for s in (job.skills_required or '').split(',') if s.strip()],
+        'salary_display': format_salary(job.salary_min, job.salary_max),
+        'created_at': job.created_at,
+    }
+
+
+def backfill_job_cards(apps, schema_editor):
+    Job = apps.get_model('jobs', 'Job')
+    JobCard = apps.get_model('jobs', 'JobCard')
+    Application = apps.get_model('applications', 'Application')
+
+    batch = []
+    for job in Job.objects.only(*SOURCE_FIELDS).order_by().iterator(chunk_size=BATCH_SIZE):
+        batch.append(JobCard(job_id=job.pk, **card_values(job)))
+        if len(batch) >= BATCH_SIZE:
+            JobCard.objects.bulk_create(batch)
+            batch = []
+    JobCard.objects.bulk_create(batch)
+
+    counts = Application.objects.filter(job_id=OuterRef('pk')).order_by().values('job_id')
+    JobCard.objects.update(application_count=Coalesce(
+        Subquery(counts.annotate(n=Count('id')).values('n')[:1]), Value(0),
+    ))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0003_jobcard'),
+        ('applications', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_job_cards, migrations.RunPython.noop),
+    ]
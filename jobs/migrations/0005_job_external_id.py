@@ -0,0 +1,18 @@
+# Generated by Django 4.2.9 on 2026-10-17 23:51
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0004_backfill_jobcards'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='job',
+            name='external_id',
+            field=models.CharField(blank=True, help_text='Identifier in the system this job was imported from', max_length=100, null=True, unique=True),
+        ),
+    ]
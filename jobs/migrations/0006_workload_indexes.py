@@ -0,0 +1,25 @@
+# Generated by Django 4.2.9 on 2026-10-18 00:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0005_job_external_id'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(fields=['status', 'created_at'], name='jobs_job_status_277b31_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='jobcard',
+            index=models.Index(fields=['status', 'created_at', 'job'], name='jobs_jobcar_status_322ebe_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='jobcard',
+            index=models.Index(fields=['created_at', 'job'], name='jobs_jobcar_created_134828_idx'),
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 4.2.9 on 2026-10-18 00:30
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def backfill_card_salaries(apps, schema_editor):
+    Job = apps.get_model('jobs', 'Job')
+    JobCard = apps.get_model('jobs', 'JobCard')
+    job = Job.objects.filter(pk=OuterRef('job_id'))
+    JobCard.objects.update(
+        salary_min=Subquery(job.values('salary_min')[:1]),
+        salary_max=Subquery(job.values('salary_max')[:1]),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0006_workload_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='jobcard',
+            name='salary_max',
+            field=models.DecimalField(blank=True, decimal_places=2, max_digits=12, null=True),
+        ),
+        migrations.AddField(
+            model_name='jobcard',
+            name='salary_min',
+            field=models.DecimalField(blank=True, decimal_places=2, max_digits=12, null=True),
+        ),
+        migrations.RunPython(backfill_card_salaries, migrations.RunPython.noop),
+    ]
@@ -1,5 +1,16 @@
 from django.db import models
 from django.conf import settings
+from django.utils.functional import cached_property
+
+
+def format_salary(salary_min, salary_max):
+    if salary_min and salary_max:
+        return f"₹{salary_min:,.0f} - ₹{salary_max:,.0f}"
+    elif salary_min:
+        return f"From ₹{salary_min:,.0f}"
+    elif salary_max:
+        return f"Up to ₹{salary_max:,.0f}"
+    return "Not disclosed"
 
 
 class Job(models.Model):
@@ -32,6 +43,7 @@ class Job(models.Model):
     requirements = models.TextField(blank=True)
     responsibilities = models.TextField(blank=True)
     skills_required = models.TextField(blank=True, help_text='Comma-separated skills')
+    canonical_skills = models.ManyToManyField('skills.Skill', blank=True, related_name='jobs')
     job_type = models.CharField(max_length=20, choices=JOB_TYPE_CHOICES, default='full_time')
     experience_level = models.CharField(max_length=20, choices=EXPERIENCE_CHOICES, default='mid')
     location = models.CharField(max_length=200, blank=True)
@@ -41,16 +53,25 @@ class Job(models.Model):
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='active')
     posted_by = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='posted_jobs')
     deadline = models.DateField(blank=True, null=True)
+    external_id = models.CharField(max_length=100, unique=True, null=True, blank=True,
+                                   help_text='Identifier in the system this job was imported from')
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['status', 'created_at']),
+        ]
 
     def __str__(self):
         return self.title
 
-    @property
+    def save(self, *args, **kwargs):
+        self.__dict__.pop('skills_list', None)
+        super().save(*args, **kwargs)
+
+    @cached_property
     def skills_list(self):
         if self.skills_required:
             return [s.strip() for s in self.skills_required.split(',') if s.strip()]
@@ -62,10 +83,45 @@ class Job(models.Model):
 
     @property
     def salary_display(self):
-        if self.salary_min and self.salary_max:
-            return f"₹{self.salary_min:,.0f} - ₹{self.salary_max:,.0f}"
-        elif self.salary_min:
-            return f"From ₹{self.salary_min:,.0f}"
-        elif self.salary_max:
-            return f"Up to ₹{self.salary_max:,.0f}"
-        return "Not disclosed"
+        return format_salary(self.salary_min, self.salary_max)
+
+
+class JobCard(models.Model):
+    """
+    Compact projection of a Job for list pages.
+
+    Holds only what a job card or table row renders, already parsed and
+    formatted, so lists never load the large TEXT columns or count
+    applications per row. Kept in sync by ``jobs.signals`` and the
+    dashboard counters; ``manage.py rebuild_job_cards`` rebuilds it.
+    """
+    job = models.OneToOneField(Job, on_delete=models.CASCADE, primary_key=True, related_name='card')
+    title = models.CharField(max_length=200)
+    department = models.CharField(max_length=100, blank=True)
+    location = models.CharField(max_length=200, blank=True)
+    job_type = models.CharField(max_length=20, choices=Job.JOB_TYPE_CHOICES)
+    experience_level = models.CharField(max_length=20, choices=Job.EXPERIENCE_CHOICES)
+    status = models.CharField(max_length=20, choices=Job.STATUS_CHOICES)
+    deadline = models.DateField(blank=True, null=True)
+    excerpt = models.CharField(max_length=400, blank=True)
+    skills = models.JSONField(default=list, blank=True)
+    salary_display = models.CharField(max_length=80)
+    salary_min = models.DecimalField(max_digits=12, decimal_places=2, blank=True, null=True)
+    salary_max = models.DecimalField(max_digits=12, decimal_places=2, blank=True, null=True)
+    application_count = models.PositiveIntegerField(default=0, db_index=True)
+    created_at = models.DateTimeField()
+
+    class Meta:
+        ordering = ['-created_at']
+        # Read backwards for the "-created_at, -job_id" list order.
+        indexes = [
+            models.Index(fields=['status', 'created_at', 'job']),
+            models.Index(fields=['created_at', 'job']),
+        ]
+
+    def __str__(self):
+        return self.title
+
+    @property
+    def skills_list(self):
+        return self.skills
@@ -0,0 +1,11 @@
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from .cards import refresh_card
+from .models import Job
+
+
+@receiver(post_save, sender=Job)
+def refresh_job_card(sender, instance, **kwargs):
+    """Cards of deleted jobs go away through the FK cascade."""
+    refresh_card(instance)
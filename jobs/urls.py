@@ -6,6 +6,7 @@ app_name = 'jobs'
 urlpatterns = [
     path('', views.job_list_view, name='list'),
     path('manage/', views.hr_all_jobs_view, name='hr_list'),
+    path('suggest/', views.job_suggest_view, name='suggest'),
     path('create/', views.job_create_view, name='create'),
     path('<int:pk>/', views.job_detail_view, name='detail'),
     path('<int:pk>/edit/', views.job_edit_view, name='edit'),
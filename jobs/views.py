@@ -1,60 +1,101 @@
+import asyncio
+from functools import partial
+
+from asgiref.sync import sync_to_async
 from django.shortcuts import render, redirect, get_object_or_404
-from django.contrib.auth.decorators import login_required
 from django.contrib import messages
-from django.db.models import Q
-from .models import Job
+from django.http import JsonResponse
+from django.db import transaction
+from hr_hiring.aio import aget_user, arender, gather_queries, login_required
+from hr_hiring.pagination import keyset_paginate
+from hr_hiring.querybudget import query_budget
+from dashboard.analytics import pipeline_analytics
+from matching.engine import match_score, rank_applicants
+from search.index import load_jobs, search_jobs
+from search.typeahead import KINDS, suggest
+from .facets import facet_counts, filter_q, job_filters
+from .models import Job, JobCard
 from .forms import JobForm
 
 
 def hr_required(view_func):
-    """Decorator to restrict access to HR users only."""
+    """Decorator to restrict access to HR users only (sync or async views)."""
+    def deny(request):
+        messages.error(request, 'You do not have permission to access this page.')
+        return redirect('dashboard:index')
+
+    if asyncio.iscoroutinefunction(view_func):
+        async def async_wrapper(request, *args, **kwargs):
+            user = await aget_user(request)
+            if not user.is_authenticated or not user.is_hr:
+                return deny(request)
+            return await view_func(request, *args, **kwargs)
+        return async_wrapper
+
     def wrapper(request, *args, **kwargs):
         if not request.user.is_authenticated or not request.user.is_hr:
-            messages.error(request, 'You do not have permission to access this page.')
-            return redirect('dashboard:index')
+            return deny(request)
         return view_func(request, *args, **kwargs)
     return wrapper
 
 
+def paginate_jobs(request, cards, query):
+    """Page through job ``cards``, ranked by relevance when there is a search query."""
+    results = search_jobs(query, within=cards.values('job_id')) if query else None
+    if results is None:
+        return keyset_paginate(request, cards, 'created_at', pk_field='pk')
+
+    page = keyset_paginate(request, results, 'score', pk_field='job_id')
+    page.object_list = load_jobs(page.object_list, JobCard.objects)
+    return page
+
+
+@query_budget(8)
 @login_required
-def job_list_view(request):
+async def job_list_view(request):
     """View all active jobs (for candidates)."""
-    query = request.GET.get('q', '')
-    job_type = request.GET.get('type', '')
-    experience = request.GET.get('experience', '')
-    location = request.GET.get('location', '')
-
-    jobs = Job.objects.filter(status='active')
-
-    if query:
-        jobs = jobs.filter(
-            Q(title__icontains=query) |
-            Q(description__icontains=query) |
-            Q(skills_required__icontains=query) |
-            Q(department__icontains=query)
-        )
-    if job_type:
-        jobs = jobs.filter(job_type=job_type)
-    if experience:
-        jobs = jobs.filter(experience_level=experience)
-    if location:
-        jobs = jobs.filter(location__icontains=location)
+    filters = job_filters(request.GET)
+    jobs = JobCard.objects.filter(status='active').filter(filter_q(filters))
+    paginate = partial(paginate_jobs, request, jobs, filters['q'])
+
+    facets = None
+    if request.user.is_candidate:
+        page, facets = await gather_queries(paginate, partial(facet_counts, filters))
+    else:
+        page = await sync_to_async(paginate)()
 
     context = {
-        'jobs': jobs,
-        'query': query,
-        'job_type': job_type,
-        'experience': experience,
-        'location': location,
+        'jobs': page.object_list,
+        'page_obj': page,
+        'query': filters['q'],
+        'job_type': filters['type'],
+        'experience': filters['experience'],
+        'location': filters['location'],
+        'salary': filters['salary'],
+        'facets': facets,
         'job_type_choices': Job.JOB_TYPE_CHOICES,
         'experience_choices': Job.EXPERIENCE_CHOICES,
     }
 
     if request.user.is_candidate:
-        return render(request, 'jobs/candidate_job_list.html', context)
-    return render(request, 'jobs/hr_job_list.html', context)
+        return await arender(request, 'jobs/candidate_job_list.html', context)
+    return await arender(request, 'jobs/hr_job_list.html', context)
 
 
+@query_budget(3)
+@login_required
+def job_suggest_view(request):
+    """Typeahead suggestions for the job search box, as JSON."""
+    try:
+        limit = max(1, int(request.GET.get('limit', 8)))
+    except ValueError:
+        limit = 8
+    kinds = [kind for kind in request.GET.getlist('kind') if kind in KINDS]
+    query = request.GET.get('q', '')
+    return JsonResponse({'query': query, 'suggestions': suggest(query, kinds, limit)})
+
+
+@query_budget(10)
 @login_required
 def job_detail_view(request, pk):
     """View job details."""
@@ -62,21 +103,34 @@ def job_detail_view(request, pk):
 
     # Check if candidate already applied
     has_applied = False
+    match = None
     if request.user.is_candidate:
         has_applied = job.applications.filter(candidate=request.user).exists()
+        profile = getattr(request.user, 'candidate_profile', None)
+        if profile is not None:
+            match = match_score(profile, job)
 
     context = {
         'job': job,
         'has_applied': has_applied,
+        'match_score': match,
     }
 
     if request.user.is_hr:
-        context['applications'] = job.applications.all().select_related('candidate', 'candidate__candidate_profile')
+        # Best-matching applicants first
+        scores = rank_applicants(job)
+        applications = list(job.applications.all().select_related('candidate', 'candidate__candidate_profile'))
+        for application in applications:
+            application.match_score = scores.get(application.pk, 0)
+        applications.sort(key=lambda application: application.match_score, reverse=True)
+        context['applications'] = applications
+        context['stage_rows'] = pipeline_analytics(job.pk) if applications else []
         return render(request, 'jobs/hr_job_detail.html', context)
 
     return render(request, 'jobs/candidate_job_detail.html', context)
 
 
+@query_budget(25)
 @hr_required
 def job_create_view(request):
     """Create a new job posting (HR only)."""
@@ -85,7 +139,8 @@ def job_create_view(request):
         if form.is_valid():
             job = form.save(commit=False)
             job.posted_by = request.user
-            job.save()
+            with transaction.atomic():
+                job.save()
             messages.success(request, f'Job "{job.title}" has been created successfully.')
             return redirect('jobs:detail', pk=job.pk)
     else:
@@ -94,6 +149,7 @@ def job_create_view(request):
     return render(request, 'jobs/job_form.html', {'form': form, 'action': 'Create'})
 
 
+@query_budget(22)
 @hr_required
 def job_edit_view(request, pk):
     """Edit an existing job posting (HR only)."""
@@ -102,7 +158,8 @@ def job_edit_view(request, pk):
     if request.method == 'POST':
         form = JobForm(request.POST, instance=job)
         if form.is_valid():
-            form.save()
+            with transaction.atomic():
+                form.save()
             messages.success(request, f'Job "{job.title}" has been updated.')
             return redirect('jobs:detail', pk=job.pk)
     else:
@@ -111,40 +168,40 @@ def job_edit_view(request, pk):
     return render(request, 'jobs/job_form.html', {'form': form, 'action': 'Edit', 'job': job})
 
 
+@query_budget(30)
 @hr_required
 def job_delete_view(request, pk):
     """Delete a job posting (HR only)."""
     job = get_object_or_404(Job, pk=pk)
     if request.method == 'POST':
         title = job.title
-        job.delete()
+        with transaction.atomic():
+            job.delete()
         messages.success(request, f'Job "{title}" has been deleted.')
         return redirect('jobs:list')
 
     return render(request, 'jobs/job_confirm_delete.html', {'job': job})
 
 
+@query_budget(8)
 @hr_required
-def hr_all_jobs_view(request):
+async def hr_all_jobs_view(request):
     """View all jobs including drafts (HR only)."""
     query = request.GET.get('q', '')
     status = request.GET.get('status', '')
 
-    jobs = Job.objects.all()
+    jobs = JobCard.objects.all()
 
-    if query:
-        jobs = jobs.filter(
-            Q(title__icontains=query) |
-            Q(description__icontains=query) |
-            Q(skills_required__icontains=query)
-        )
     if status:
         jobs = jobs.filter(status=status)
 
+    page = await sync_to_async(paginate_jobs)(request, jobs, query)
+
     context = {
-        'jobs': jobs,
+        'jobs': page.object_list,
+        'page_obj': page,
         'query': query,
         'status_filter': status,
         'status_choices': Job.STATUS_CHOICES,
     }
-    return render(request, 'jobs/hr_job_list.html', context)
+    return await arender(request, 'jobs/hr_job_list.html', context)
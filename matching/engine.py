@@ -0,0 +1,237 @@
+"""
+Candidate–job matching.
+
+Active jobs are held in memory as a packed bit matrix (one row per job, one
+bit per skill), so scoring a candidate against every job is a handful of
+vectorized NumPy operations instead of a loop over Job objects.
+"""
+import math
+import threading
+import time
+
+import numpy as np
+
+from accounts.models import CandidateProfile
+from hr_hiring.routers import use_primary
+from jobs.models import Job, JobCard
+
+WEIGHT_SKILLS = 0.6
+WEIGHT_EXPERIENCE = 0.25
+WEIGHT_LOCATION = 0.15
+
+# Skill score used for jobs that list no skills at all.
+NEUTRAL_SKILL_SCORE = 0.5
+
+# Years outside the expected range at which the experience score reaches zero.
+EXPERIENCE_TOLERANCE = 4.0
+
+EXPERIENCE_RANGES = {
+    'entry': (0, 1),
+    'junior': (1, 3),
+    'mid': (3, 5),
+    'senior': (5, 8),
+    'lead': (8, math.inf),
+    'executive': (10, math.inf),
+}
+
+# Other workers pick up job changes within this many seconds; the local worker
+# is invalidated immediately by signals.
+JOB_MATRIX_TTL = 300
+
+POPCOUNT = np.array([bin(i).count('1') for i in range(256)], dtype=np.uint8)
+
+
+def _location_key(location):
+    return ' '.join((location or '').lower().split())
+
+
+def _location_matches(job_location, candidate_location):
+    if not job_location or 'remote' in job_location:
+        return True
+    if not candidate_location:
+        return False
+    return job_location in candidate_location or candidate_location in job_location
+
+
+def combine_scores(overlap, required, years, exp_min, exp_max, location_match):
+    """Weighted 0–100 match scores from per-row component arrays."""
+    skills = np.where(required > 0, overlap / np.maximum(required, 1), NEUTRAL_SKILL_SCORE)
+    # Missing experience counts fully against a candidate, surplus only by half.
+    gap = np.maximum(exp_min - years, 0) + 0.5 * np.maximum(years - exp_max, 0)
+    experience = np.clip(1 - gap / EXPERIENCE_TOLERANCE, 0, 1)
+    total = WEIGHT_SKILLS * skills + WEIGHT_EXPERIENCE * experience + WEIGHT_LOCATION * location_match
+    return np.rint(total * 100).astype(np.int16)
+
+
+class JobMatrix:
+    """Column-oriented snapshot of every active job's matching features."""
+
+    def __init__(self, job_ids, skill_bits, skill_counts, exp_min, exp_max,
+                 location_codes, locations, skill_columns):
+        self.job_ids = job_ids
+        self.skill_bits = skill_bits
+        self.skill_counts = skill_counts
+        self.exp_min = exp_min
+        self.exp_max = exp_max
+        self.location_codes = location_codes
+        self.locations = locations
+        self.skill_columns = skill_columns
+        self.built_at = time.monotonic()
+
+    @classmethod
+    def build(cls):
+        # From the primary: the snapshot is kept for JOB_MATRIX_TTL after the
+        # job change that invalidated it.
+        with use_primary():
+            rows = list(
+                Job.objects.filter(status='active').order_by()
+                .values_list('id', 'experience_level', 'location', 'job_type')
+            )
+            links = list(
+                Job.canonical_skills.through.objects.filter(job__status='active')
+                .values_list('job_id', 'skill_id')
+            )
+
+        row_of = {job_id: i for i, (job_id, *_) in enumerate(rows)}
+        skill_columns = {}
+        for _, skill_id in links:
+            skill_columns.setdefault(skill_id, len(skill_columns))
+
+        locations = {}
+        location_codes = np.empty(len(rows), dtype=np.int32)
+        exp_min = np.empty(len(rows), dtype=np.float32)
+        exp_max = np.empty(len(rows), dtype=np.float32)
+        for i, (_, level, location, job_type) in enumerate(rows):
+            key = 'remote' if job_type == 'remote' else _location_key(location)
+            location_codes[i] = locations.setdefault(key, len(locations))
+            exp_min[i], exp_max[i] = EXPERIENCE_RANGES.get(level, (0, math.inf))
+
+        n_bytes = max(1, (len(skill_columns) + 7) // 8)
+        skill_bits = np.zeros((len(rows), n_bytes), dtype=np.uint8)
+        skill_counts = np.zeros(len(rows), dtype=np.int32)
+        if links:
+            link_rows = np.fromiter((row_of[job_id] for job_id, _ in links), dtype=np.int64, count=len(links))
+            link_cols = np.fromiter((skill_columns[s] for _, s in links), dtype=np.int64, count=len(links))
+            masks = (np.uint8(0x80) >> (link_cols & 7).astype(np.uint8)).astype(np.uint8)
+            np.bitwise_or.at(skill_bits, (link_rows, link_cols >> 3), masks)
+            skill_counts = np.bincount(link_rows, minlength=len(rows)).astype(np.int32)
+
+        job_ids = np.fromiter((row[0] for row in rows), dtype=np.int64, count=len(rows))
+        return cls(job_ids, skill_bits, skill_counts, exp_min, exp_max,
+                   location_codes, list(locations), skill_columns)
+
+    def candidate_masks(self, skill_ids):
+        """``{byte_index: bitmask}`` covering the candidate's skills that any job asks for."""
+        masks = {}
+        for skill_id in skill_ids:
+            col = self.skill_columns.get(skill_id)
+            if col is not None:
+                masks[col >> 3] = masks.get(col >> 3, 0) | (0x80 >> (col & 7))
+        return masks
+
+    def score(self, skill_ids, experience_years, location):
+        """Match score (0–100) of one candidate against every job, aligned with ``job_ids``."""
+        # Only the bytes holding the candidate's skills can contribute to the overlap.
+        overlap = np.zeros(len(self.job_ids), dtype=np.int32)
+        for byte, mask in self.candidate_masks(skill_ids).items():
+            overlap += POPCOUNT[self.skill_bits[:, byte] & np.uint8(mask)]
+        candidate_location = _location_key(location)
+        location_match = np.fromiter(
+            (_location_matches(key, candidate_location) for key in self.locations),
+            dtype=np.float32, count=len(self.locations),
+        )[self.location_codes]
+        return combine_scores(overlap, self.skill_counts, float(experience_years),
+                              self.exp_min, self.exp_max, location_match)
+
+
+_job_matrix = None
+_job_matrix_lock = threading.Lock()
+
+
+def get_job_matrix():
+    global _job_matrix
+    with _job_matrix_lock:
+        if _job_matrix is None or time.monotonic() - _job_matrix.built_at > JOB_MATRIX_TTL:
+            _job_matrix = JobMatrix.build()
+        return _job_matrix
+
+
+def invalidate_job_matrix():
+    global _job_matrix
+    with _job_matrix_lock:
+        _job_matrix = None
+
+
+def _profile_skill_ids(profile):
+    return list(profile.canonical_skills.values_list('id', flat=True))
+
+
+def recommend_jobs(profile, exclude=(), limit=6):
+    """Cards of the best-matching active jobs for a profile, with ``match_score`` set on each."""
+    matrix = get_job_matrix()
+    if not len(matrix.job_ids):
+        return []
+
+    scores = matrix.score(_profile_skill_ids(profile), profile.experience_years, profile.location)
+    candidates = np.flatnonzero(~np.isin(matrix.job_ids, list(exclude)))
+    # Highest score first, newest job first among equal scores.
+    order = candidates[np.lexsort((-matrix.job_ids[candidates], -scores[candidates]))]
+
+    # Another worker's matrix may be up to JOB_MATRIX_TTL old, so jobs closed
+    # or deleted since are dropped here and the next best ones take their place.
+    ranked, start = [], 0
+    while len(ranked) < limit and start < len(order):
+        batch = order[start:start + limit - len(ranked)]
+        start += len(batch)
+        job_ids = matrix.job_ids[batch].tolist()
+        jobs = JobCard.objects.filter(status='active').in_bulk(job_ids)
+        for job_id, score in zip(job_ids, scores[batch].tolist()):
+            if job_id in jobs:
+                jobs[job_id].match_score = score
+                ranked.append(jobs[job_id])
+    return ranked
+
+
+def match_score(profile, job):
+    """Match score (0–100) of a single profile against a single job."""
+    required = set(job.canonical_skills.values_list('id', flat=True))
+    overlap = len(required.intersection(_profile_skill_ids(profile)))
+    exp_min, exp_max = EXPERIENCE_RANGES.get(job.experience_level, (0, math.inf))
+    job_location = 'remote' if job.job_type == 'remote' else _location_key(job.location)
+    location_match = _location_matches(job_location, _location_key(profile.location))
+    return int(combine_scores(
+        np.array([overlap]), np.array([len(required)]), float(profile.experience_years),
+        exp_min, exp_max, np.array([float(location_match)]),
+    )[0])
+
+
+def rank_applicants(job):
+    """``{application_id: score}`` for every application to ``job``."""
+    rows = list(
+        job.applications.order_by().values_list(
+            'id', 'candidate__candidate_profile__id',
+            'candidate__candidate_profile__experience_years', 'candidate__candidate_profile__location',
+        )
+    )
+    if not rows:
+        return {}
+
+    required = list(job.canonical_skills.values_list('id', flat=True))
+    row_of = {profile_id: i for i, (_, profile_id, _, _) in enumerate(rows) if profile_id}
+    links = CandidateProfile.canonical_skills.through.objects.filter(
+        candidateprofile_id__in=list(row_of), skill_id__in=required,
+    ).values_list('candidateprofile_id', flat=True)
+    overlap = np.bincount(
+        np.fromiter((row_of[profile_id] for profile_id in links), dtype=np.int64),
+        minlength=len(rows),
+    )
+
+    exp_min, exp_max = EXPERIENCE_RANGES.get(job.experience_level, (0, math.inf))
+    job_location = 'remote' if job.job_type == 'remote' else _location_key(job.location)
+    years = np.array([years or 0 for _, _, years, _ in rows], dtype=np.float32)
+    location_match = np.array(
+        [_location_matches(job_location, _location_key(location)) for _, _, _, location in rows],
+        dtype=np.float32,
+    )
+    scores = combine_scores(overlap, len(required), years, exp_min, exp_max, location_match)
+    return dict(zip((row[0] for row in rows), scores.tolist()))
@@ -0,0 +1,16 @@
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from jobs.models import Job
+from .engine import invalidate_job_matrix
+
+
+@receiver(post_save, sender=Job)
+@receiver(post_delete, sender=Job)
+def job_changed(sender, **kwargs):
+    invalidate_job_matrix()
+
+
+@receiver(m2m_changed, sender=Job.canonical_skills.through)
+def job_skills_changed(sender, **kwargs):
+    invalidate_job_matrix()
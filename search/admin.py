@@ -0,0 +1,18 @@
+from django.contrib import admin
+from .models import JobTerm, ResumeDocument
+
+
+@admin.register(JobTerm)
+class JobTermAdmin(admin.ModelAdmin):
+    list_display = ['term', 'job', 'weight']
+    search_fields = ['term']
+    raw_id_fields = ['job']
+
+
+@admin.register(ResumeDocument)
+class ResumeDocumentAdmin(admin.ModelAdmin):
+    list_display = ['blob', 'status', 'extracted_at']
+    list_filter = ['status']
+    search_fields = ['blob__name']
+    raw_id_fields = ['blob']
+    readonly_fields = ['text', 'error', 'extracted_at']
@@ -0,0 +1,134 @@
+import math
+from collections import Counter
+
+from django.db import transaction
+from django.db.models import Case, Count, F, IntegerField, Max, Q, Sum, Value, When
+
+from jobs.models import Job
+from .models import JobTerm
+from .text import tokenize
+
+# Relative importance of a term depending on the field it appears in.
+FIELD_WEIGHTS = {
+    'title': 5,
+    'skills_required': 3,
+    'department': 2,
+    'description': 1,
+}
+
+# Repeating a word in one field stops adding weight after this many occurrences.
+MAX_TERM_FREQUENCY = 3
+
+INDEX_BATCH_SIZE = 500
+
+
+def build_postings(job):
+    """Return ``{term: weight}`` for a job, summing field-weighted term frequencies."""
+    postings = Counter()
+    for field, field_weight in FIELD_WEIGHTS.items():
+        for term, freq in Counter(tokenize(getattr(job, field))).items():
+            postings[term] += field_weight * min(freq, MAX_TERM_FREQUENCY)
+    return postings
+
+
+def index_job(job):
+    """Replace the postings of a single job."""
+    with transaction.atomic():
+        JobTerm.objects.filter(job=job).delete()
+        JobTerm.objects.bulk_create([
+            JobTerm(term=term, job=job, weight=weight)
+            for term, weight in build_postings(job).items()
+        ], batch_size=INDEX_BATCH_SIZE)
+
+
+def rebuild_index():
+    """Rebuild the whole index from the jobs table. Returns the number of jobs indexed."""
+    fields = ['id', *FIELD_WEIGHTS]
+    indexed = 0
+    with transaction.atomic():
+        JobTerm.objects.all().delete()
+        batch = []
+        for job in Job.objects.only(*fields).order_by().iterator(chunk_size=INDEX_BATCH_SIZE):
+            batch.extend(
+                JobTerm(term=term, job_id=job.pk, weight=weight)
+                for term, weight in build_postings(job).items()
+            )
+            indexed += 1
+            if len(batch) >= INDEX_BATCH_SIZE:
+                JobTerm.objects.bulk_create(batch)
+                batch = []
+        JobTerm.objects.bulk_create(batch)
+    return indexed
+
+
+def query_terms(query):
+    return list(dict.fromkeys(tokenize(query)))
+
+
+def prefix_q(prefix):
+    """Terms starting with ``prefix``, as a range the term index can serve (unlike LIKE on SQLite)."""
+    return Q(term__gte=prefix, term__lt=prefix + '\U0010ffff')
+
+
+def _idf_weights(terms, prefix):
+    """
+    Integer inverse-document-frequency weights (x100) for the whole query
+    terms, and one for the jobs having any term that starts with ``prefix``.
+
+    The highest job id stands in for the corpus size: it is an index-only lookup
+    and only ever overestimates, which keeps the relative ordering of terms intact.
+    Weights are missing for terms (or a prefix) in no document at all.
+    """
+    corpus_size = Job.objects.aggregate(n=Max('id'))['n'] or 0
+    lookups = [Q(term=term) for term in terms] + [prefix_q(prefix)]
+    doc_freqs = JobTerm.objects.filter(Q(term__in=terms) | prefix_q(prefix)).aggregate(**{
+        f'df{i}': Count('job_id', distinct=True, filter=lookup) for i, lookup in enumerate(lookups)
+    })
+    weights = [
+        max(1, round(100 * math.log(1 + corpus_size / doc_freqs[f'df{i}']))) if doc_freqs[f'df{i}'] else None
+        for i in range(len(lookups))
+    ]
+    return {term: weight for term, weight in zip(terms, weights) if weight}, weights[-1]
+
+
+def search_jobs(query, within=None):
+    """
+    Relevance-ranked job matches for ``query``.
+
+    Returns a ``values()`` queryset of ``{'job_id', 'score'}`` rows for jobs
+    containing every query term, or ``None`` when the query is blank. The
+    last term matches as a prefix, so a word still being typed ("pyth")
+    finds its jobs. A query with nothing searchable in it (only stopwords
+    or punctuation) matches no jobs rather than all of them. ``within``
+    restricts matches to a job queryset (e.g. other filters).
+    """
+    if not query.strip():
+        return None
+    *terms, prefix = query_terms(query) or ['']
+
+    postings = JobTerm.objects.filter(Q(term__in=terms) | prefix_q(prefix))
+    if within is not None:
+        postings = postings.filter(job__in=within)
+    idf, prefix_idf = _idf_weights(terms, prefix) if prefix else ({}, None)
+    if len(idf) < len(terms) or prefix_idf is None:
+        # A term (or prefix) that is in no document at all can never be matched.
+        postings = postings.none()
+
+    whens = [When(term=term, then=Value(weight)) for term, weight in idf.items()]
+    whens.append(When(prefix_q(prefix), then=Value(prefix_idf or 0)))
+    rows = postings.values('job_id').annotate(
+        prefixed=Count('id', filter=prefix_q(prefix)),
+        score=Sum(F('weight') * Case(*whens, default=Value(0), output_field=IntegerField())),
+    ).filter(prefixed__gt=0)
+    if terms:
+        rows = rows.annotate(matched=Count('id', filter=Q(term__in=terms))).filter(matched=len(terms))
+    return rows
+
+
+def load_jobs(rows, queryset=None):
+    """
+    Turn ``search_jobs`` result rows into objects keyed by job id (Job, or
+    whatever model ``queryset`` is over), keeping rank order.
+    """
+    jobs = (Job.objects if queryset is None else queryset).in_bulk([row['job_id'] for row in rows])
+    return [jobs[row['job_id']] for row in rows if row['job_id'] in jobs]
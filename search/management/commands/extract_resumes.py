@@ -0,0 +1,30 @@
+from django.core.management.base import BaseCommand
+
+from search.resumes import extract_pending, queue_missing_documents
+
+
+class Command(BaseCommand):
+    help = 'Extract and index the text of stored resumes that have not been processed yet.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--workers', type=int, default=None,
+                            help='Extraction processes (default: one per CPU).')
+        parser.add_argument('--retry-failed', action='store_true',
+                            help='Also retry resumes whose extraction failed.')
+        parser.add_argument('--all', action='store_true',
+                            help='Re-extract every resume, e.g. after improving an extractor.')
+
+    def handle(self, *args, **options):
+        queued = queue_missing_documents()
+        if queued:
+            self.stdout.write(f'Queued {queued} resumes without a document.')
+
+        statuses = ['pending']
+        if options['retry_failed'] or options['all']:
+            statuses.append('failed')
+        if options['all']:
+            statuses.extend(['indexed', 'unsupported'])
+
+        results = extract_pending(statuses, workers=options['workers'])
+        summary = ', '.join(f'{count} {status}' for status, count in sorted(results.items())) or 'nothing to do'
+        self.stdout.write(self.style.SUCCESS(f'Resume extraction finished: {summary}.'))
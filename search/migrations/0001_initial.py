@@ -0,0 +1,28 @@
+# Generated by Django 4.2.9 on 2026-10-17 23:17
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('jobs', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='JobTerm',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('term', models.CharField(max_length=64)),
+                ('weight', models.PositiveIntegerField(default=1)),
+                ('job', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='search_terms', to='jobs.job')),
+            ],
+            options={
+                'unique_together': {('term', 'job')},
+            },
+        ),
+    ]
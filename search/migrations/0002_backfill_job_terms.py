@@ -0,0 +1,29 @@
+from django.db import migrations
+
+
+def backfill_job_terms(apps, schema_editor):
+    from search.index import FIELD_WEIGHTS, INDEX_BATCH_SIZE, build_postings
+
+    Job = apps.get_model('jobs', 'Job')
+    JobTerm = apps.get_model('search', 'JobTerm')
+    batch = []
+    for job in Job.objects.only('id', *FIELD_WEIGHTS).order_by().iterator(chunk_size=INDEX_BATCH_SIZE):
+        batch.extend(
+            JobTerm(term=term, job_id=job.pk, weight=weight)
+            for term, weight in build_postings(job).items()
+        )
+        if len(batch) >= INDEX_BATCH_SIZE:
+            JobTerm.objects.bulk_create(batch)
+            batch = []
+    JobTerm.objects.bulk_create(batch)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('search', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_job_terms, migrations.RunPython.noop),
+    ]
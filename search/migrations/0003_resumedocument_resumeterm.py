@@ -0,0 +1,37 @@
+# Generated by Django 4.2.9 on 2026-10-17 23:36
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blobs', '0001_initial'),
+        ('search', '0002_backfill_job_terms'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ResumeDocument',
+            fields=[
+                ('blob', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='resume_document', serialize=False, to='blobs.blob')),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('indexed', 'Indexed'), ('unsupported', 'Unsupported format'), ('failed', 'Failed')], db_index=True, default='pending', max_length=12)),
+                ('text', models.TextField(blank=True)),
+                ('error', models.CharField(blank=True, max_length=255)),
+                ('extracted_at', models.DateTimeField(blank=True, null=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='ResumeTerm',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('term', models.CharField(max_length=64)),
+                ('weight', models.PositiveIntegerField(default=1)),
+                ('document', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='terms', to='search.resumedocument')),
+            ],
+            options={
+                'unique_together': {('term', 'document')},
+            },
+        ),
+    ]
@@ -0,0 +1,48 @@
+from django.db import models
+from jobs.models import Job
+
+
+class JobTerm(models.Model):
+    """One posting in the inverted index: a stemmed term and its weight in a job."""
+    term = models.CharField(max_length=64)
+    job = models.ForeignKey(Job, on_delete=models.CASCADE, related_name='search_terms')
+    weight = models.PositiveIntegerField(default=1)
+
+    class Meta:
+        unique_together = ['term', 'job']
+
+    def __str__(self):
+        return f"{self.term} → job #{self.job_id} ({self.weight})"
+
+
+class ResumeDocument(models.Model):
+    """Plain text extracted from one stored resume file (``blobs.Blob``)."""
+    STATUS_CHOICES = (
+        ('pending', 'Pending'),
+        ('indexed', 'Indexed'),
+        ('unsupported', 'Unsupported format'),
+        ('failed', 'Failed'),
+    )
+
+    blob = models.OneToOneField('blobs.Blob', on_delete=models.CASCADE, primary_key=True,
+                                related_name='resume_document')
+    status = models.CharField(max_length=12, choices=STATUS_CHOICES, default='pending', db_index=True)
+    text = models.TextField(blank=True)
+    error = models.CharField(max_length=255, blank=True)
+    extracted_at = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self):
+        return f"{self.blob_id}: {self.status}"
+
+
+class ResumeTerm(models.Model):
+    """One posting in the resume index: a stemmed term and its frequency in a resume."""
+    term = models.CharField(max_length=64)
+    document = models.ForeignKey(ResumeDocument, on_delete=models.CASCADE, related_name='terms')
+    weight = models.PositiveIntegerField(default=1)
+
+    class Meta:
+        unique_together = ['term', 'document']
+
+    def __str__(self):
+        return f"{self.term} → resume #{self.document_id} ({self.weight})"
@@ -0,0 +1,175 @@
+"""
+Resume text extraction and the resume search index.
+
+Every stored resume blob gets a ``ResumeDocument``. Text is pulled out of
+PDF, DOCX and TXT files off the request path: new uploads are queued for the
+background workers (``search.tasks``), and ``manage.py extract_resumes``
+works through anything still pending (or a full backfill) with a process
+pool. Extracted text is tokenized into
+``ResumeTerm`` postings, so matching resumes is an index lookup, not a scan.
+"""
+import os
+import zipfile
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from xml.etree import ElementTree
+
+from django.db import transaction
+from django.db.models import Count
+from django.utils import timezone
+
+from accounts.models import RESUME_EXTENSIONS
+from blobs.models import Blob
+from blobs.storage import blob_storage
+from .index import MAX_TERM_FREQUENCY, query_terms
+from .models import ResumeDocument, ResumeTerm
+from .text import tokenize
+
+# Longer resumes are truncated; this is already dozens of pages of text.
+MAX_TEXT_LENGTH = 200_000
+
+EXTRACT_BATCH_SIZE = 100
+INDEX_BATCH_SIZE = 500
+
+WORD_NAMESPACE = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+
+
+class UnsupportedFormat(Exception):
+    pass
+
+
+def _pdf_text(path):
+    try:
+        from pypdf import PdfReader
+    except ImportError:
+        raise UnsupportedFormat('PDF extraction needs the pypdf package.')
+    parts, length = [], 0
+    for page in PdfReader(path).pages:
+        text = page.extract_text() or ''
+        parts.append(text)
+        length += len(text)
+        if length >= MAX_TEXT_LENGTH:
+            break
+    return '\n'.join(parts)
+
+
+def _docx_text(path):
+    parts = []
+    with zipfile.ZipFile(path) as archive, archive.open('word/document.xml') as document:
+        for _, element in ElementTree.iterparse(document):
+            if element.tag == f'{WORD_NAMESPACE}t':
+                parts.append(element.text or '')
+            elif element.tag == f'{WORD_NAMESPACE}p':
+                parts.append('\n')
+                element.clear()
+    return ''.join(parts)
+
+
+def _plain_text(path):
+    with open(path, 'rb') as handle:
+        return handle.read(MAX_TEXT_LENGTH * 4).decode('utf-8', errors='replace')
+
+
+_EXTRACTOR_FUNCTIONS = {
+    'pdf': _pdf_text,
+    'docx': _docx_text,
+    'txt': _plain_text,
+}
+# One per accepted upload type; a type without an extractor fails at import.
+EXTRACTORS = {f'.{extension}': _EXTRACTOR_FUNCTIONS[extension] for extension in RESUME_EXTENSIONS}
+
+
+def extract_text(path):
+    """
+    Return ``(status, text, error)`` for the file at ``path``.
+
+    Pure function of the file, with no database access, so it can run in a
+    separate process.
+    """
+    extractor = EXTRACTORS.get(os.path.splitext(path)[1].lower())
+    try:
+        if extractor is None:
+            raise UnsupportedFormat(f'No text extractor for "{os.path.splitext(path)[1]}" files.')
+        return 'indexed', extractor(path)[:MAX_TEXT_LENGTH].replace('\x00', ''), ''
+    except UnsupportedFormat as exc:
+        return 'unsupported', '', str(exc)
+    except Exception as exc:  # Corrupt or hostile files must not stop the pipeline.
+        return 'failed', '', f'{type(exc).__name__}: {exc}'[:255]
+
+
+def build_resume_postings(text):
+    return {term: min(freq, MAX_TERM_FREQUENCY) for term, freq in Counter(tokenize(text)).items()}
+
+
+def save_extraction(blob_id, status, text, error):
+    """Store an extraction result and replace the resume's postings."""
+    with transaction.atomic():
+        updated = ResumeDocument.objects.filter(pk=blob_id).update(
+            status=status, text=text, error=error, extracted_at=timezone.now(),
+        )
+        if not updated:
+            return  # The blob was deleted while it was being extracted.
+        ResumeTerm.objects.filter(document_id=blob_id).delete()
+        ResumeTerm.objects.bulk_create([
+            ResumeTerm(term=term, document_id=blob_id, weight=weight)
+            for term, weight in build_resume_postings(text).items()
+        ], batch_size=INDEX_BATCH_SIZE)
+
+
+def extract_document(blob_id):
+    """Extract and index one resume in the current process."""
+    name = Blob.objects.filter(pk=blob_id).values_list('name', flat=True).first()
+    if name is not None:
+        save_extraction(blob_id, *extract_text(blob_storage().path(name)))
+
+
+def queue_missing_documents():
+    """Create pending documents for blobs that have none. Returns how many were added."""
+    missing = Blob.objects.filter(resume_document__isnull=True).values_list('pk', flat=True)
+    documents = [ResumeDocument(blob_id=blob_id) for blob_id in missing.iterator()]
+    ResumeDocument.objects.bulk_create(documents, batch_size=INDEX_BATCH_SIZE, ignore_conflicts=True)
+    return len(documents)
+
+
+def extract_pending(statuses=('pending',), workers=None):
+    """
+    Extract every document in ``statuses`` with a pool of ``workers`` processes.
+
+    Parsing runs in the pool; results are written back from this process in
+    batches. Returns a ``Counter`` of resulting statuses.
+    """
+    storage = blob_storage()
+    results = Counter()
+    last_pk = 0
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        while True:
+            batch = list(
+                ResumeDocument.objects.filter(status__in=statuses, pk__gt=last_pk)
+                .order_by('pk').values_list('pk', 'blob__name')[:EXTRACT_BATCH_SIZE]
+            )
+            if not batch:
+                break
+            paths = [storage.path(name) for _, name in batch]
+            for (blob_id, _), result in zip(batch, pool.map(extract_text, paths)):
+                save_extraction(blob_id, *result)
+                results[result[0]] += 1
+            last_pk = batch[-1][0]
+    return results
+
+
+def search_resumes(query):
+    """
+    Names of stored resumes containing every term of ``query``.
+
+    Returns a ``values_list`` queryset suitable for ``resume__in=...``, or
+    ``None`` when the query has no searchable terms.
+    """
+    terms = query_terms(query)
+    if not terms:
+        return None
+    documents = (
+        ResumeTerm.objects.filter(term__in=terms).order_by()
+        .values('document_id').annotate(matched=Count('id')).filter(matched=len(terms))
+        .values('document_id')
+    )
+    return Blob.objects.filter(pk__in=documents).values_list('name', flat=True)
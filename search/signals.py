@@ -0,0 +1,34 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from blobs.models import Blob
+from jobs.models import Job
+from .index import index_job
+from .models import ResumeDocument
+from .tasks import schedule_extraction
+from .typeahead import job_phrases, update_job
+
+
+@receiver(post_save, sender=Job)
+def reindex_job(sender, instance, **kwargs):
+    """Keep the index current; deleted jobs drop their postings via FK cascade."""
+    index_job(instance)
+
+
+@receiver(post_save, sender=Job)
+@receiver(post_delete, sender=Job)
+def refresh_typeahead(sender, instance, signal, **kwargs):
+    phrases = None
+    if signal is post_save and instance.status == 'active':
+        phrases = job_phrases(instance.title, instance.department, instance.location, instance.skills_list)
+    job_id = instance.pk
+    transaction.on_commit(lambda: update_job(job_id, phrases))
+
+
+@receiver(post_save, sender=Blob)
+def queue_resume_extraction(sender, instance, created, **kwargs):
+    """Index each newly stored resume off the request path."""
+    if created:
+        ResumeDocument.objects.get_or_create(blob=instance)
+        schedule_extraction(instance.pk)
@@ -0,0 +1,12 @@
+from taskqueue.registry import task
+from .resumes import extract_document
+
+
+@task(name='search.extract_resume', max_attempts=3)
+def extract_resume(payload):
+    extract_document(payload['blob_id'])
+
+
+def schedule_extraction(blob_id):
+    """Extract and index a stored resume on a background worker."""
+    extract_resume.enqueue({'blob_id': blob_id}, key=f'extract-resume:{blob_id}')
@@ -0,0 +1,57 @@
+import re
+
+TOKEN_RE = re.compile(r'[^\W_][\w+#]*(?:\.[^\W_][\w+#]*)*')
+MAX_TERM_LENGTH = 64
+
+STOPWORDS = frozenset("""
+a an and are as at be but by for from has have in into is it its of on or
+our that the their this to was we were will with you your
+""".split())
+
+VOWELS = set('aeiouy')
+
+
+def stem(word):
+    """
+    Light suffix-stripping stemmer.
+
+    It only needs to be consistent between indexing and querying, so it trades
+    linguistic accuracy for predictability: developer/developers/developing all
+    reduce to "develop", while technical tokens like c++ or node.js are kept as-is.
+    """
+    if len(word) <= 3 or not word.isalpha():
+        return word
+
+    if word.endswith('ies') and len(word) > 4:
+        word = word[:-3] + 'y'
+    elif word.endswith('sses'):
+        word = word[:-2]
+    elif word.endswith('s') and not word.endswith(('ss', 'us', 'is')):
+        word = word[:-1]
+
+    for suffix in ('ing', 'ed'):
+        stripped = word[:-len(suffix)]
+        if word.endswith(suffix) and len(stripped) >= 3 and VOWELS & set(stripped):
+            word = stripped
+            if len(word) > 3 and word[-1] == word[-2] and word[-1] not in 'lsz':
+                word = word[:-1]
+            break
+
+    for suffix in ('ation', 'ment', 'ness', 'er'):
+        if word.endswith(suffix) and len(word) - len(suffix) >= 4:
+            word = word[:-len(suffix)]
+            break
+
+    if word.endswith('e') and len(word) > 4:
+        word = word[:-1]
+    return word
+
+
+def tokenize(text):
+    """Split text into stemmed index terms, dropping stopwords."""
+    terms = []
+    for token in TOKEN_RE.findall((text or '').lower()):
+        if token in STOPWORDS:
+            continue
+        terms.append(stem(token)[:MAX_TERM_LENGTH])
+    return terms
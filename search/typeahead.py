@@ -0,0 +1,210 @@
+"""
+Typeahead suggestions for the job search box.
+
+Every distinct job title, skill, department and location among the active
+jobs is a suggestion, ranked by how many active jobs use it. Lookups run
+against an in-memory sorted array of keys, with one key per word a
+suggestion starts at, so "dev" finds "Senior Developer" too. A prefix is
+two bisections and a scan of the matching range, with no database access.
+
+Each worker keeps the index in memory. Workers share it through a compact
+snapshot in the cache: zlib-compressed JSON of the suggestions and the
+suggestion ids of each job. A version token is kept next to it, and a
+worker reloads the snapshot when the token changes, instead of querying
+the database. A job save or delete replaces just that job's entry
+(``update_job``), drops suggestions no job uses any more and publishes a
+new snapshot. Concurrent updates from different workers can lose one of
+them, so the index is also rebuilt from scratch every
+``TYPEAHEAD_REBUILD_SECONDS``. The rebuild is due in every worker at the
+same moment; the one that takes ``REBUILD_LOCK_KEY`` runs it, and the
+others keep their index until its snapshot is published.
+"""
+import heapq
+import json
+import threading
+import time
+import zlib
+from bisect import bisect_left
+
+from django.core.cache import cache
+
+from hr_hiring.routers import use_primary
+from jobs.models import JobCard
+
+SNAPSHOT_KEY = 'search:typeahead:snapshot'
+VERSION_KEY = 'search:typeahead:version'
+REBUILD_LOCK_KEY = 'search:typeahead:rebuilding'
+
+TYPEAHEAD_REBUILD_SECONDS = 15 * 60
+# Longest a rebuild may hold the lock, should its worker die midway.
+REBUILD_LOCK_TIMEOUT = 60
+
+KINDS = ('title', 'skill', 'department', 'location')
+
+MAX_SUGGESTIONS = 20
+
+
+def phrase_key(text):
+    return ' '.join((text or '').casefold().split())
+
+
+def job_phrases(title, department, location, skills):
+    """``(kind, text)`` suggestions a job contributes."""
+    phrases = [('title', title), ('department', department), ('location', location)]
+    phrases += [('skill', skill) for skill in skills]
+    return [(kind, ' '.join(text.split())) for kind, text in phrases if phrase_key(text)]
+
+
+class TypeaheadIndex:
+    """Immutable snapshot of the suggestions; updates return a new index."""
+
+    def __init__(self, phrases, jobs, version, built_at):
+        self.phrases = phrases  # [(kind, text)]
+        self.jobs = jobs  # {job_id: [phrase ids]}
+        self.version = version
+        self.built_at = built_at
+
+        counts = [0] * len(phrases)
+        for phrase_ids in jobs.values():
+            for phrase_id in phrase_ids:
+                counts[phrase_id] += 1
+        # Rank 0 is the most used suggestion.
+        order = sorted((i for i, count in enumerate(counts) if count),
+                       key=lambda i: (-counts[i], phrase_key(phrases[i][1])))
+        self.ranked = [(phrases[i][0], phrases[i][1], counts[i]) for i in order]
+
+        entries = []
+        for rank, (kind, text, count) in enumerate(self.ranked):
+            words = phrase_key(text).split(' ')
+            for start in range(len(words)):
+                entries.append((' '.join(words[start:]), rank))
+        entries.sort()
+        self.keys = [key for key, rank in entries]
+        self.ranks = [rank for key, rank in entries]
+
+    @classmethod
+    def build(cls):
+        """Build from the active job cards, read from the primary like every long-lived cache."""
+        phrases, phrase_ids, jobs = [], {}, {}
+        with use_primary():
+            rows = JobCard.objects.filter(status='active').order_by().values_list(
+                'job_id', 'title', 'department', 'location', 'skills',
+            )
+            for job_id, title, department, location, skills in rows.iterator():
+                ids = []
+                for kind, text in job_phrases(title, department, location, skills or []):
+                    key = (kind, phrase_key(text))
+                    if key not in phrase_ids:
+                        phrase_ids[key] = len(phrases)
+                        phrases.append((kind, text))
+                    ids.append(phrase_ids[key])
+                jobs[job_id] = sorted(set(ids))
+        return cls(phrases, jobs, version=time.time_ns(), built_at=time.time())
+
+    def with_job(self, job_id, phrases):
+        """A copy with ``job_id``'s suggestions replaced by ``phrases`` (``None`` drops the job)."""
+        jobs = dict(self.jobs)
+        jobs.pop(job_id, None)
+        # Keep only the phrases other jobs still use, renumbered in order.
+        used = sorted({phrase_id for phrase_ids in jobs.values() for phrase_id in phrase_ids})
+        renumbered = {old: new for new, old in enumerate(used)}
+        jobs = {other: [renumbered[i] for i in ids] for other, ids in jobs.items()}
+        all_phrases = [self.phrases[i] for i in used]
+        phrase_ids = {(kind, phrase_key(text)): i for i, (kind, text) in enumerate(all_phrases)}
+        if phrases is not None:
+            ids = []
+            for kind, text in phrases:
+                key = (kind, phrase_key(text))
+                if key not in phrase_ids:
+                    phrase_ids[key] = len(all_phrases)
+                    all_phrases.append((kind, text))
+                ids.append(phrase_ids[key])
+            jobs[job_id] = sorted(set(ids))
+        return type(self)(all_phrases, jobs, version=time.time_ns(), built_at=self.built_at)
+
+    def dumps(self):
+        return zlib.compress(json.dumps({
+            'version': self.version,
+            'built_at': self.built_at,
+            'phrases': self.phrases,
+            'jobs': self.jobs,
+        }, separators=(',', ':')).encode())
+
+    @classmethod
+    def loads(cls, blob):
+        data = json.loads(zlib.decompress(blob))
+        return cls(
+            [tuple(phrase) for phrase in data['phrases']],
+            {int(job_id): ids for job_id, ids in data['jobs'].items()},
+            version=data['version'], built_at=data['built_at'],
+        )
+
+    def suggest(self, prefix, kinds=None, limit=8):
+        """``[{'text', 'kind', 'jobs'}]`` for the most used suggestions with a word starting with ``prefix``."""
+        prefix = phrase_key(prefix)
+        if not prefix:
+            return []
+        lo = bisect_left(self.keys, prefix)
+        hi = bisect_left(self.keys, prefix + '\U0010ffff', lo)
+        ranks = set(self.ranks[lo:hi])
+        if kinds:
+            ranks = {rank for rank in ranks if self.ranked[rank][0] in kinds}
+        return [
+            {'text': text, 'kind': kind, 'jobs': count}
+            for kind, text, count in (self.ranked[rank] for rank in heapq.nsmallest(limit, ranks))
+        ]
+
+
+_index = None
+_index_lock = threading.Lock()
+
+
+def _publish(index):
+    cache.set(SNAPSHOT_KEY, index.dumps(), None)
+    cache.set(VERSION_KEY, index.version, None)
+
+
+def _load_index():
+    """
+    This worker's index, reloaded from the shared snapshot when it is stale.
+
+    A due rebuild runs here if this worker gets the rebuild lock. ``None``
+    while there is no snapshot yet and another worker is building the first.
+    """
+    global _index
+    version = cache.get(VERSION_KEY)
+    index = _index
+    if index is not None and index.version == version and time.time() - index.built_at < TYPEAHEAD_REBUILD_SECONDS:
+        return index
+    with _index_lock:
+        if _index is None or _index.version != version:
+            blob = cache.get(SNAPSHOT_KEY)
+            _index = TypeaheadIndex.loads(blob) if blob is not None else None
+        due = _index is None or time.time() - _index.built_at >= TYPEAHEAD_REBUILD_SECONDS
+        if due and cache.add(REBUILD_LOCK_KEY, 1, REBUILD_LOCK_TIMEOUT):
+            try:
+                _index = TypeaheadIndex.build()
+                _publish(_index)
+            finally:
+                cache.delete(REBUILD_LOCK_KEY)
+        return _index
+
+
+def get_index():
+    return _load_index() or TypeaheadIndex([], {}, version=None, built_at=0)
+
+
+def update_job(job_id, phrases):
+    """Replace one job's suggestions (``None`` when it is no longer active) and share the result."""
+    global _index
+    index = _load_index()
+    if index is None:
+        # The first build is still running and will read this job itself.
+        return
+    with _index_lock:
+        _index = index.with_job(job_id, phrases)
+        _publish(_index)
+
+
+def suggest(prefix, kinds=None, limit=8):
+    return get_index().suggest(prefix, kinds, min(limit, MAX_SUGGESTIONS))
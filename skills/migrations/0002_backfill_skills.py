@@ -0,0 +1,53 @@
+from django.db import migrations
+
+BATCH_SIZE = 500
+
+
+def backfill_skills(apps, schema_editor):
+    from skills.normalize import canonical_name, split_skills
+
+    Skill = apps.get_model('skills', 'Skill')
+    Job = apps.get_model('jobs', 'Job')
+    CandidateProfile = apps.get_model('accounts', 'CandidateProfile')
+    sources = [
+        (Job, 'skills_required', Job.canonical_skills.through, 'job_id'),
+        (CandidateProfile, 'skills', CandidateProfile.canonical_skills.through, 'candidateprofile_id'),
+    ]
+
+    # First pass: create every distinct skill.
+    names = {}
+    for model, field, _, _ in sources:
+        for text in model.objects.exclude(**{field: ''}).values_list(field, flat=True).iterator():
+            for name in split_skills(text):
+                key, display = canonical_name(name)
+                names.setdefault(key, display)
+    Skill.objects.bulk_create(
+        [Skill(key=key, name=display) for key, display in names.items()],
+        batch_size=BATCH_SIZE, ignore_conflicts=True,
+    )
+    skill_ids = dict(Skill.objects.values_list('key', 'id'))
+
+    # Second pass: link rows to skills through the join tables.
+    for model, field, through, owner_field in sources:
+        links = []
+        rows = model.objects.exclude(**{field: ''}).values_list('id', field).iterator()
+        for owner_id, text in rows:
+            ids = {skill_ids[canonical_name(name)[0]] for name in split_skills(text)}
+            links.extend(through(**{owner_field: owner_id, 'skill_id': skill_id}) for skill_id in ids)
+            if len(links) >= BATCH_SIZE:
+                through.objects.bulk_create(links, ignore_conflicts=True)
+                links = []
+        through.objects.bulk_create(links, ignore_conflicts=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('skills', '0001_initial'),
+        ('jobs', '0002_job_canonical_skills'),
+        ('accounts', '0002_candidateprofile_canonical_skills'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_skills, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,34 @@
+from django.db import models
+
+
+class Skill(models.Model):
+    name = models.CharField(max_length=100)
+    key = models.CharField(max_length=100, unique=True, blank=True,
+                           help_text='Normalized lookup key; derived from the name when left blank')
+
+    class Meta:
+        ordering = ['name']
+
+    def __str__(self):
+        return self.name
+
+    def save(self, *args, **kwargs):
+        from .normalize import normalize_key
+        self.key = normalize_key(self.key or self.name)
+        super().save(*args, **kwargs)
+
+
+class SkillAlias(models.Model):
+    alias = models.CharField(max_length=100, unique=True, help_text='Normalized alternative spelling')
+    skill = models.ForeignKey(Skill, on_delete=models.CASCADE, related_name='aliases')
+
+    class Meta:
+        verbose_name_plural = 'skill aliases'
+
+    def __str__(self):
+        return f"{self.alias} → {self.skill.name}"
+
+    def save(self, *args, **kwargs):
+        from .normalize import normalize_key
+        self.alias = normalize_key(self.alias)
+        super().save(*args, **kwargs)
@@ -0,0 +1,106 @@
+import re
+
+from .models import Skill, SkillAlias
+
+# Common alternative spellings, mapped to the canonical display name.
+BUILTIN_ALIASES = {
+    'js': 'JavaScript',
+    'ecmascript': 'JavaScript',
+    'ts': 'TypeScript',
+    'py': 'Python',
+    'python3': 'Python',
+    'golang': 'Go',
+    'reactjs': 'React',
+    'react.js': 'React',
+    'vuejs': 'Vue',
+    'vue.js': 'Vue',
+    'node': 'Node.js',
+    'nodejs': 'Node.js',
+    'postgres': 'PostgreSQL',
+    'psql': 'PostgreSQL',
+    'k8s': 'Kubernetes',
+    'ml': 'Machine Learning',
+    'dl': 'Deep Learning',
+    'drf': 'Django REST Framework',
+    'aws': 'AWS',
+    'gcp': 'Google Cloud',
+}
+
+WHITESPACE_RE = re.compile(r'\s+')
+
+
+def normalize_key(name):
+    """Case- and whitespace-insensitive lookup key for a skill name."""
+    return WHITESPACE_RE.sub(' ', (name or '').strip()).lower()[:100]
+
+
+def split_skills(text):
+    """Split a comma-separated skills string, dropping blanks."""
+    if not text:
+        return []
+    return [s.strip() for s in text.split(',') if s.strip()]
+
+
+def canonical_name(name):
+    """Return ``(key, display_name)`` after applying the built-in aliases."""
+    key = normalize_key(name)
+    if key in BUILTIN_ALIASES:
+        display = BUILTIN_ALIASES[key]
+        return normalize_key(display), display
+    return key, WHITESPACE_RE.sub(' ', name.strip())[:100]
+
+
+def _resolve(names, create):
+    """Return ``{name: Skill}`` for every name that could be resolved."""
+    keys = {name: normalize_key(name) for name in names if normalize_key(name)}
+    if not keys:
+        return {}
+
+    aliased = dict(
+        SkillAlias.objects.filter(alias__in=set(keys.values())).values_list('alias', 'skill_id')
+    )
+    wanted = dict(canonical_name(name) for name, key in keys.items() if key not in aliased)
+
+    by_key = Skill.objects.in_bulk(list(wanted), field_name='key')
+    missing = [Skill(key=key, name=display) for key, display in wanted.items() if key not in by_key]
+    if missing and create:
+        Skill.objects.bulk_create(missing, ignore_conflicts=True)
+        by_key = Skill.objects.in_bulk(list(wanted), field_name='key')
+    by_id = Skill.objects.in_bulk(set(aliased.values())) if aliased else {}
+
+    resolved = {}
+    for name, key in keys.items():
+        skill = by_id.get(aliased[key]) if key in aliased else by_key.get(canonical_name(name)[0])
+        if skill is not None:
+            resolved[name] = skill
+    return resolved
+
+
+def resolve_skills(names, create=True):
+    """
+    Map raw skill names to Skill rows, in input order and without duplicates.
+
+    Aliases stored in the database take precedence over the built-in ones.
+    Unknown names are created when ``create`` is true and skipped otherwise.
+    """
+    skills = {}
+    for skill in _resolve(names, create).values():
+        skills.setdefault(skill.pk, skill)
+    return list(skills.values())
+
+
+def resolve_skill_map(names, create=True):
+    """``{name: Skill}`` for many raw names at once, e.g. every skill in an import batch."""
+    return _resolve(names, create)
+
+
+def resolve_skill_filter(text):
+    """
+    Skill ids for a comma-separated filter string, or ``None`` if any name is
+    unknown (in which case nothing can match).
+    """
+    names = set(split_skills(text))
+    resolved = _resolve(names, create=False)
+    if len(resolved) < len(names):
+        return None
+    return list({skill.pk for skill in resolved.values()})
@@ -0,0 +1,16 @@
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from accounts.models import CandidateProfile
+from jobs.models import Job
+from .normalize import resolve_skills, split_skills
+
+
+@receiver(post_save, sender=Job)
+def sync_job_skills(sender, instance, **kwargs):
+    instance.canonical_skills.set(resolve_skills(split_skills(instance.skills_required)))
+
+
+@receiver(post_save, sender=CandidateProfile)
+def sync_profile_skills(sender, instance, **kwargs):
+    instance.canonical_skills.set(resolve_skills(split_skills(instance.skills)))
@@ -306,3 +306,44 @@ function initSkillsInput(inputId) {
     input.addEventListener('input', renderTags);
     renderTags();
 }
+
+/* ============================================
+   Typeahead Suggestions
+   ============================================ */
+function initTypeahead(inputId, url) {
+    const input = document.getElementById(inputId);
+    if (!input) return;
+
+    const list = document.createElement('datalist');
+    list.id = `${inputId}-suggestions`;
+    input.setAttribute('list', list.id);
+    input.setAttribute('autocomplete', 'off');
+    input.parentElement.appendChild(list);
+
+    let debounceTimer;
+    let pending;
+    input.addEventListener('input', function () {
+        clearTimeout(debounceTimer);
+        debounceTimer = setTimeout(() => {
+            const query = input.value.trim();
+            if (pending) pending.abort();
+            if (!query) {
+                list.innerHTML = '';
+                return;
+            }
+            pending = new AbortController();
+            fetch(`${url}?q=${encodeURIComponent(query)}`, { signal: pending.signal })
+                .then(response => response.json())
+                .then(data => {
+                    list.innerHTML = '';
+                    data.suggestions.forEach(suggestion => {
+                        const option = document.createElement('option');
+                        option.value = suggestion.text;
+                        option.label = `${suggestion.kind} · ${suggestion.jobs} job${suggestion.jobs === 1 ? '' : 's'}`;
+                        list.appendChild(option);
+                    });
+                })
+                .catch(() => {});
+        }, 120);
+    });
+}
@@ -0,0 +1,20 @@
+from django.contrib import admin
+from django.utils import timezone
+
+from .models import Task
+
+
+@admin.register(Task)
+class TaskAdmin(admin.ModelAdmin):
+    list_display = ['name', 'status', 'attempts', 'max_attempts', 'run_after', 'locked_by', 'created_at']
+    list_filter = ['status', 'name']
+    search_fields = ['name', 'idempotency_key']
+    readonly_fields = ['created_at', 'finished_at', 'locked_by', 'locked_at']
+    actions = ['requeue']
+
+    @admin.action(description='Requeue selected tasks')
+    def requeue(self, request, queryset):
+        count = queryset.exclude(status='running').update(
+            status='queued', attempts=0, last_error='', run_after=timezone.now(), finished_at=None,
+        )
+        self.message_user(request, f'{count} task(s) requeued.')
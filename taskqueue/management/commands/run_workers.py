@@ -0,0 +1,79 @@
+import multiprocessing
+import signal
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connections
+
+from taskqueue.worker import DEFAULT_BATCH_SIZE, purge_finished, release_stale_locks, work
+
+# How often the supervising process requeues stale tasks and purges old ones.
+MAINTENANCE_INTERVAL = 60
+
+
+def _worker_main(stop, batch_size, poll_interval, once):
+    # The supervisor handles Ctrl+C and SIGTERM by setting ``stop``; finish the current batch first.
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, signal.SIG_IGN)
+    work(batch_size=batch_size, poll_interval=poll_interval, once=once, should_stop=stop.is_set)
+
+
+class Command(BaseCommand):
+    help = 'Run background task workers in a pool of processes'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--processes', type=int, default=2,
+                            help='Worker processes to run (default: 2)')
+        parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE,
+                            help=f'Tasks each worker claims at a time (default: {DEFAULT_BATCH_SIZE})')
+        parser.add_argument('--poll-interval', type=float, default=1.0,
+                            help='Seconds an idle worker waits before polling again (default: 1)')
+        parser.add_argument('--once', action='store_true',
+                            help='Exit once the queue is empty instead of waiting for new tasks')
+
+    def handle(self, *args, **options):
+        requeued = release_stale_locks()
+        purged = purge_finished()
+        if requeued or purged:
+            self.stdout.write(f'Requeued {requeued} stale task(s), purged {purged} finished task(s).')
+
+        if options['processes'] <= 1:
+            done, failed = work(options['batch_size'], options['poll_interval'], options['once'])
+            self.stdout.write(self.style.SUCCESS(f'Ran {done} task(s), {failed} failed.'))
+            return
+
+        context = multiprocessing.get_context('fork')
+        stop = context.Event()
+
+        def request_stop(signum, frame):
+            stop.set()
+        signal.signal(signal.SIGINT, request_stop)
+        signal.signal(signal.SIGTERM, request_stop)
+
+        # Forked children must open their own database connections, not share ours.
+        connections.close_all()
+
+        def start_worker(number):
+            process = context.Process(
+                target=_worker_main, name=f'taskqueue-worker-{number}',
+                args=(stop, options['batch_size'], options['poll_interval'], options['once']),
+            )
+            process.start()
+            return process
+
+        workers = [start_worker(number) for number in range(options['processes'])]
+        self.stdout.write(f'Started {len(workers)} worker process(es).')
+
+        last_maintenance = time.monotonic()
+        while any(process.is_alive() for process in workers):
+            for number, process in enumerate(workers):
+                process.join(timeout=1)
+                if not process.is_alive() and process.exitcode != 0 and not stop.is_set() and not options['once']:
+                    self.stderr.write(f'{process.name} exited with code {process.exitcode}; restarting it.')
+                    workers[number] = start_worker(number)
+            if not options['once'] and time.monotonic() - last_maintenance >= MAINTENANCE_INTERVAL:
+                release_stale_locks()
+                purge_finished()
+                connections.close_all()
+                last_maintenance = time.monotonic()
+        self.stdout.write(self.style.SUCCESS('Workers stopped.'))
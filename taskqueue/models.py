@@ -0,0 +1,36 @@
+from django.db import models
+from django.utils import timezone
+
+
+class Task(models.Model):
+    """One unit of background work, claimed and run by ``manage.py run_workers``."""
+    STATUS_CHOICES = (
+        ('queued', 'Queued'),
+        ('running', 'Running'),
+        ('done', 'Done'),
+        ('failed', 'Failed'),
+    )
+
+    name = models.CharField(max_length=100)
+    payload = models.JSONField(default=dict, blank=True)
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='queued')
+    idempotency_key = models.CharField(max_length=200, unique=True, null=True, blank=True,
+                                       help_text='Enqueueing a second task with the same key is a no-op')
+    attempts = models.PositiveIntegerField(default=0)
+    max_attempts = models.PositiveIntegerField(default=5)
+    run_after = models.DateTimeField(default=timezone.now)
+    locked_by = models.CharField(max_length=100, blank=True)
+    locked_at = models.DateTimeField(null=True, blank=True)
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ['id']
+        indexes = [
+            models.Index(fields=['status', 'run_after']),
+            models.Index(fields=['status', 'locked_at']),
+        ]
+
+    def __str__(self):
+        return f"{self.name} #{self.pk} ({self.status})"
@@ -0,0 +1,71 @@
+"""
+Declaring and enqueueing background tasks.
+
+A task is a function registered with ``@task``. It receives the JSON payload
+it was enqueued with or, for ``batch=True`` tasks, the list of payloads of
+every such task a worker claimed at once. Tasks are rows in the database, so
+enqueueing inside a transaction only takes effect if that transaction
+commits, and a worker that dies mid-task leaves the row to be retried.
+"""
+from datetime import timedelta
+
+from django.utils import timezone
+
+from .models import Task
+
+DEFAULT_MAX_ATTEMPTS = 5
+
+_registry = {}
+
+
+class TaskDefinition:
+    def __init__(self, func, name, max_attempts, batch):
+        self.func = func
+        self.name = name
+        self.max_attempts = max_attempts
+        self.batch = batch
+
+    def __call__(self, payload):
+        return self.func(payload)
+
+    def enqueue(self, payload=None, key=None, delay=0):
+        enqueue(self.name, payload, key=key, delay=delay)
+
+    def enqueue_many(self, payloads, keys=None, delay=0):
+        enqueue_many(self.name, payloads, keys=keys, delay=delay)
+
+
+def task(name=None, max_attempts=DEFAULT_MAX_ATTEMPTS, batch=False):
+    """Register a function as a background task, named ``<module>.<function>`` by default."""
+    def register(func):
+        definition = TaskDefinition(func, name or f'{func.__module__}.{func.__name__}', max_attempts, batch)
+        _registry[definition.name] = definition
+        return definition
+    return register
+
+
+def get_task(name):
+    return _registry.get(name)
+
+
+def _build(name, payload, key, delay):
+    definition = _registry[name]
+    return Task(
+        name=name, payload=payload or {}, idempotency_key=key,
+        max_attempts=definition.max_attempts,
+        run_after=timezone.now() + timedelta(seconds=delay),
+    )
+
+
+def enqueue(name, payload=None, key=None, delay=0):
+    """Queue one task; a task with the same ``key`` already queued or run makes this a no-op."""
+    Task.objects.bulk_create([_build(name, payload, key, delay)], ignore_conflicts=True)
+
+
+def enqueue_many(name, payloads, keys=None, delay=0):
+    """Queue one task per payload in a single INSERT per batch."""
+    keys = keys or [None] * len(payloads)
+    Task.objects.bulk_create(
+        [_build(name, payload, key, delay) for payload, key in zip(payloads, keys)],
+        batch_size=500, ignore_conflicts=True,
+    )
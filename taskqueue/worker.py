@@ -0,0 +1,147 @@
+"""
+Claiming and running queued tasks.
+
+Workers claim a batch of due tasks with ``SELECT ... FOR UPDATE SKIP LOCKED``
+so any number of them can share the table without handing the same task out
+twice, run them grouped by task name (batch tasks get every claimed payload
+in one call), and either mark them done or schedule a retry with exponential
+backoff. A task whose worker died is handed out again once its lock is stale.
+"""
+import logging
+import os
+import socket
+import time
+import traceback
+from datetime import timedelta
+from itertools import groupby
+
+from django.db import DatabaseError, close_old_connections, connection, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .models import Task
+from .registry import get_task
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 50
+
+# A task still running after this long is assumed to have lost its worker.
+STALE_LOCK_TIMEOUT = timedelta(minutes=15)
+
+# Retry delays grow 30s, 1m, 2m, ... up to an hour.
+RETRY_BASE_DELAY = 30
+RETRY_MAX_DELAY = 60 * 60
+
+# Finished tasks are kept this long so their idempotency keys keep deduplicating.
+FINISHED_RETENTION = timedelta(days=7)
+
+
+def worker_name():
+    return f'{socket.gethostname()}:{os.getpid()}'
+
+
+def retry_delay(attempts):
+    return timedelta(seconds=min(RETRY_BASE_DELAY * 2 ** (attempts - 1), RETRY_MAX_DELAY))
+
+
+def claim(worker, batch_size=DEFAULT_BATCH_SIZE):
+    """Lock up to ``batch_size`` due tasks for ``worker`` and return them."""
+    now = timezone.now()
+    with transaction.atomic():
+        due = Task.objects.filter(status='queued', run_after__lte=now).order_by('run_after', 'id')
+        if connection.features.has_select_for_update_skip_locked:
+            due = due.select_for_update(skip_locked=True)
+        ids = list(due.values_list('pk', flat=True)[:batch_size])
+        if not ids:
+            return []
+        Task.objects.filter(pk__in=ids).update(
+            status='running', locked_by=worker, locked_at=now, attempts=F('attempts') + 1,
+        )
+    return list(Task.objects.filter(pk__in=ids).order_by('name', 'id'))
+
+
+def release_stale_locks():
+    """Requeue tasks whose worker stopped before finishing them. Returns how many."""
+    return Task.objects.filter(status='running', locked_at__lt=timezone.now() - STALE_LOCK_TIMEOUT).update(
+        status='queued', locked_by='', locked_at=None,
+    )
+
+
+def purge_finished():
+    """Delete done tasks past the retention period. Returns how many."""
+    deleted, _ = Task.objects.filter(status='done', finished_at__lt=timezone.now() - FINISHED_RETENTION).delete()
+    return deleted
+
+
+def _mark_done(tasks):
+    Task.objects.filter(pk__in=[t.pk for t in tasks]).update(
+        status='done', finished_at=timezone.now(), locked_by='', locked_at=None, last_error='',
+    )
+
+
+def _mark_failed(tasks, error):
+    now = timezone.now()
+    for t in tasks:
+        t.last_error = error
+        t.locked_by, t.locked_at = '', None
+        if t.attempts >= t.max_attempts:
+            t.status, t.finished_at = 'failed', now
+            logger.error('Task %s gave up after %d attempts: %s', t, t.attempts, error.splitlines()[-1])
+        else:
+            t.status, t.run_after = 'queued', now + retry_delay(t.attempts)
+    Task.objects.bulk_update(tasks, ['status', 'last_error', 'locked_by', 'locked_at', 'run_after', 'finished_at'])
+
+
+def run_tasks(tasks):
+    """Run claimed tasks and record the outcome of each. Returns ``(done, failed)``."""
+    done = failed = 0
+    for name, group in groupby(tasks, key=lambda t: t.name):
+        group = list(group)
+        definition = get_task(name)
+        if definition is None:
+            _mark_failed(group, f'No task registered as "{name}".')
+            failed += len(group)
+            continue
+        # A batch task handles the whole group in one call; it succeeds or retries as a unit.
+        units = [group] if definition.batch else [[t] for t in group]
+        for unit in units:
+            try:
+                definition([t.payload for t in unit] if definition.batch else unit[0].payload)
+            except Exception:
+                _mark_failed(unit, traceback.format_exc()[-4000:])
+                failed += len(unit)
+            else:
+                _mark_done(unit)
+                done += len(unit)
+    return done, failed
+
+
+def work(batch_size=DEFAULT_BATCH_SIZE, poll_interval=1.0, once=False, should_stop=lambda: False):
+    """
+    Claim and run tasks until ``should_stop()``, or until the queue is empty with ``once``.
+
+    Returns ``(done, failed)`` totals.
+    """
+    worker = worker_name()
+    done = failed = 0
+    while not should_stop():
+        close_old_connections()
+        try:
+            tasks = claim(worker, batch_size)
+        except DatabaseError:
+            # Lock contention or a dropped connection: back off and try again.
+            logger.exception('Could not claim tasks')
+            connection.close()
+            time.sleep(poll_interval)
+            continue
+        if not tasks:
+            if once:
+                break
+            time.sleep(poll_interval)
+            continue
+        batch_done, batch_failed = run_tasks(tasks)
+        done += batch_done
+        failed += batch_failed
+    close_old_connections()
+    return done, failed
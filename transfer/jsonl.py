@@ -0,0 +1,377 @@
+"""
+Streaming JSONL snapshots of users, jobs and applications.
+
+One JSON object per line, each with a ``type``: a ``header`` line, then
+``user`` records (candidates carry their profile inline), ``job`` records
+and ``application`` records. Records refer to each other by natural key
+(usernames and job external ids) rather than primary keys, so a file can be
+loaded into a database that already has data, or produced by another ATS.
+
+Export reads in keyset batches and writes as it goes. Import groups
+consecutive records of one type into batches, resolves their natural keys
+with one query per batch, skips records that already exist and inserts the
+rest with ``bulk_create`` in one transaction per batch. Both sides keep only
+a batch in memory, and a failed import can resume after the last committed
+batch. Uploaded files (resumes, avatars) are not part of the format.
+"""
+import json
+from collections import Counter
+from contextlib import contextmanager
+from datetime import date, datetime
+from decimal import Decimal
+
+from django.contrib.auth.hashers import make_password
+from django.core.cache import cache
+from django.db import models, transaction
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+
+from accounts.models import CandidateProfile, User
+from applications.exports import iter_rows
+from applications.models import Application, ApplicationEvent
+from dashboard.counters import rebuild_counters
+from jobs.cards import rebuild_cards
+from jobs.models import Job
+from matching.engine import invalidate_job_matrix
+from search.index import rebuild_index
+from skills.normalize import resolve_skill_map, split_skills
+
+FORMAT_VERSION = 1
+DEFAULT_BATCH_SIZE = 5000
+RECORD_TYPES = ['user', 'job', 'application']
+
+USER_FIELDS = ['username', 'email', 'first_name', 'last_name', 'role', 'phone', 'is_active', 'date_joined']
+PROFILE_FIELDS = [
+    'headline', 'bio', 'skills', 'experience_years', 'education', 'location',
+    'linkedin_url', 'github_url', 'portfolio_url', 'created_at', 'updated_at',
+]
+JOB_FIELDS = [
+    'title', 'description', 'requirements', 'responsibilities', 'skills_required', 'job_type',
+    'experience_level', 'location', 'salary_min', 'salary_max', 'department', 'status', 'deadline',
+    'created_at', 'updated_at',
+]
+APPLICATION_FIELDS = ['cover_letter', 'status', 'hr_notes', 'applied_at', 'updated_at']
+
+
+class ImportFormatError(ValueError):
+    pass
+
+
+def job_external_id(external_id, pk):
+    """
+    The natural key a job is exported under.
+
+    Jobs created in HireFlow have no external id and are exported as
+    ``hireflow-<pk>``; importing them stores that as their external id.
+    """
+    return external_id or f'hireflow-{pk}'
+
+
+# ---------------------------------------------------------------------------
+# Export
+# ---------------------------------------------------------------------------
+
+def _encode(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    raise TypeError(f'{type(value).__name__} is not JSON serializable')
+
+
+def _user_records(with_passwords, batch_size):
+    profile_columns = [f'candidate_profile__{field}' for field in PROFILE_FIELDS]
+    fields = [*USER_FIELDS, 'password', 'candidate_profile__id', *profile_columns]
+    for row in iter_rows(User.objects.all(), fields, batch_size):
+        record = {'type': 'user', **dict(zip(USER_FIELDS, row))}
+        if with_passwords:
+            record['password'] = row[len(USER_FIELDS)]
+        if row[len(USER_FIELDS) + 1] is not None:
+            record['profile'] = dict(zip(PROFILE_FIELDS, row[len(USER_FIELDS) + 2:]))
+        yield record
+
+
+def _job_records(batch_size):
+    fields = ['pk', 'external_id', 'posted_by__username', *JOB_FIELDS]
+    for pk, external_id, posted_by, *values in iter_rows(Job.objects.all(), fields, batch_size):
+        yield {
+            'type': 'job', 'external_id': job_external_id(external_id, pk), 'posted_by': posted_by,
+            **dict(zip(JOB_FIELDS, values)),
+        }
+
+
+def _application_records(batch_size):
+    fields = ['job_id', 'job__external_id', 'candidate__username', *APPLICATION_FIELDS]
+    for job_id, external_id, username, *values in iter_rows(Application.objects.all(), fields, batch_size):
+        yield {
+            'type': 'application', 'job': job_external_id(external_id, job_id), 'candidate': username,
+            **dict(zip(APPLICATION_FIELDS, values)),
+        }
+
+
+def export_records(types=RECORD_TYPES, with_passwords=False, batch_size=DEFAULT_BATCH_SIZE):
+    """Yield every record of ``types``, header first, in the order an import needs them."""
+    yield {'type': 'header', 'version': FORMAT_VERSION, 'created_at': timezone.now()}
+    if 'user' in types:
+        yield from _user_records(with_passwords, batch_size)
+    if 'job' in types:
+        yield from _job_records(batch_size)
+    if 'application' in types:
+        yield from _application_records(batch_size)
+
+
+def write_jsonl(records, stream):
+    """Write records one per line. Returns a ``Counter`` of record types written."""
+    written = Counter()
+    for record in records:
+        stream.write(json.dumps(record, default=_encode, ensure_ascii=False, separators=(',', ':')))
+        stream.write('\n')
+        written[record['type']] += 1
+    return written
+
+
+# ---------------------------------------------------------------------------
+# Import
+# ---------------------------------------------------------------------------
+
+@contextmanager
+def keep_imported_timestamps():
+    """
+    Let bulk inserts store imported ``auto_now``/``auto_now_add`` values.
+
+    Those fields otherwise overwrite whatever they are given with the current
+    time. This changes the fields process-wide, so it is only for commands.
+    """
+    fields = [
+        field for model in (CandidateProfile, Job, Application)
+        for field in model._meta.concrete_fields
+        if getattr(field, 'auto_now', False) or getattr(field, 'auto_now_add', False)
+    ]
+    saved = [(field, field.auto_now, field.auto_now_add) for field in fields]
+    for field in fields:
+        field.auto_now = field.auto_now_add = False
+    try:
+        yield
+    finally:
+        for field, auto_now, auto_now_add in saved:
+            field.auto_now, field.auto_now_add = auto_now, auto_now_add
+
+
+def _decode(field, value):
+    if value is None:
+        return None
+    if isinstance(field, models.DateTimeField):
+        parsed = parse_datetime(value)
+        return timezone.make_aware(parsed) if parsed and timezone.is_naive(parsed) else parsed
+    if isinstance(field, models.DateField):
+        return parse_date(value)
+    if isinstance(field, models.DecimalField):
+        return Decimal(value)
+    return value
+
+
+def _build(model, data, fields, now):
+    """Keyword arguments for ``model`` from a record, leaving out absent or null values."""
+    kwargs = {}
+    for name in fields:
+        field = model._meta.get_field(name)
+        value = _decode(field, data.get(name))
+        if value is None and not field.null:
+            # Timestamps that would normally stamp themselves (see keep_imported_timestamps).
+            if isinstance(field, models.DateTimeField) and not field.has_default():
+                value = now
+            else:
+                continue
+        kwargs[name] = value
+    return kwargs
+
+
+def _unique_new(records, key, existing):
+    """Records whose ``key`` is not in ``existing``, first occurrence only."""
+    seen = set(existing)
+    fresh = []
+    for record in records:
+        value = key(record)
+        if value not in seen:
+            seen.add(value)
+            fresh.append(record)
+    return fresh
+
+
+def _link_skills(through, owner_field, owners):
+    """Bulk-link ``{owner pk: skills text}`` to canonical skills."""
+    names = {name for text in owners.values() for name in split_skills(text)}
+    skills = resolve_skill_map(names)
+    rows = [
+        through(**{owner_field: pk, 'skill_id': skills[name].pk})
+        for pk, text in owners.items() for name in dict.fromkeys(split_skills(text)) if name in skills
+    ]
+    through.objects.bulk_create(rows, ignore_conflicts=True)
+
+
+class Importer:
+    """Loads batches of JSONL records; see ``run``."""
+
+    def __init__(self, batch_size=DEFAULT_BATCH_SIZE, log=print):
+        self.batch_size = batch_size
+        self.log = log
+        self.stats = Counter()
+        self.now = timezone.now()
+
+    def run(self, lines, start_line=0, checkpoint=None):
+        """
+        Import ``lines`` (an iterable of JSONL text), skipping the first ``start_line``.
+
+        ``checkpoint(line_number)`` is called after each committed batch with
+        the number of the last line it covered. Returns ``self.stats``.
+        """
+        kind, batch, batch_end = None, [], start_line
+        with keep_imported_timestamps():
+            for number, line in enumerate(lines, start=1):
+                if number <= start_line or not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                    record_type = record.pop('type')
+                except (ValueError, KeyError, AttributeError) as exc:
+                    raise ImportFormatError(f'Line {number}: not a JSONL record ({exc}).')
+                if record_type == 'header':
+                    if record.get('version') != FORMAT_VERSION:
+                        raise ImportFormatError(f'Line {number}: unsupported format version {record.get("version")}.')
+                    continue
+                if record_type not in RECORD_TYPES:
+                    raise ImportFormatError(f'Line {number}: unknown record type "{record_type}".')
+                if batch and (record_type != kind or len(batch) >= self.batch_size):
+                    self._flush(kind, batch, batch_end, checkpoint)
+                    batch = []
+                kind = record_type
+                batch.append((number, record))
+                batch_end = number
+            if batch:
+                self._flush(kind, batch, batch_end, checkpoint)
+        return self.stats
+
+    def _flush(self, kind, batch, batch_end, checkpoint):
+        records = [record for _, record in batch]
+        try:
+            with transaction.atomic():
+                created = getattr(self, f'_import_{kind}s')(records)
+        except (KeyError, TypeError, ValueError) as exc:
+            raise ImportFormatError(f'Lines {batch[0][0]}-{batch_end}: {type(exc).__name__}: {exc}')
+        self.stats[f'{kind}s created'] += created
+        self.stats[f'{kind}s skipped'] += len(records) - created
+        self.log(f'Line {batch_end}: {created} of {len(records)} {kind} records created.')
+        if checkpoint:
+            checkpoint(batch_end)
+
+    def _import_users(self, records):
+        usernames = [record['username'] for record in records]
+        existing = User.objects.filter(username__in=usernames).values_list('username', flat=True)
+        records = _unique_new(records, lambda record: record['username'], existing)
+        User.objects.bulk_create([
+            User(password=record.get('password') or make_password(None),
+                 **_build(User, record, USER_FIELDS, self.now))
+            for record in records
+        ])
+
+        with_profiles = [record for record in records if record.get('profile') is not None]
+        if with_profiles:
+            user_ids = dict(User.objects.filter(
+                username__in=[record['username'] for record in with_profiles],
+            ).values_list('username', 'pk'))
+            CandidateProfile.objects.bulk_create([
+                CandidateProfile(user_id=user_ids[record['username']],
+                                 **_build(CandidateProfile, record['profile'], PROFILE_FIELDS, self.now))
+                for record in with_profiles
+            ])
+            profile_ids = dict(CandidateProfile.objects.filter(
+                user_id__in=user_ids.values(),
+            ).values_list('user_id', 'pk'))
+            _link_skills(CandidateProfile.canonical_skills.through, 'candidateprofile_id', {
+                profile_ids[user_ids[record['username']]]: record['profile'].get('skills') or ''
+                for record in with_profiles
+            })
+        return len(records)
+
+    def _import_jobs(self, records):
+        external_ids = [record['external_id'] for record in records]
+        existing = Job.objects.filter(external_id__in=external_ids).values_list('external_id', flat=True)
+        records = _unique_new(records, lambda record: record['external_id'], existing)
+        posters = dict(User.objects.filter(
+            username__in={record['posted_by'] for record in records},
+        ).values_list('username', 'pk'))
+        missing = {record['posted_by'] for record in records} - set(posters)
+        if missing:
+            raise ValueError(f'unknown posted_by users: {", ".join(sorted(missing)[:5])}')
+
+        Job.objects.bulk_create([
+            Job(external_id=record['external_id'], posted_by_id=posters[record['posted_by']],
+                **_build(Job, record, JOB_FIELDS, self.now))
+            for record in records
+        ])
+        job_ids = dict(Job.objects.filter(
+            external_id__in=[record['external_id'] for record in records],
+        ).values_list('external_id', 'pk'))
+        _link_skills(Job.canonical_skills.through, 'job_id', {
+            job_ids[record['external_id']]: record.get('skills_required') or '' for record in records
+        })
+        return len(records)
+
+    def _import_applications(self, records):
+        job_ids = dict(Job.objects.filter(
+            external_id__in={record['job'] for record in records},
+        ).values_list('external_id', 'pk'))
+        candidate_ids = dict(User.objects.filter(
+            username__in={record['candidate'] for record in records},
+        ).values_list('username', 'pk'))
+        unknown = [record for record in records if record['job'] not in job_ids or record['candidate'] not in candidate_ids]
+        if unknown:
+            raise ValueError(
+                f'{len(unknown)} applications refer to unknown jobs or candidates, '
+                f'e.g. job {unknown[0]["job"]!r}, candidate {unknown[0]["candidate"]!r}'
+            )
+
+        def pair(record):
+            return job_ids[record['job']], candidate_ids[record['candidate']]
+
+        pairs = [pair(record) for record in records]
+        existing = Application.objects.filter(
+            job_id__in={job for job, _ in pairs}, candidate_id__in={candidate for _, candidate in pairs},
+        ).values_list('job_id', 'candidate_id')
+        records = _unique_new(records, pair, existing)
+
+        applications = [
+            Application(job_id=job_id, candidate_id=candidate_id,
+                        **_build(Application, record, APPLICATION_FIELDS, self.now))
+            for record, (job_id, candidate_id) in ((record, pair(record)) for record in records)
+        ]
+        Application.objects.bulk_create(applications)
+        application_ids = {
+            (job_id, candidate_id): pk for job_id, candidate_id, pk in Application.objects.filter(
+                job_id__in={a.job_id for a in applications}, candidate_id__in={a.candidate_id for a in applications},
+            ).values_list('job_id', 'candidate_id', 'pk')
+        }
+        # The history before the import is unknown: log the application and a jump to its current status.
+        events = []
+        for application in applications:
+            pk = application_ids[application.job_id, application.candidate_id]
+            events.append(ApplicationEvent(
+                application_id=pk, job_id=application.job_id, to_status='applied',
+                created_at=application.applied_at,
+            ))
+            if application.status != 'applied':
+                events.append(ApplicationEvent(
+                    application_id=pk, job_id=application.job_id, from_status='applied',
+                    to_status=application.status, created_at=max(application.updated_at, application.applied_at),
+                ))
+        ApplicationEvent.objects.bulk_create(events, batch_size=self.batch_size)
+        return len(applications)
+
+
+def rebuild_read_models():
+    """Rebuild what bulk inserts bypass: job cards, the search index and dashboard counters."""
+    rebuild_cards()
+    rebuild_index()
+    rebuild_counters()
+    invalidate_job_matrix()
+    cache.clear()
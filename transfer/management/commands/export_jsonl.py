@@ -0,0 +1,29 @@
+import sys
+
+from django.core.management.base import BaseCommand
+
+from transfer.jsonl import DEFAULT_BATCH_SIZE, RECORD_TYPES, export_records, write_jsonl
+
+
+class Command(BaseCommand):
+    help = 'Stream users, jobs and applications to a JSONL file keyed by natural keys'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--output', default='-', help='File to write (default: stdout)')
+        parser.add_argument('--types', nargs='+', choices=RECORD_TYPES, default=RECORD_TYPES,
+                            help='Record types to export (default: all)')
+        parser.add_argument('--with-passwords', action='store_true',
+                            help='Include password hashes, so exported users can log in after an import')
+        parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE,
+                            help=f'Rows read per query (default: {DEFAULT_BATCH_SIZE})')
+
+    def handle(self, *args, **options):
+        records = export_records(options['types'], options['with_passwords'], options['batch_size'])
+        if options['output'] == '-':
+            written = write_jsonl(records, sys.stdout)
+        else:
+            with open(options['output'], 'w', encoding='utf-8') as stream:
+                written = write_jsonl(records, stream)
+        written.pop('header', None)
+        summary = ', '.join(f'{count} {kind} records' for kind, count in written.items()) or 'nothing'
+        self.stderr.write(self.style.SUCCESS(f'Exported {summary}.'))
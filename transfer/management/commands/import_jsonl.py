@@ -0,0 +1,54 @@
+import json
+import os
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+
+from transfer.jsonl import DEFAULT_BATCH_SIZE, Importer, ImportFormatError, rebuild_read_models
+
+
+class Command(BaseCommand):
+    help = 'Import users, jobs and applications from a JSONL file, resuming from a checkpoint after a failure'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='JSONL file to import, or - for stdin (not resumable)')
+        parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE,
+                            help=f'Records per INSERT batch and transaction (default: {DEFAULT_BATCH_SIZE})')
+        parser.add_argument('--checkpoint', help='Checkpoint file (default: <path>.checkpoint)')
+        parser.add_argument('--restart', action='store_true',
+                            help='Ignore an existing checkpoint and start from the first line')
+
+    def handle(self, *args, **options):
+        path = options['path']
+        checkpoint_path = None if path == '-' else options['checkpoint'] or f'{path}.checkpoint'
+        start_line = 0
+        if checkpoint_path and os.path.exists(checkpoint_path) and not options['restart']:
+            with open(checkpoint_path) as handle:
+                start_line = json.load(handle)['line']
+            self.stdout.write(f'Resuming after line {start_line} (from {checkpoint_path}).')
+
+        def save_checkpoint(line):
+            # Written after each committed batch; replaced atomically so a crash never leaves it half-written.
+            with open(f'{checkpoint_path}.tmp', 'w') as handle:
+                json.dump({'path': os.path.abspath(path), 'line': line}, handle)
+            os.replace(f'{checkpoint_path}.tmp', checkpoint_path)
+
+        importer = Importer(batch_size=options['batch_size'], log=self.stdout.write)
+        try:
+            if path == '-':
+                stats = importer.run(sys.stdin)
+            else:
+                with open(path, encoding='utf-8') as lines:
+                    stats = importer.run(lines, start_line, save_checkpoint)
+        except (OSError, ImportFormatError) as exc:
+            hint = f'\nFix the input and run again to resume from {checkpoint_path}.' if checkpoint_path else ''
+            raise CommandError(f'{exc}{hint}')
+
+        # A resumed run also rebuilds for what the failed run committed.
+        if start_line or any(key.endswith('created') and count for key, count in stats.items()):
+            self.stdout.write('Rebuilding job cards, search index and dashboard counters...')
+            rebuild_read_models()
+        if checkpoint_path and os.path.exists(checkpoint_path):
+            os.remove(checkpoint_path)
+        summary = ', '.join(f'{count} {key}' for key, count in sorted(stats.items())) or 'no records'
+        self.stdout.write(self.style.SUCCESS(f'Import finished: {summary}.'))